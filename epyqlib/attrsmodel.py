@@ -1126,6 +1126,7 @@ class Model:
         self.add_drop_sources(*drop_sources)
 
         check_uuids(self.root)
+        self.root.build_index()
 
         self.pyqtify_connect(None, self.root)
         self.model.itemChanged.connect(self.item_changed)
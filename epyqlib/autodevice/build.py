@@ -138,7 +138,7 @@ class Builder:
 
     def get_or_create_parameter(self, name):
         try:
-            nodes = self._value_set.model.root.nodes_by_attribute(
+            nodes = self._value_set.root.nodes_by_attribute(
                 attribute_value=name,
                 attribute_name="name",
             )
@@ -146,7 +146,7 @@ class Builder:
             node = epyqlib.pm.valuesetmodel.Parameter(
                 name=name,
             )
-            self._value_set.model.root.append_child(node)
+            self._value_set.root.append_child(node)
         else:
             try:
                 (node,) = nodes
@@ -126,7 +126,7 @@ class DeviceExtension:
             value_set = epyqlib.pm.valuesetmodel.loadp(parameter_path)
             self.nvs.from_value_set(value_set)
             self.parameter_names = [
-                node.name.split(":") for node in value_set.model.root.leaves()
+                node.name.split(":") for node in value_set.root.leaves()
             ]
 
     @twisted.internet.defer.inlineCallbacks
@@ -2,9 +2,13 @@
 
 # TODO: get some docstrings in here!
 
+import collections
 import contextlib
+import functools
 import logging
+import queue
 import sys
+import threading
 import time
 import typing
 
@@ -56,14 +60,199 @@ class BusSettings:
         return real_bus
 
 
+# Sending back to back frames has been seen to force socketcan off bus.  The
+# issue can be recreated with the following snippet.
+#
+# import can
+# import time
+# bus = can.interface.Bus(bustype='socketcan', channel='can0')
+# msg = can.message.Message(arbitration_id=0x00FFAB80, bytearray([0, 0, 0, 0, 0, 0, 0, 0]))
+# for i in range(50):
+#   bus.send(msg)
+#   time.sleep(.0003)
+#
+# which results in stuff like
+#
+# altendky@tp:/epc/bin$ can0; candump -L -x can0,#FFFFFFFF | grep -E '(0[04]FFAB(88|90|80)|can0 2)'
+# (1469135699.755374) can0 00FFAB80#0000000000000000
+# (1469135699.755462) can0 00FFAB80#0000000000000000
+# (1469135699.756589) can0 20000004#000C000000000000
+# (1469135699.756589) can0 20000004#0030000000000000
+# (1469135699.756731) can0 00FFAB80#0000000000000000
+# (1469135699.757187) can0 00FFAB80#0000000000000000
+# (1469135699.757308) can0 20000040#0000000000000000
+# (1469135699.757460) can0 00FFAB80#0000000000000000
+#
+# A 0.5 ms sleep after each send used to avoid this so the defaults keep
+# the same spacing.
+default_transmit_rate = 2000
+default_transmit_burst = 1
+default_transmit_queue_size = 10000
+
+
+@attr.s
+class TokenBucket:
+    """Pace events to `rate` per second while allowing up to `burst` of them
+    back to back.  A `rate` of `None` disables pacing.
+    """
+
+    rate = attr.ib(default=default_transmit_rate)
+    burst = attr.ib(default=default_transmit_burst)
+    clock = attr.ib(default=time.monotonic)
+    _tokens = attr.ib(default=None, init=False)
+    _last = attr.ib(default=None, init=False)
+
+    def take(self):
+        """Consume a token and return the seconds to wait before the event
+        it permits.
+        """
+
+        if self.rate is None:
+            return 0
+
+        now = self.clock()
+
+        if self._last is None:
+            self._tokens = self.burst
+        else:
+            self._tokens = min(
+                self.burst,
+                self._tokens + (now - self._last) * self.rate,
+            )
+
+        self._last = now
+        self._tokens -= 1
+
+        if self._tokens >= 0:
+            return 0
+
+        return -self._tokens / self.rate
+
+
+class TransmitQueue:
+    """Send messages to a python-can bus from a worker thread.
+
+    Results are reported via `sent` and `failed`.  They are emitted from the
+    worker thread and received on the thread that created the queue.  After
+    a failure the remaining messages are dropped and the worker exits.
+    """
+
+    sent = epyqlib.utils.qt.Signal(object, object)
+    failed = epyqlib.utils.qt.Signal(object, object)
+
+    _stop = object()
+
+    def __init__(
+        self,
+        bus,
+        pacer=None,
+        maxsize=default_transmit_queue_size,
+        sleep=time.sleep,
+    ):
+        if pacer is None:
+            pacer = TokenBucket()
+
+        self.bus = bus
+        self.pacer = pacer
+        self.queue = queue.Queue(maxsize=maxsize)
+        self.sleep = sleep
+        self.thread = None
+        self.stopped = False
+        self._lock = threading.Lock()
+
+        # create the signal hosts in this thread so that emissions from the
+        # worker thread are queued back to here
+        self.sent
+        self.failed
+
+    def start(self):
+        self.stopped = False
+        self.thread = threading.Thread(
+            target=self._run,
+            name="{} transmitter".format(type(self).__name__),
+            daemon=True,
+        )
+        self.thread.start()
+
+    def stop(self, timeout=None):
+        """Drop any queued messages and wait for the worker to exit."""
+
+        if self.thread is None:
+            return
+
+        while True:
+            try:
+                self.queue.get_nowait()
+            except queue.Empty:
+                break
+
+        self.queue.put(self._stop)
+        self.thread.join(timeout=timeout)
+        self.thread = None
+
+    def put(self, message, on_success=None):
+        """Queue `message` for sending and return whether it was queued.
+        Nothing is queued once the worker has stopped after a failure.
+        """
+
+        with self._lock:
+            if self.thread is None or self.stopped:
+                return False
+
+            try:
+                self.queue.put_nowait((message, on_success))
+            except queue.Full:
+                return False
+
+        return True
+
+    def _run(self):
+        while True:
+            item = self.queue.get()
+
+            if item is self._stop:
+                return
+
+            message, on_success = item
+
+            delay = self.pacer.take()
+            if delay > 0:
+                self.sleep(delay)
+
+            try:
+                # TODO: I would use message=message (or msg=msg) but:
+                #       https://bitbucket.org/hardbyte/python-can/issues/52/inconsistent-send-signatures
+                self.bus.send(message)
+            except can.CanError as e:
+                with self._lock:
+                    self.stopped = True
+
+                self.failed.emit(message, e)
+                return
+
+            self.sent.emit(message, on_success)
+
+
 class BusProxy:
     went_offline = epyqlib.utils.qt.Signal()
 
     def __init__(
-        self, bus=None, timeout=0.1, transmit=True, filters=None, auto_disconnect=True
+        self,
+        bus=None,
+        timeout=0.1,
+        transmit=True,
+        filters=None,
+        auto_disconnect=True,
+        transmit_rate=default_transmit_rate,
+        transmit_burst=default_transmit_burst,
+        transmit_queue_size=default_transmit_queue_size,
     ):
         self.filters = filters
         self.auto_disconnect = auto_disconnect
+        self.transmit_rate = transmit_rate
+        self.transmit_burst = transmit_burst
+        self.transmit_queue_size = transmit_queue_size
+        self.transmit_queue = None
 
         self.timeout = timeout
         self.notifier = NotifierProxy(self)
@@ -108,69 +297,16 @@ class BusProxy:
 
     def _send(self, msg, on_success=None, passive=False):
         if self.bus is not None and (self._transmit or passive):
-            # TODO: this (the silly sleep) is really hacky and shouldn't be needed but it seems
-            #       to be to keep from forcing socketcan offbus.  the issue
-            #       can be recreated with the following snippet.
-            # import can
-            # import time
-            # bus = can.interface.Bus(bustype='socketcan', channel='can0')
-            # msg = can.message.Message(arbitration_id=0x00FFAB80, bytearray([0, 0, 0, 0, 0, 0, 0, 0]))
-            # for i in range(50):
-            #   bus.send(msg)
-            #   time.sleep(.0003)
-            #
-            #       which results in stuff like
-            #
-            # altendky@tp:/epc/bin$ can0; candump -L -x can0,#FFFFFFFF | grep -E '(0[04]FFAB(88|90|80)|can0 2)'
-            # (1469135699.755374) can0 00FFAB80#0000000000000000
-            # (1469135699.755462) can0 00FFAB80#0000000000000000
-            # (1469135699.755535) can0 00FFAB80#0000000000000000
-            # (1469135699.755798) can0 00FFAB80#0000000000000000
-            # (1469135699.755958) can0 00FFAB80#0000000000000000
-            # (1469135699.756132) can0 00FFAB80#0000000000000000
-            # (1469135699.756446) can0 00FFAB80#0000000000000000
-            # (1469135699.756589) can0 20000004#000C000000000000
-            # (1469135699.756589) can0 20000004#0030000000000000
-            # (1469135699.756731) can0 00FFAB80#0000000000000000
-            # (1469135699.757004) can0 00FFAB80#0000000000000000
-            # (1469135699.757187) can0 00FFAB80#0000000000000000
-            # (1469135699.757308) can0 20000040#0000000000000000
-            # (1469135699.757460) can0 00FFAB80#0000000000000000
-            # (1469135699.757634) can0 00FFAB80#0000000000000000
-            # (1469135699.757811) can0 00FFAB80#0000000000000000
-            # (1469135699.757980) can0 00FFAB80#0000000000000000
-            # (1469135699.758173) can0 00FFAB80#0000000000000000
-            # (1469135699.758319) can0 00FFAB80#0000000000000000
-            # (1469135699.758392) can0 00FFAB80#0000000000000000
-            # (1469135699.758656) can0 00FFAB80#0000000000000000
-            # (1469135699.758726) can0 00FFAB80#0000000000000000
-            # (1469135699.758894) can0 00FFAB80#0000000000000000
-
             if isinstance(self.bus, can.BusABC):
                 # TODO: this is a hack to allow detection of transmitted
                 #       messages later
                 msg.timestamp = None
 
-                try:
-                    # TODO: I would use message=message (or msg=msg) but:
-                    #       https://bitbucket.org/hardbyte/python-can/issues/52/inconsistent-send-signatures
-                    self.bus.send(msg)
-                except can.CanError:
-                    # TODO: specifically implemented for a transmit queue
-                    #       full situation to avoid infinite dialogs
-                    self.set_bus()
-
-                # TODO: get a real value for sent, but for now python-can
-                #       doesn't provide that info.  also, it would be async...
-                sent = True
-
-                time.sleep(0.0005)
-
-                if sent:
-                    self.tx_notifier.message_received(message=msg)
-
-                    if on_success is not None:
-                        on_success()
+                # The transmit queue reports completion through
+                # _transmit_succeeded() and _transmit_failed() on this
+                # thread.  Here we only learn whether the message could be
+                # queued.
+                sent = self.transmit_queue.put(message=msg, on_success=on_success)
             else:
                 # TODO: I would use message=message (or msg=msg) but:
                 #       https://bitbucket.org/hardbyte/python-can/issues/52/inconsistent-send-signatures
@@ -179,12 +315,29 @@ class BusProxy:
             if self.auto_disconnect:
                 self.verify_bus_ok()
 
-            # TODO: since send() doesn't always report failures this won't either
-            #       fix that
             return sent
 
         return False
 
+    def _transmit_succeeded(self, message, on_success):
+        self.tx_notifier.message_received(message=message)
+
+        if on_success is not None:
+            on_success()
+
+    def _transmit_failed(self, message, exception, transmit_queue):
+        if transmit_queue is not self.transmit_queue:
+            # the bus has already been changed
+            return
+
+        logging.debug(
+            "Failed to send 0x{:08X}: {}".format(message.arbitration_id, exception)
+        )
+
+        # TODO: specifically implemented for a transmit queue
+        #       full situation to avoid infinite dialogs
+        self.set_bus()
+
     def verify_bus_ok(self):
         if self.bus is None:
             # No bus, nothing to go wrong with it... ?
@@ -225,6 +378,8 @@ class BusProxy:
 
         if was_online:
             if isinstance(self.bus, can.BusABC):
+                self.transmit_queue.stop()
+                self.transmit_queue = None
                 self.real_notifier.stop()
                 time.sleep(1.1 * self.timeout)
             else:
@@ -246,6 +401,22 @@ class BusProxy:
                 self.real_notifier = can.Notifier(
                     bus=self.bus, listeners=[self.notifier], timeout=self.timeout
                 )
+                self.transmit_queue = TransmitQueue(
+                    bus=self.bus,
+                    pacer=TokenBucket(
+                        rate=self.transmit_rate,
+                        burst=self.transmit_burst,
+                    ),
+                    maxsize=self.transmit_queue_size,
+                )
+                self.transmit_queue.sent.connect(self._transmit_succeeded)
+                self.transmit_queue.failed.connect(
+                    functools.partial(
+                        self._transmit_failed,
+                        transmit_queue=self.transmit_queue,
+                    )
+                )
+                self.transmit_queue.start()
             else:
                 self.bus.notifier.add(self.notifier)
                 self.bus.tx_notifier.add(self.tx_notifier)
@@ -308,25 +479,63 @@ class NotifierProxy(QtCanListener):
 
         # TODO: consider a WeakSet, though this may presently
         #       be keeping objects alive
-        self.listeners = set(listeners)
+        self.listeners = set()
+        self.unfiltered_listeners = set()
+        self.listeners_by_arbitration_id = collections.defaultdict(set)
+        self.arbitration_ids_by_listener = {}
         if filtered_ids is None:
             self.filtered_ids = None
         else:
             self.filtered_ids = set(filtered_ids)
 
+        for listener in listeners:
+            self.add(listener)
+
     def message_received(self, message):
         if self.filtered_ids is None or message.arbitration_id in self.filtered_ids:
-            for listener in tuple(self.listeners):
+            listeners = self.listeners_by_arbitration_id.get(
+                (message.arbitration_id, bool(message.is_extended_id)),
+                (),
+            )
+
+            for listener in (*self.unfiltered_listeners, *listeners):
                 listener.message_received_signal.emit(message)
 
     def add(self, listener):
+        if listener in self.listeners:
+            return
+
+        arbitration_ids = listener.arbitration_ids()
+        if arbitration_ids is not None:
+            arbitration_ids = tuple(
+                (id, bool(extended)) for id, extended in arbitration_ids
+            )
+
         self.listeners.add(listener)
+        self.arbitration_ids_by_listener[listener] = arbitration_ids
+
+        if arbitration_ids is None:
+            self.unfiltered_listeners.add(listener)
+        else:
+            for arbitration_id in arbitration_ids:
+                self.listeners_by_arbitration_id[arbitration_id].add(listener)
 
     def discard(self, listener):
-        self.listeners.discard(listener)
+        if listener in self.listeners:
+            self.remove(listener)
 
     def remove(self, listener):
         self.listeners.remove(listener)
+        arbitration_ids = self.arbitration_ids_by_listener.pop(listener)
+
+        if arbitration_ids is None:
+            self.unfiltered_listeners.remove(listener)
+        else:
+            for arbitration_id in arbitration_ids:
+                listeners = self.listeners_by_arbitration_id[arbitration_id]
+                listeners.remove(listener)
+                if len(listeners) == 0:
+                    del self.listeners_by_arbitration_id[arbitration_id]
 
 
 if __name__ == "__main__":
@@ -1,5 +1,6 @@
 import can
 from canmatrix import canmatrix
+import collections
 import copy
 import decimal
 import epyqlib.utils.general
@@ -8,6 +9,7 @@ import itertools
 import locale
 import logging
 import math
+import numpy
 from PyQt5.QtCore import QObject, QTimer, Qt
 import re
 import struct
@@ -194,6 +196,216 @@ def signals_to_bytes(length, signals, data):
     )
 
 
+# TODO: CAMPid 097897541967932453154321546542175421549
+float_structs = {32: struct.Struct(">f"), 64: struct.Struct(">d")}
+
+
+@attr.s(frozen=True)
+class BitField:
+    """Shift and mask location of a single signal within a frame payload
+    interpreted as one integer.  Little endian signals are located in the
+    payload read as a little endian integer and big endian signals in the
+    payload read as a big endian integer.
+    """
+
+    signal = attr.ib()
+    little_endian = attr.ib()
+    shift = attr.ib()
+    mask = attr.ib()
+    positioned_mask = attr.ib()
+    sign_bit = attr.ib()
+    float_struct = attr.ib()
+    minimum = attr.ib()
+    maximum = attr.ib()
+
+    @classmethod
+    def from_signal(cls, signal, length):
+        size = signal.signal_size
+
+        if signal.little_endian:
+            shift = signal.start_bit
+        else:
+            shift = (length * 8) - signal.start_bit - size
+
+        if shift < 0 or shift + size > length * 8:
+            raise Exception(
+                "{} does not fit in a {} byte frame".format(signal, length),
+            )
+
+        float_struct = None
+        minimum = None
+        maximum = None
+        sign_bit = None
+
+        if signal.float:
+            float_struct = float_structs.get(size)
+
+            if float_struct is None:
+                raise Exception(
+                    "float type only supports lengths in [{}]".format(
+                        ", ".join([str(t) for t in float_structs.keys()])
+                    )
+                )
+        else:
+            # Match the range accepted by int.to_bytes() in pack_bitstring()
+            # so the same values raise OverflowError.
+            byte_bits = math.ceil(size / 8) * 8
+            if signal.signed:
+                sign_bit = 1 << (size - 1)
+                minimum = -(1 << (byte_bits - 1))
+                maximum = (1 << (byte_bits - 1)) - 1
+            else:
+                minimum = 0
+                maximum = (1 << byte_bits) - 1
+
+        return cls(
+            signal=signal,
+            little_endian=signal.little_endian,
+            shift=shift,
+            mask=(1 << size) - 1,
+            positioned_mask=((1 << size) - 1) << shift,
+            sign_bit=sign_bit,
+            float_struct=float_struct,
+            minimum=minimum,
+            maximum=maximum,
+        )
+
+    def raw_from_value(self, value):
+        if self.float_struct is not None:
+            return int.from_bytes(self.float_struct.pack(value), byteorder="big")
+
+        if not self.minimum <= value <= self.maximum:
+            raise OverflowError(
+                "{} not in range [{}, {}]".format(value, self.minimum, self.maximum)
+            )
+
+        return value & self.mask
+
+    def value_from_raw(self, raw):
+        if self.float_struct is not None:
+            (value,) = self.float_struct.unpack(
+                raw.to_bytes(self.float_struct.size, byteorder="big"),
+            )
+            return value
+
+        if self.sign_bit is not None and raw & self.sign_bit:
+            raw -= self.mask + 1
+
+        return raw
+
+    def value_from_raw_array(self, little, big, length):
+        if self.little_endian:
+            words = little
+            shift = self.shift
+        else:
+            # big endian words are always eight bytes while the codec is
+            # built for the frame length
+            words = big
+            shift = self.shift + 64 - (length * 8)
+
+        raw = (words >> numpy.uint64(shift)) & numpy.uint64(self.mask)
+
+        if self.float_struct is not None:
+            if self.float_struct.size == 4:
+                return raw.astype(numpy.uint32).view(numpy.float32)
+
+            return raw.view(numpy.float64)
+
+        if self.sign_bit is not None:
+            unused_bits = numpy.int64(64 - self.mask.bit_length())
+            return (raw.astype(numpy.int64) << unused_bits) >> unused_bits
+
+        return raw
+
+
+@attr.s(frozen=True)
+class FrameCodec:
+    """Packs and unpacks all signals of a frame using integer shift and mask
+    operations on the whole payload.  This replaces the bitstring based
+    :func:`signals_to_bytes` and :func:`bitstring_to_signal_list` which are
+    kept as reference implementations.
+    """
+
+    length = attr.ib()
+    signals = attr.ib()
+    fields = attr.ib()
+    little_mask_as_big = attr.ib()
+
+    @classmethod
+    def build(cls, length, signals):
+        fields = tuple(
+            BitField.from_signal(signal=signal, length=length) for signal in signals
+        )
+
+        little_mask = 0
+        for field in fields:
+            if field.little_endian:
+                little_mask |= field.positioned_mask
+
+        return cls(
+            length=length,
+            signals=signals,
+            fields=fields,
+            little_mask_as_big=int.from_bytes(
+                little_mask.to_bytes(length, byteorder="little"),
+                byteorder="big",
+            ),
+        )
+
+    def pack(self, data):
+        little = 0
+        big = 0
+
+        for field, value in zip(self.fields, data):
+            try:
+                raw = field.raw_from_value(value)
+            except OverflowError as e:
+                raise field.signal.unable_to_pack_error(value) from e
+
+            if field.little_endian:
+                little = (little & ~field.positioned_mask) | (raw << field.shift)
+            else:
+                big = (big & ~field.positioned_mask) | (raw << field.shift)
+
+        # Little endian fields take precedence over big endian fields as
+        # in signals_to_bytes()
+        big &= ~self.little_mask_as_big
+
+        return (big | self._swap(little)).to_bytes(self.length, byteorder="big")
+
+    def unpack(self, data):
+        data = bytes(data)
+        if len(data) != self.length:
+            data = data[: self.length].ljust(self.length, b"\x00")
+
+        little = int.from_bytes(data, byteorder="little")
+        big = int.from_bytes(data, byteorder="big")
+
+        return [
+            field.value_from_raw(
+                ((little if field.little_endian else big) >> field.shift) & field.mask
+            )
+            for field in self.fields
+        ]
+
+    def unpack_arrays(self, little, big):
+        """Unpack many payloads at once.  `little` and `big` are `uint64`
+        arrays of the payloads, zero padded to eight bytes, read as little
+        and big endian respectively.
+        """
+
+        return [
+            field.value_from_raw_array(little=little, big=big, length=self.length)
+            for field in self.fields
+        ]
+
+    def _swap(self, value):
+        return int.from_bytes(
+            value.to_bytes(self.length, byteorder="little"),
+            byteorder="big",
+        )
+
+
 class Signal:
     # TODO: but some (progress bar, etc) require an int!
     value_changed = epyqlib.utils.qt.Signal(float)
@@ -559,17 +771,20 @@ class Signal:
         try:
             return pack_bitstring(self.signal_size, self.float, value, self.signed)
         except OverflowError as e:
-            names = (self.frame.name, self.frame.mux_name, self.name)
-            name = ":".join(name for name in names if name is not None)
-            raise UnableToPackError(
-                "Unable to pack {value} into {name} with range "
-                "[{minimum}, {maximum}]".format(
-                    value=value,
-                    name=name,
-                    minimum=self.raw_minimum,
-                    maximum=self.raw_maximum,
-                )
-            ) from e
+            raise self.unable_to_pack_error(value) from e
+
+    def unable_to_pack_error(self, value):
+        names = (self.frame.name, self.frame.mux_name, self.name)
+        name = ":".join(name for name in names if name is not None)
+        return UnableToPackError(
+            "Unable to pack {value} into {name} with range "
+            "[{minimum}, {maximum}]".format(
+                value=value,
+                name=name,
+                minimum=self.raw_minimum,
+                maximum=self.raw_maximum,
+            )
+        )
 
     def unpack_bitstring(self, bits):
         return unpack_bitstring(self.signal_size, self.float, self.signed, bits)
@@ -595,6 +810,12 @@ class QtCanListener(can.Listener):
     def receiver(self, slot):
         self.message_received_signal.connect(slot)
 
+    def arbitration_ids(self):
+        """The `(id, extended)` pairs of the messages this listener handles,
+        or `None` to receive all messages.
+        """
+        return None
+
     def on_message_received(self, msg):
         # TODO: Be careful since this is no longer being deep copied.
         #       It seems safe based on looking at the socketcan and
@@ -658,6 +879,7 @@ class Frame(QtCanListener):
         self.format_str = None
         self.data = None
         self.last_received = None
+        self._codec = None
 
         self.signals = []
         for signal in frame.signals:
@@ -701,6 +923,9 @@ class Frame(QtCanListener):
         if not self.block_cyclic:
             self._send(update=True)
 
+    def arbitration_ids(self):
+        return ((self.id, self.extended),)
+
     def signal_by_name(self, name):
         try:
             return next(s for s in self.signals if s.name == name)
@@ -736,7 +961,7 @@ class Frame(QtCanListener):
                 data.append(value)
             data = tuple(data)
 
-        return signals_to_bytes(self.size, self.signals, data)
+        return self.codec().pack(data)
 
     def unpack(self, data, report_error=True, only_return=False):
         rx_length = len(data)
@@ -747,9 +972,7 @@ class Frame(QtCanListener):
                 )
             )
         else:
-            little, big = bytes_to_bitstrings(bytes(data))
-
-            unpacked = bitstring_to_signal_list(self.signals, big, little)
+            unpacked = self.codec().unpack(data)
 
             if only_return:
                 return dict(zip(self.signals, unpacked))
@@ -757,6 +980,12 @@ class Frame(QtCanListener):
             for s, v in zip(self.signals, unpacked):
                 s.set_value(v)
 
+    def codec(self):
+        if self._codec is None or self._codec.signals is not self.signals:
+            self._codec = FrameCodec.build(length=self.size, signals=self.signals)
+
+        return self._codec
+
     def _send(self, update=False):
         if update:
             self.data = self.pack(self)
@@ -844,6 +1073,38 @@ class Frame(QtCanListener):
         logging.debug("{} terminated".format(object.__repr__(self)))
 
 
+def group_rows(keys):
+    """Yield each unique key along with the indexes of the rows holding it."""
+
+    unique, inverse = numpy.unique(keys, return_inverse=True)
+    order = numpy.argsort(inverse, kind="stable")
+    splits = numpy.cumsum(numpy.bincount(inverse, minlength=len(unique)))[:-1]
+
+    return zip(unique, numpy.split(order, splits))
+
+
+@attr.s
+class SignalColumns:
+    timestamps = attr.ib()
+    raw = attr.ib()
+    scaled = attr.ib()
+
+
+def frames_by_arbitration_id(frames, extended=True):
+    """Index the non-multiplexed and multiplexer frames by `(id, extended)`
+    or, with `extended=False`, by just the id.  Keys shared by more than one
+    frame are left out as in :func:`frame_by_id`.
+    """
+
+    found = collections.defaultdict(list)
+    for frame in frames:
+        if frame.mux_name is None:
+            key = (frame.id, frame.extended) if extended else frame.id
+            found[key].append(frame)
+
+    return {key: frame for key, (frame, *others) in found.items() if len(others) == 0}
+
+
 @functools.lru_cache(1024)
 def frame_by_id(id, frames):
     found = (f for f in frames if f.id == id and f.mux_name is None)
@@ -985,6 +1246,8 @@ class Neo(QtCanListener):
                     multiplex_neo_frame.multiplex_frames[multiplex_value] = neo_frame
 
         self.frames = tuple(frames)
+        self.frames_by_arbitration_id = frames_by_arbitration_id(self.frames)
+        self.frames_by_id = frames_by_arbitration_id(self.frames, extended=False)
 
         self.signal_from_uuid = {
             signal.parameter_uuid: signal
@@ -1005,8 +1268,14 @@ class Neo(QtCanListener):
         for frame in self.frames:
             frame.send.connect(self.bus.send)
 
-    def frame_by_id(self, id):
-        return frame_by_id(id, self.frames)
+    def frame_by_id(self, id, extended=None):
+        if extended is None:
+            return self.frames_by_id.get(id)
+
+        return self.frames_by_arbitration_id.get((id, bool(extended)))
+
+    def arbitration_ids(self):
+        return tuple(self.frames_by_arbitration_id)
 
     def frame_by_name(self, name):
         try:
@@ -1050,7 +1319,10 @@ class Neo(QtCanListener):
         return signal
 
     def get_multiplex(self, message):
-        base_frame = self.frame_by_id(message.arbitration_id)
+        base_frame = self.frame_by_id(
+            message.arbitration_id,
+            extended=message.is_extended_id,
+        )
 
         if not hasattr(base_frame, "multiplex_frames"):
             frame = base_frame
@@ -1066,8 +1338,103 @@ class Neo(QtCanListener):
 
         return (frame, multiplex_value)
 
+    def unpack_batch(self, timestamps, ids, payloads, extended=None):
+        """Decode many recorded messages at once without touching the
+        signal values or emitting any Qt signals.  `payloads` is an
+        `(n, 8)` array of bytes with shorter payloads zero padded.  If
+        given, `extended` holds the extended id flag of each message and
+        frames are matched on both the id and the flag, otherwise on the id
+        alone.  Returns a dict mapping each received :class:`Signal` to its
+        :class:`SignalColumns`.
+        """
+
+        timestamps = numpy.asarray(timestamps, dtype=numpy.float64)
+        ids = numpy.asarray(ids, dtype=numpy.uint32)
+        payloads = numpy.asarray(payloads, dtype=numpy.uint8)
+
+        if payloads.ndim != 2 or payloads.shape[1] > 8:
+            raise ValueError(
+                "Payloads must have shape (n, 8), not {}".format(payloads.shape),
+            )
+
+        padded = numpy.zeros((len(payloads), 8), dtype=numpy.uint8)
+        padded[:, : payloads.shape[1]] = payloads
+        little = padded.view("<u8")[:, 0].astype(numpy.uint64)
+        big = padded.view(">u8")[:, 0].astype(numpy.uint64)
+
+        columns = {}
+
+        if extended is None:
+            keys = ids
+        else:
+            # ids are at most 29 bits so the flag fits above them
+            extended = numpy.asarray(extended, dtype=bool)
+            keys = ids.astype(numpy.uint64) | (
+                extended.astype(numpy.uint64) << numpy.uint64(32)
+            )
+
+        for key, rows in group_rows(keys):
+            if extended is None:
+                frame = self.frame_by_id(int(key))
+            else:
+                frame = self.frame_by_id(
+                    int(key) & 0xFFFFFFFF,
+                    extended=bool(int(key) >> 32),
+                )
+            if frame is None:
+                continue
+
+            if hasattr(frame, "multiplex_frames"):
+                (multiplex_values,) = frame.codec().unpack_arrays(
+                    little=little[rows],
+                    big=big[rows],
+                )
+
+                for multiplex_value, multiplex_rows in group_rows(multiplex_values):
+                    multiplex_frame = frame.multiplex_frames.get(int(multiplex_value))
+                    if multiplex_frame is None:
+                        continue
+
+                    self._unpack_batch_frame(
+                        frame=multiplex_frame,
+                        rows=rows[multiplex_rows],
+                        timestamps=timestamps,
+                        little=little,
+                        big=big,
+                        columns=columns,
+                    )
+            else:
+                self._unpack_batch_frame(
+                    frame=frame,
+                    rows=rows,
+                    timestamps=timestamps,
+                    little=little,
+                    big=big,
+                    columns=columns,
+                )
+
+        return columns
+
+    def _unpack_batch_frame(self, frame, rows, timestamps, little, big, columns):
+        raw_values = frame.codec().unpack_arrays(little=little[rows], big=big[rows])
+
+        for signal, raw in zip(frame.signals, raw_values):
+            factor = signal.factor
+            if factor is None:
+                factor = 1
+
+            offset = signal.offset
+            if offset is None:
+                offset = 0
+
+            columns[signal] = SignalColumns(
+                timestamps=timestamps[rows],
+                raw=raw,
+                scaled=float(offset) + (raw * float(factor)),
+            )
+
     def message_received(self, msg):
-        frame = self.frame_by_id(msg.arbitration_id)
+        frame = self.frame_by_id(msg.arbitration_id, extended=msg.is_extended_id)
         if frame is not None:
             last = self.frame_rx_timestamps.get(frame, -self.frame_rx_interval)
             if msg.timestamp - last >= self.frame_rx_interval:
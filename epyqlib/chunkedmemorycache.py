@@ -1,10 +1,8 @@
 import attr
 import bisect
-import collections
+import contextlib
 import itertools
 
-import epyqlib.utils.general
-
 
 class ChunkExistsError(Exception):
     pass
@@ -24,15 +22,126 @@ class Subscriber:
     reference = attr.ib()
 
 
+@attr.s
+class IntervalIndex:
+    """Overlap lookup for chunks sorted by their start address.
+
+    The sorted chunks are treated as an implicit balanced binary tree, the
+    middle of each range being the root of that range, with each node
+    holding the largest end address found in its subtree.  Subtrees which
+    end before the queried range are skipped so a lookup is O(log n + k).
+    """
+
+    chunks = attr.ib()
+    starts = attr.ib()
+    ends = attr.ib()
+    max_ends = attr.ib()
+
+    @classmethod
+    def build(cls, chunks):
+        bounds = [chunk.bounds() for chunk in chunks]
+        starts = [start for start, _ in bounds]
+        ends = [end for _, end in bounds]
+        max_ends = list(ends)
+
+        def fill(low, high):
+            if low >= high:
+                return None
+
+            middle = (low + high) // 2
+            for child in (fill(low, middle), fill(middle + 1, high)):
+                if child is not None:
+                    max_ends[middle] = max(max_ends[middle], max_ends[child])
+
+            return middle
+
+        fill(0, len(chunks))
+
+        return cls(chunks=chunks, starts=starts, ends=ends, max_ends=max_ends)
+
+    def overlapping(self, start, end):
+        """Yield the chunks overlapping the addresses [start, end)."""
+
+        if start >= end:
+            return
+
+        ranges = [(0, len(self.chunks))]
+        while len(ranges) > 0:
+            low, high = ranges.pop()
+            if low >= high:
+                continue
+
+            middle = (low + high) // 2
+            if self.max_ends[middle] <= start:
+                continue
+
+            ranges.append((low, middle))
+
+            # everything to the right starts no earlier than the middle
+            if self.starts[middle] < end:
+                if self.ends[middle] > start:
+                    yield self.chunks[middle]
+
+                ranges.append((middle + 1, high))
+
+
+@attr.s
+class Region:
+    """A buffer backing all chunks within one contiguous address range."""
+
+    address = attr.ib()
+    end = attr.ib()
+    buffer = attr.ib()
+
+    @classmethod
+    def build(cls, address, end, word_bytes):
+        return cls(
+            address=address,
+            end=end,
+            buffer=bytearray((end - address) * word_bytes),
+        )
+
+
+def merge_ranges(ranges):
+    """Merge sorted, possibly overlapping, [start, end) ranges."""
+
+    merged = []
+
+    for start, end in ranges:
+        if start == end:
+            continue
+
+        if len(merged) > 0 and start <= merged[-1][1]:
+            merged[-1][1] = max(merged[-1][1], end)
+        else:
+            merged.append([start, end])
+
+    return [tuple(r) for r in merged]
+
+
 @attr.s
 class Cache:
+    """Chunks of memory with subscribers to be notified when updated.
+
+    With `shared` set each chunk is a `memoryview` window into a single
+    buffer per contiguous region so an update is written once no matter how
+    many chunks overlap it and subscribers are handed the window rather
+    than a copy.  Updates made within `batch()` notify each affected
+    subscriber once when the batch ends.  Range subscribers are passed the
+    merged dirty address ranges.
+    """
+
     _chunks = attr.ib(init=False, default=attr.Factory(list))
     _chunks_set = attr.ib(init=False, default=attr.Factory(set), repr=False)
     _subscribers = attr.ib(init=False, default=attr.Factory(dict))
     _bits_per_byte = attr.ib(default=8)
-
-    def __attrs_post_init__(self):
-        self.address_to_chunks = collections.defaultdict(set)
+    shared = attr.ib(default=False)
+    _index = attr.ib(init=False, default=None, repr=False)
+    _regions = attr.ib(init=False, default=None, repr=False)
+    _region_starts = attr.ib(init=False, default=None, repr=False)
+    _range_subscribers = attr.ib(init=False, factory=set, repr=False)
+    _dirty = attr.ib(init=False, factory=list, repr=False)
+    _batch_depth = attr.ib(init=False, default=0, repr=False)
 
     def __repr__(self):
         return object.__repr__(self)
@@ -47,9 +156,77 @@ class Cache:
         bisect.insort_left(self._chunks, chunk)
         self._chunks_set.add(chunk)
         self._subscribers[chunk] = set()
+        self._index = None
+        self._regions = None
+
+    def index(self):
+        # chunks tend to be added in bulk before any updates so the index
+        # is only rebuilt when needed
+        if self._index is None:
+            self._index = IntervalIndex.build(chunks=self._chunks)
+
+        return self._index
+
+    def overlapping_chunks(self, address, length):
+        return self.index().overlapping(start=address, end=address + length)
+
+    def regions(self):
+        if self._regions is None:
+            self._regions = self._build_regions()
+            self._region_starts = [region.address for region in self._regions]
+
+        return self._regions
 
-        for address in chunk.addresses():
-            self.address_to_chunks[address].add(chunk)
+    def _build_regions(self):
+        word_bytes = self._bits_per_byte // 8
+        regions = [
+            Region.build(address=start, end=end, word_bytes=word_bytes)
+            for start, end in merge_ranges(chunk.bounds() for chunk in self._chunks)
+        ]
+        starts = [region.address for region in regions]
+
+        def region_slice(chunk):
+            start, end = chunk.bounds()
+            region = regions[bisect.bisect_right(starts, start) - 1]
+            offset = (start - region.address) * word_bytes
+
+            return region, slice(offset, offset + (end - start) * word_bytes)
+
+        # chunks already sharing a buffer have been kept up to date by
+        # updates so they are copied last to take precedence over new chunks
+        for chunk in sorted(self._chunks, key=lambda c: c.shared()):
+            if len(chunk) > 0:
+                region, s = region_slice(chunk)
+                region.buffer[s] = chunk._bytes
+
+        for chunk in self._chunks:
+            if len(chunk) > 0:
+                region, s = region_slice(chunk)
+                chunk._bytes = memoryview(region.buffer)[s]
+
+        return regions
+
+    def _write(self, update_chunk):
+        word_bytes = self._bits_per_byte // 8
+        start, end = update_chunk.bounds()
+        regions = self.regions()
+
+        i = max(0, bisect.bisect_right(self._region_starts, start) - 1)
+        for region in itertools.islice(regions, i, None):
+            if region.address >= end:
+                break
+
+            overlap_start = max(start, region.address)
+            overlap_end = min(end, region.end)
+            if overlap_end <= overlap_start:
+                continue
+
+            length = (overlap_end - overlap_start) * word_bytes
+            region_offset = (overlap_start - region.address) * word_bytes
+            chunk_offset = (overlap_start - start) * word_bytes
+            region.buffer[region_offset : region_offset + length] = update_chunk._bytes[
+                chunk_offset : chunk_offset + length
+            ]
 
     def subscribe(self, subscriber, chunk, reference=None):
         if chunk not in self._chunks_set:
@@ -64,7 +241,18 @@ class Cache:
     #         if
     #         .discard(subscriber)
 
+    def subscribe_ranges(self, subscriber, reference=None):
+        s = Subscriber(callback=subscriber, reference=reference)
+        self._range_subscribers.add(s)
+
     def unsubscribe_by_reference(self, reference, chunk=None):
+        if chunk is None:
+            self._range_subscribers = {
+                subscriber
+                for subscriber in self._range_subscribers
+                if subscriber.reference != reference
+            }
+
         chunks = self._subscribers.items() if chunk is None else [chunk]
 
         to_discard = set()
@@ -83,18 +271,57 @@ class Cache:
         for chunk in chunks:
             self._subscribers[chunk] = set()
 
+    @contextlib.contextmanager
+    def batch(self):
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+
+            if self._batch_depth == 0:
+                self.notify()
+
     def update(self, update_chunk):
+        start, end = update_chunk.bounds()
+        if start == end:
+            return
+
+        if self.shared:
+            self._write(update_chunk)
+        else:
+            for chunk in self.overlapping_chunks(address=start, length=end - start):
+                chunk.update(update_chunk)
+
+        self._dirty.append((start, end))
 
-        intersected_chunks = set()
-        for address in update_chunk.addresses():
-            intersected_chunks |= self.address_to_chunks[address]
+        if self._batch_depth == 0:
+            self.notify()
 
-        for chunk in intersected_chunks:
-            chunk.update(update_chunk)
+    def notify(self):
+        dirty = merge_ranges(sorted(self._dirty))
+        self._dirty = []
 
-            for subscriber in self._subscribers[chunk]:
+        if len(dirty) == 0:
+            return
+
+        chunks = []
+        notified = set()
+        for start, end in dirty:
+            for chunk in self.overlapping_chunks(address=start, length=end - start):
+                # checking identity as chunks compare by content
+                if id(chunk) not in notified:
+                    notified.add(id(chunk))
+                    chunks.append(chunk)
+
+        for chunk in chunks:
+            # subscribers may subscribe or unsubscribe others
+            for subscriber in list(self._subscribers[chunk]):
                 subscriber.callback(chunk._bytes)
 
+        for subscriber in list(self._range_subscribers):
+            subscriber.callback(dirty)
+
     def chunk_from_variable(self, variable, reference=None):
         data = bytearray([0] * variable.type.bytes * (self._bits_per_byte // 8))
         if reference is None:
@@ -115,26 +342,16 @@ class Cache:
         )
 
     def contiguous_chunks(self):
-        chunks = []
+        # chunks are sorted by start address
+        ranges = merge_ranges(chunk.bounds() for chunk in self._chunks)
 
-        addresses = set()
-        for chunk in self._chunks:
-            addresses.update(
-                chunk._address + offset
-                for offset in range(len(chunk._bytes) // (self._bits_per_byte // 8))
+        return [
+            self.new_chunk(
+                address=start,
+                bytes=b"\x00" * (end - start) * (self._bits_per_byte // 8),
             )
-
-        gen = epyqlib.utils.general.generate_ranges(sorted(addresses))
-        for start, end in gen:
-            print(start, end)
-            chunks.append(
-                self.new_chunk(
-                    address=start,
-                    bytes=b"\x00" * (end - start + 1) * (self._bits_per_byte // 8),
-                )
-            )
-
-        return chunks
+            for start, end in ranges
+        ]
 
 
 @attr.s(hash=False)
@@ -165,11 +382,17 @@ class Chunk:
             self._address == other._address and len(self) < len(other)
         )
 
+    def shared(self):
+        return isinstance(self._bytes, memoryview)
+
     def set_bytes(self, new_bytes):
         if len(new_bytes) != len(self):
             raise ByteLengthError("A chunk's byte array may not change length")
 
-        self._bytes = bytearray(new_bytes)
+        if self.shared():
+            self._bytes[:] = bytearray(new_bytes)
+        else:
+            self._bytes = bytearray(new_bytes)
 
     def overlaps_address_length(self, address, length):
         # TODO: CAMPid 4317784316796754167954114314396
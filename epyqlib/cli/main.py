@@ -1,7 +1,9 @@
 import click
 
 import epyqlib.cli.audit
+import epyqlib.cmemoryparser
 import epyqlib.pm.valueset
+import epyqlib.utils.canreplay
 
 
 @click.group()
@@ -11,3 +13,5 @@ def cli():
 
 cli.add_command(epyqlib.pm.valueset.group)
 cli.add_command(epyqlib.cli.audit.create_command(), name="audit")
+cli.add_command(epyqlib.utils.canreplay.cli, name="replay")
+cli.add_command(epyqlib.cmemoryparser.benchmark, name="dwarf-benchmark")
@@ -18,6 +18,13 @@ import sys
 sys.path[0:0] = [".", ".."]
 
 import collections
+import concurrent.futures
+import functools
+import hashlib
+import pathlib
+import pickle
+import tempfile
+import time
 from elftools.dwarf.dwarf_expr import GenericExprVisitor
 from elftools.dwarf.dwarfinfo import DebugSectionDescriptor
 from elftools.dwarf.descriptions import describe_attr_value
@@ -25,11 +32,14 @@ import elftools.common.exceptions
 import io
 import itertools
 import os
+import struct
 import epyqlib.ticoff
 import traceback
 
+import appdirs
 import attr
 import bitstruct
+import click
 import enum
 import itertools
 import textwrap
@@ -128,7 +138,11 @@ class Type:
 
     # TODO: CAMPid 034173541438600605430541538
     def unpack(self, data):
-        if isinstance(data, bytearray):
+        unpacker = compiled_unpacker(type=self, data=data)
+        if unpacker is not None:
+            return unpacker(int.from_bytes(data, "big"))
+
+        if isinstance(data, (bytearray, memoryview)):
             bits = bytearray_to_bits(data)
         else:
             bits = data
@@ -224,7 +238,12 @@ class PointerType:
 
     # TODO: CAMPid 034173541438600605430541538
     def unpack(self, data):
-        if isinstance(data, bytearray):
+        unpacker = compiled_unpacker(type=self, data=data)
+        if unpacker is not None:
+            self.value = unpacker(int.from_bytes(data, "big"))
+            return self.value
+
+        if isinstance(data, (bytearray, memoryview)):
             bits = bytearray_to_bits(data)
         else:
             bits = data
@@ -267,6 +286,13 @@ class ArrayType:
     def array_markup(self):
         return "[{}]".format(self.length())
 
+    def length(self):
+        length = 1
+        for dimension in self.dimensions:
+            length *= dimension
+
+        return length
+
     def offset_of(self, *indexes):
         offset = 0
         overall_multiplier = self.type.bytes
@@ -279,8 +305,12 @@ class ArrayType:
         return offset
 
     def unpack(self, data):
+        unpacker = compiled_unpacker(type=self, data=data)
+        if unpacker is not None:
+            return unpacker(int.from_bytes(data, "big"))
+
         # TODO: CAMPid 078587996542145215432667431535465465421
-        if isinstance(data, bytes):
+        if isinstance(data, (bytes, memoryview)):
             data = bytearray(data)
         elif isinstance(data, str):
             data = bytearray(
@@ -455,8 +485,12 @@ class Struct:
         return ranges
 
     def unpack(self, data):
+        unpacker = compiled_unpacker(type=self, data=data)
+        if unpacker is not None:
+            return unpacker(int.from_bytes(data, "big"))
+
         # TODO: CAMPid 078587996542145215432667431535465465421
-        if isinstance(data, bytes):
+        if isinstance(data, (bytes, memoryview)):
             data = bytearray(data)
         elif isinstance(data, str):
             data = bytearray(
@@ -567,7 +601,11 @@ class StructMember:
         return base_type(self).bytes
 
     def unpack(self, data):
-        if isinstance(data, bytearray):
+        unpacker = compiled_unpacker(type=self, data=data)
+        if unpacker is not None:
+            return unpacker(int.from_bytes(data, "big"))
+
+        if isinstance(data, (bytearray, memoryview)):
             bits = bytearray_to_bits(data)
             if self.bit_size is not None:
                 bits = bits[self.bit_offset :]
@@ -585,6 +623,10 @@ class Union:
     members = attr.ib(default=attr.Factory(collections.OrderedDict))
 
     def unpack(self, data):
+        unpacker = compiled_unpacker(type=self, data=data)
+        if unpacker is not None:
+            return unpacker(int.from_bytes(data, "big"))
+
         # # TODO: CAMPid 078587996542145215432667431535465465421
         # if isinstance(data, bytes):
         #     data = bytearray(data)
@@ -648,7 +690,12 @@ class EnumerationType:
 
     # TODO: CAMPid 034173541438600605430541538
     def unpack(self, data):
-        if isinstance(data, bytearray):
+        unpacker = compiled_unpacker(type=self, data=data)
+        if unpacker is not None:
+            self.value = unpacker(int.from_bytes(data, "big"))
+            return self.value
+
+        if isinstance(data, (bytearray, memoryview)):
             bits = bytearray_to_bits(data)
         else:
             bits = data
@@ -749,6 +796,299 @@ class Variable:
         return base_type(self).unpack(data)
 
 
+def reverse_words(value, words):
+    reversed_value = 0
+    for _ in range(words):
+        reversed_value = (reversed_value << bits_per_byte) | (
+            value & ((1 << bits_per_byte) - 1)
+        )
+        value >>= bits_per_byte
+
+    return reversed_value
+
+
+@attr.s(frozen=True)
+class IntegerUnpacker:
+    width = attr.ib()
+    words = attr.ib()
+    signed = attr.ib()
+
+    def __call__(self, value):
+        if self.words > 1:
+            value = reverse_words(value, self.words)
+
+        if self.signed and value >> (self.width - 1):
+            value -= 1 << self.width
+
+        return value
+
+
+@attr.s(frozen=True)
+class FloatUnpacker:
+    width = attr.ib()
+    words = attr.ib()
+    format = attr.ib()
+
+    def __call__(self, value):
+        if self.words > 1:
+            value = reverse_words(value, self.words)
+
+        (value,) = struct.unpack(self.format, value.to_bytes(self.width // 8, "big"))
+
+        return value
+
+
+@attr.s(frozen=True)
+class FieldUnpacker:
+    name = attr.ib()
+    shift = attr.ib()
+    mask = attr.ib()
+    unpacker = attr.ib()
+
+    def __call__(self, value):
+        return self.unpacker((value >> self.shift) & self.mask)
+
+
+@attr.s(frozen=True)
+class StructUnpacker:
+    swaps = attr.ib()
+    fields = attr.ib()
+    names = attr.ib()
+
+    def __call__(self, value):
+        for shift, mask, words in self.swaps:
+            region = (value >> shift) & mask
+            value ^= (region ^ reverse_words(region, words)) << shift
+
+        values = {field.name: field(value) for field in self.fields}
+
+        return collections.OrderedDict((name, values[name]) for name in self.names)
+
+
+@attr.s(frozen=True)
+class ArrayUnpacker:
+    fields = attr.ib()
+
+    def __call__(self, value):
+        return [field(value) for field in self.fields]
+
+
+@attr.s(frozen=True)
+class UnionUnpacker:
+    unpackers = attr.ib()
+
+    def __call__(self, value):
+        return collections.OrderedDict(
+            (name, unpacker(value)) for name, unpacker in self.unpackers
+        )
+
+
+def leaf_words(type, width):
+    # TODO: CAMPid 08793287728743824372437983526631513679
+    if type.bytes > 1 and width % bits_per_byte == 0:
+        return width // bits_per_byte
+
+    return 0
+
+
+def build_unpacker(type, width, exact):
+    """Build an unpacker equivalent to `type.unpack()` for `width` bits of
+    data held in an integer, most significant bit first.  `exact` is set
+    when the data is passed as bytes rather than as a string of bits, in
+    which case aggregates do not pad it out to their full size.  `None` is
+    returned for anything not handled, leaving the bit string
+    implementation to deal with it.
+    """
+
+    type = base_type(type)
+    type_width = type.bytes * bits_per_byte if hasattr(type, "bytes") else None
+
+    if width <= 0 or type_width is None or width > type_width:
+        return None
+
+    if isinstance(type, Type):
+        if type.format.is_integer():
+            return IntegerUnpacker(
+                width=width,
+                words=leaf_words(type=type, width=width),
+                signed=type.format.is_signed_integer(),
+            )
+
+        if type.format.is_floating_point():
+            formats = {32: ">f", 64: ">d"}
+            if width != type_width or width not in formats:
+                return None
+
+            return FloatUnpacker(
+                width=width,
+                words=leaf_words(type=type, width=width),
+                format=formats[width],
+            )
+
+        return None
+
+    if isinstance(type, (EnumerationType, PointerType)):
+        return IntegerUnpacker(
+            width=width,
+            words=leaf_words(type=type, width=width),
+            signed=False,
+        )
+
+    if exact and width != type_width:
+        return None
+
+    if isinstance(type, Struct):
+        return build_struct_unpacker(struct=type)
+
+    if isinstance(type, ArrayType):
+        if None in type.dimensions:
+            return None
+
+        element = base_type(type.type)
+        element_width = element.bytes * bits_per_byte
+        count = type.length()
+
+        if element_width * count != type_width:
+            return None
+
+        unpacker = build_unpacker(type=element, width=element_width, exact=False)
+        if unpacker is None:
+            return None
+
+        mask = (1 << element_width) - 1
+
+        return ArrayUnpacker(
+            fields=tuple(
+                FieldUnpacker(
+                    name=index,
+                    shift=(count - 1 - index) * element_width,
+                    mask=mask,
+                    unpacker=unpacker,
+                )
+                for index in range(count)
+            )
+        )
+
+    if isinstance(type, Union):
+        unpackers = []
+        for member in type.members.values():
+            unpacker = build_unpacker(type=member, width=width, exact=exact)
+            if unpacker is None:
+                return None
+
+            unpackers.append((member.name, unpacker))
+
+        return UnionUnpacker(unpackers=tuple(unpackers))
+
+    return None
+
+
+def build_struct_unpacker(struct):
+    struct_width = struct.bytes * bits_per_byte
+    word_bytes = bits_per_byte // 8
+    members = struct.padded_members()
+
+    # multi-word bitfields have their words swapped before being extracted
+    swaps = []
+    location = None
+    for member in members:
+        if location == member.location:
+            continue
+
+        location = member.location
+        b_type = base_type(member)
+        if (
+            b_type.bytes > 1
+            and isinstance(b_type, Type)
+            and member.bit_size is not None
+        ):
+            start = member.location * bits_per_byte
+            width = b_type.bytes * bits_per_byte
+            if start + width > struct_width:
+                return None
+
+            swaps.append((struct_width - start - width, (1 << width) - 1, b_type.bytes))
+
+    fields = []
+    for member in members:
+        if member.name == "<padding>":
+            continue
+
+        bit_size = (
+            member.bit_size
+            if member.bit_size is not None
+            else member.bytes * bits_per_byte
+        )
+        bit_offset = member.bit_offset if member.bit_offset is not None else 0
+
+        msb = (member.location * bits_per_byte) + bit_offset
+        lsb = msb + bit_size
+        if lsb > struct_width:
+            return None
+
+        unpacker = build_unpacker(type=member, width=bit_size, exact=False)
+        if unpacker is None:
+            return None
+
+        fields.append(
+            FieldUnpacker(
+                name=member.name,
+                shift=struct_width - lsb,
+                mask=(1 << bit_size) - 1,
+                unpacker=unpacker,
+            )
+        )
+
+    return StructUnpacker(
+        swaps=tuple(swaps),
+        fields=tuple(fields),
+        names=tuple(member.name for member in struct.members.values()),
+    )
+
+
+def compiled_unpacker(type, data):
+    """Return the cached unpacker for passing `data` to `type.unpack()` or
+    `None` if the original implementation must be used.  Unpackers are
+    built once per type and data length and take the data as an integer.
+    """
+
+    if not isinstance(data, (bytes, bytearray, memoryview)):
+        return None
+
+    width = len(data) * 8
+
+    try:
+        unpackers = type._unpackers
+    except AttributeError:
+        unpackers = type._unpackers = {}
+
+    try:
+        return unpackers[width]
+    except KeyError:
+        pass
+
+    if isinstance(type, StructMember) and type.bit_size is not None:
+        unpacker = None
+        end = type.bit_offset + type.bit_size
+        if end <= width:
+            member_unpacker = build_unpacker(
+                type=type, width=type.bit_size, exact=False
+            )
+            if member_unpacker is not None:
+                unpacker = FieldUnpacker(
+                    name=type.name,
+                    shift=width - end,
+                    mask=(1 << type.bit_size) - 1,
+                    unpacker=member_unpacker,
+                )
+    else:
+        unpacker = build_unpacker(type=type, width=width, exact=True)
+
+    unpackers[width] = unpacker
+
+    return unpacker
+
+
 def get_value(variable):
     # TODO: totally stubbed...
     return 42
@@ -814,12 +1154,9 @@ def get_die_path(die):
     return "::".join(path[::-1])
 
 
-def process_file(filename):
-    logging.debug("Processing file: {}".format(filename))
-    logging.debug("Working directory: {}".format(os.getcwd()))
-
+def load_dwarf_info(filename):
     coff = epyqlib.ticoff.Coff()
-    coff.from_file(filename)
+    coff.from_file(filename, memory_map=True)
 
     section_bytes = {
         s.name: (io.BytesIO(s.data), len(s.data))
@@ -862,6 +1199,51 @@ def process_file(filename):
         debug_pubnames_sec=debug_sections.get(".pubnames_sec", None),
     )
 
+    return dwarfinfo
+
+
+def compile_unit_offsets(dwarfinfo):
+    """The offsets of the compile units to be processed, stopping at the
+    __TI_internal unit.
+    """
+
+    offsets = []
+
+    for CU in dwarfinfo.iter_CUs():
+        logging.debug(
+            "  Found a compile unit at offset %s, length %s"
+            % (CU.cu_offset, CU["unit_length"])
+        )
+
+        # Start with the top DIE, the root for this CU's DIE tree
+        top_DIE = CU.get_top_DIE()
+        logging.debug("    Top DIE with tag=%s" % top_DIE.tag)
+
+        path = top_DIE.get_full_path()
+        # We're interested in the filename...
+        logging.debug("    name=%s" % path)
+
+        if path.endswith("__TI_internal"):
+            logging.debug("__TI_internal found, terminating DWARF parsing")
+            break
+
+        offsets.append(CU.cu_offset)
+
+    return offsets
+
+
+def die_info_rec_structure_type(die, indent_level):
+    for child in die.iter_children():
+        # logging.debug(indent_level + str(child.attributes['DW_AT_name'].value.decode('utf-8')))
+        location = str(child.attributes["DW_AT_data_member_location"].value)
+        name = str(child.attributes["DW_AT_name"].value.decode("utf-8"))
+        logging.debug(indent_level + name + ": " + location)
+        # logging.debug(indent_level + str(child.attributes['DW_AT_name'].value.decode('utf-8')) + ': ' + str(child.attributes['DW_AT_data_member_location'].value.decode('utf-u')))
+
+
+def collect_dies(dwarfinfo, cu_offsets):
+    cu_offsets = set(cu_offsets)
+
     objects = collections.OrderedDict(
         (tag, [])
         for tag in [
@@ -887,70 +1269,39 @@ def process_file(filename):
     )
 
     for CU in dwarfinfo.iter_CUs():
-        # it = dwarfinfo.iter_CUs()
-        # while True:
-        #     try:
-        #         CU = next(it)
-        #     except StopIteration:
-        #         break
-        #     except elftools.common.exceptions.DWARFError:
-        #         traceback.print_exc()
-        #         logging.debug('Skipping current CU')
-        #         next
-
-        # DWARFInfo allows to iterate over the compile units contained in
-        # the .debug_info section. CU is a CompileUnit object, with some
-        # computed attributes (such as its offset in the section) and
-        # a header which conforms to the DWARF standard. The access to
-        # header elements is, as usual, via item-lookup.
-        logging.debug(
-            "  Found a compile unit at offset %s, length %s"
-            % (CU.cu_offset, CU["unit_length"])
-        )
+        # only the headers are parsed while iterating, the DIEs are not
+        # read unless requested
+        if CU.cu_offset in cu_offsets:
+            die_info_rec(CU.get_top_DIE(), objects=objects)
 
-        # Start with the top DIE, the root for this CU's DIE tree
-        top_DIE = CU.get_top_DIE()
-        logging.debug("    Top DIE with tag=%s" % top_DIE.tag)
+    return objects
 
-        path = top_DIE.get_full_path()
-        # We're interested in the filename...
-        logging.debug("    name=%s" % path)
-
-        if path.endswith("__TI_internal"):
-            logging.debug("__TI_internal found, terminating DWARF parsing")
-            break
-        else:
-            # Display DIEs recursively starting with top_DIE
-            die_info_rec(top_DIE, objects=objects)
-            # pass
 
-    def die_info_rec_structure_type(die, indent_level):
-        for child in die.iter_children():
-            # logging.debug(indent_level + str(child.attributes['DW_AT_name'].value.decode('utf-8')))
-            location = str(child.attributes["DW_AT_data_member_location"].value)
-            name = str(child.attributes["DW_AT_name"].value.decode("utf-8"))
-            logging.debug(indent_level + name + ": " + location)
-            # logging.debug(indent_level + str(child.attributes['DW_AT_name'].value.decode('utf-8')) + ': ' + str(child.attributes['DW_AT_data_member_location'].value.decode('utf-u')))
+def build_symbol_table(dwarfinfo, objects):
+    """Build the partial symbol table for the DIEs collected from some
+    compile units.  Type references are left as DIE offsets so the table
+    can be pickled and merged with those of other compile units by
+    `resolve_symbol_tables()`.
+    """
 
     # this is yucky but the embedded system is weird with two bytes
     # per address and even sizeof() responds in units of addressable units
     # rather than actual bytes
     byte_size_fudge = 1
 
-    offsets = {}
+    table = collections.OrderedDict()
 
-    types = []
+    offsets = table.setdefault("DW_TAG_base_type", collections.OrderedDict())
     for die in objects["DW_TAG_base_type"]:
         type = Type(
             name=die.attributes["DW_AT_name"].value.decode("utf-8"),
             bytes=die.attributes["DW_AT_byte_size"].value * byte_size_fudge,
             format=TypeFormats(die.attributes["DW_AT_encoding"].value),
         )
-        types.append(type)
         offsets[die.offset] = type
         logging.debug("{: 10d} {}".format(die.offset, type))
 
-    variables = []
+    offsets = table.setdefault("DW_TAG_variable", collections.OrderedDict())
     for die in objects["DW_TAG_variable"]:
         location = die.attributes.get("DW_AT_location", [])
         if location:
@@ -970,31 +1321,28 @@ def process_file(filename):
             address=address,
             file=get_die_path(die),
         )
-        variables.append(variable)
         offsets[die.offset] = variable
         logging.debug("{: 10d} {}".format(die.offset, variable))
 
-    lo_users = []
+    offsets = table.setdefault("DW_TAG_lo_user", collections.OrderedDict())
     for die in objects["DW_TAG_lo_user"]:
         name = die.attributes.get("DW_AT_name", None)
         if name is not None:
             name = name.value.decode("utf-8")
         lo_user = LoUser(type=die.attributes["DW_AT_type"].value)
-        lo_users.append(lo_user)
         offsets[die.offset] = lo_user
         logging.debug("{: 10d} {}".format(die.offset, lo_user))
 
-    hi_users = []
+    offsets = table.setdefault("DW_TAG_hi_user", collections.OrderedDict())
     for die in objects["DW_TAG_hi_user"]:
         name = die.attributes.get("DW_AT_name", None)
         if name is not None:
             name = name.value.decode("utf-8")
         hi_user = HiUser(type=die.attributes["DW_AT_type"].value)
-        hi_users.append(hi_user)
         offsets[die.offset] = hi_user
         logging.debug("{: 10d} {}".format(die.offset, hi_user))
 
-    subroutine_types = []
+    offsets = table.setdefault("DW_TAG_subroutine_type", collections.OrderedDict())
     for die in objects["DW_TAG_subroutine_type"]:
         name = die.attributes.get("DW_AT_name", None)
         if name is not None:
@@ -1005,21 +1353,19 @@ def process_file(filename):
         subroutine_type = SubroutineType(name=name, return_type=type)
         for parameter in die.iter_children():
             subroutine_type.parameters.append(parameter.attributes["DW_AT_type"].value)
-        subroutine_types.append(subroutine_type)
         offsets[die.offset] = subroutine_type
         logging.debug("{: 10d} {}".format(die.offset, subroutine_type))
 
-    unspecified_types = []
+    offsets = table.setdefault("DW_TAG_unspecified_type", collections.OrderedDict())
     for die in objects["DW_TAG_unspecified_type"]:
         name = die.attributes.get("DW_AT_name", None)
         if name is not None:
             name = name.value.decode("utf-8")
         unspecified_type = UnspecifiedType(name=name)
-        unspecified_types.append(unspecified_type)
         offsets[die.offset] = unspecified_type
         logging.debug("{: 10d} {}".format(die.offset, unspecified_type))
 
-    pointer_types = []
+    offsets = table.setdefault("DW_TAG_pointer_type", collections.OrderedDict())
     for die in objects["DW_TAG_pointer_type"]:
         type = die.attributes["DW_AT_type"].value
         name = die.attributes.get("DW_AT_name", None)
@@ -1028,22 +1374,19 @@ def process_file(filename):
             pointer_type = PointerType(name=name, type=type)
         else:
             pointer_type = PointerType(type=type)
-        pointer_types.append(pointer_type)
         offsets[die.offset] = pointer_type
         logging.debug("{: 10d} {}".format(die.offset, pointer_type))
 
-    volatile_types = []
+    offsets = table.setdefault("DW_TAG_volatile_type", collections.OrderedDict())
     for die in objects["DW_TAG_volatile_type"]:
         name = die.attributes.get("DW_AT_name", None)
         if name is not None:
             name = name.value.decode("utf-8")
         volatile_type = VolatileType(name=name, type=die.attributes["DW_AT_type"].value)
-        volatile_types.append(volatile_type)
         offsets[die.offset] = volatile_type
         logging.debug("{: 10d} {}".format(die.offset, volatile_type))
 
-    array_types = []
-    array_types_with_unknown_lengths = []
+    offsets = table.setdefault("DW_TAG_array_type", collections.OrderedDict())
     for die in objects["DW_TAG_array_type"]:
         name = die.attributes.get("DW_AT_name", None)
         if name is not None:
@@ -1080,15 +1423,10 @@ def process_file(filename):
             type=die.attributes["DW_AT_type"].value,
         )
 
-        if None in array_type.dimensions:
-            # For example if you `export int x[];` in a header.  Luckily it
-            # seems these aren't used.  If at some point they are we can review
-            # how to report this usefully.
-            # http://dwarfstd.org/doc/DWARF4.pdf#page=113
-            array_types_with_unknown_lengths.append(array_type)
-        else:
-            array_types.append(array_type)
-
+        # For example if you `export int x[];` in a header there will be
+        # unknown, None, dimensions.  Luckily it seems these aren't used.  If
+        # at some point they are we can review how to report this usefully.
+        # http://dwarfstd.org/doc/DWARF4.pdf#page=113
         offsets[die.offset] = array_type
         logging.debug("{: 10d} {}".format(die.offset, array_type))
         tags = ("DW_AT_stride_size",)
@@ -1097,27 +1435,25 @@ def process_file(filename):
             if tag is not None:
                 logging.debug(" found a {}: {}".format(tag_name, tag))
 
-    const_types = []
+    offsets = table.setdefault("DW_TAG_const_type", collections.OrderedDict())
     for die in objects["DW_TAG_const_type"]:
         name = die.attributes.get("DW_AT_name", None)
         if name is not None:
             name = name.value.decode("utf-8")
         const_type = ConstType(name=name, type=die.attributes["DW_AT_type"].value)
-        const_types.append(const_type)
         offsets[die.offset] = const_type
         logging.debug("{: 10d} {}".format(die.offset, const_type))
 
-    restrict_types = []
+    offsets = table.setdefault("DW_TAG_restrict_type", collections.OrderedDict())
     for die in objects["DW_TAG_restrict_type"]:
         name = die.attributes.get("DW_AT_name", None)
         if name is not None:
             name = name.value.decode("utf-8")
         restrict_type = RestrictType(name=name, type=die.attributes["DW_AT_type"].value)
-        restrict_types.append(restrict_type)
         offsets[die.offset] = restrict_type
         logging.debug("{: 10d} {}".format(die.offset, restrict_type))
 
-    structure_types = []
+    offsets = table.setdefault("DW_TAG_structure_type", collections.OrderedDict())
     for die in objects["DW_TAG_structure_type"]:
         name = die.attributes.get("DW_AT_name", None)
         if name is not None:
@@ -1129,7 +1465,6 @@ def process_file(filename):
             )
             continue
         struct = Struct(name=name, bytes=byte_size_attribute.value)
-        structure_types.append(struct)
         offsets[die.offset] = struct
         for member_die in die.iter_children():
             a = member_die.attributes
@@ -1156,7 +1491,7 @@ def process_file(filename):
         logging.debug(list(die.iter_children()))
         logging.debug("{: 10d} {}".format(die.offset, struct))
 
-    union_types = []
+    offsets = table.setdefault("DW_TAG_union_type", collections.OrderedDict())
     for die in objects["DW_TAG_union_type"]:
         name = die.attributes.get("DW_AT_name", None)
         if name is not None:
@@ -1184,21 +1519,19 @@ def process_file(filename):
             bytes=byte_size_attribute.value,
             members=members,
         )
-        union_types.append(union)
         offsets[die.offset] = union
         logging.debug("{: 10d} {}".format(die.offset, union))
 
-    pointer_to_member_types = []
+    offsets = table.setdefault("DW_TAG_ptr_to_member_type", collections.OrderedDict())
     for die in objects["DW_TAG_ptr_to_member_type"]:
         name = die.attributes.get("DW_AT_name", None)
         if name is not None:
             name = name.value.decode("utf-8")
         pointer_to_member = PointerToMember(name=name)
-        pointer_to_member_types.append(pointer_to_member)
         offsets[die.offset] = pointer_to_member
         logging.debug("{: 10d} {}".format(die.offset, pointer_to_member))
 
-    enumeration_types = []
+    offsets = table.setdefault("DW_TAG_enumeration_type", collections.OrderedDict())
     for die in objects["DW_TAG_enumeration_type"]:
         name = die.attributes.get("DW_AT_name", None)
         if name is not None:
@@ -1218,11 +1551,10 @@ def process_file(filename):
                     value=value.attributes["DW_AT_const_value"].value,
                 )
             )
-        enumeration_types.append(enumeration)
         offsets[die.offset] = enumeration
         logging.debug("{: 10d} {}".format(die.offset, enumeration))
 
-    typedefs = []
+    offsets = table.setdefault("DW_TAG_typedef", collections.OrderedDict())
     for die in objects["DW_TAG_typedef"]:
         die_type = die.attributes.get("DW_AT_type")
         if die_type is not None:
@@ -1232,9 +1564,30 @@ def process_file(filename):
             name=die.attributes["DW_AT_name"].value.decode("utf-8"),
             type=(die.offset, die_type),
         )
-        typedefs.append(typedef)
         offsets[die.offset] = typedef
 
+    return table
+
+
+def resolve_symbol_tables(tables):
+    merged = collections.OrderedDict()
+    for table in tables:
+        for tag, items in table.items():
+            merged.setdefault(tag, collections.OrderedDict()).update(items)
+
+    offsets = {}
+    for items in merged.values():
+        offsets.update(items)
+
+    def tagged(tag):
+        return list(merged.get(tag, {}).values())
+
+    variables = tagged("DW_TAG_variable")
+    typedefs = tagged("DW_TAG_typedef")
+    structure_types = tagged("DW_TAG_structure_type")
+    union_types = tagged("DW_TAG_union_type")
+    subroutine_types = tagged("DW_TAG_subroutine_type")
+
     offset_values = sorted(offsets.keys())
     logging.debug(len(offset_values))
     logging.debug(offset_values)
@@ -1317,13 +1670,281 @@ def process_file(filename):
             if valid:
                 names[item.name].append(item)
 
-    result = names, variables, bits_per_byte
+    return names, variables, bits_per_byte
+
+
+_worker_dwarf_info = None
+
+
+def _initialize_worker(filename):
+    global _worker_dwarf_info
+
+    _worker_dwarf_info = load_dwarf_info(filename)
+
+
+def _build_partial_symbol_table(cu_offsets):
+    objects = collect_dies(dwarfinfo=_worker_dwarf_info, cu_offsets=cu_offsets)
+
+    return build_symbol_table(dwarfinfo=_worker_dwarf_info, objects=objects)
+
+
+def process_file(filename, processes=1):
+    """Process the DWARF information in the .out `filename` into
+    `(names, variables, bits_per_byte)`.
+
+    With `processes` other than 1 the compile units are split into
+    contiguous groups and their partial symbol tables are built in a
+    process pool, `None` meaning one process per CPU.  Type references
+    across compile units are resolved after the partial tables are
+    merged so the result matches the serial processing.
+    """
+
+    logging.debug("Processing file: {}".format(filename))
+    logging.debug("Working directory: {}".format(os.getcwd()))
+
+    dwarfinfo = load_dwarf_info(filename)
+    cu_offsets = compile_unit_offsets(dwarfinfo)
+
+    if processes is None:
+        processes = os.cpu_count()
+
+    if processes == 1 or len(cu_offsets) <= 1:
+        objects = collect_dies(dwarfinfo=dwarfinfo, cu_offsets=cu_offsets)
+        tables = [build_symbol_table(dwarfinfo=dwarfinfo, objects=objects)]
+    else:
+        # a few groups per process even out the differing unit sizes
+        groups = split_evenly(cu_offsets, count=processes * 4)
+
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=processes,
+            initializer=_initialize_worker,
+            initargs=(filename,),
+        ) as executor:
+            tables = list(executor.map(_build_partial_symbol_table, groups))
+
+    result = resolve_symbol_tables(tables)
 
     logging.debug("Finished processing file: {}".format(filename))
 
     return result
 
 
+def split_evenly(sequence, count):
+    count = min(count, len(sequence))
+    size, remainder = divmod(len(sequence), count)
+
+    groups = []
+    start = 0
+    for i in range(count):
+        end = start + size + (1 if i < remainder else 0)
+        groups.append(sequence[start:end])
+        start = end
+
+    return groups
+
+
+@click.command()
+@click.option(
+    "--binary",
+    type=click.Path(dir_okay=False, exists=True),
+    required=True,
+    help=".out file to process",
+)
+@click.option(
+    "--processes",
+    type=int,
+    default=None,
+    help="Size of the process pool, one per CPU when omitted",
+)
+def benchmark(binary, processes):
+    """Compare the wall time of serial and parallel DWARF processing."""
+
+    if processes is None:
+        processes = os.cpu_count()
+
+    results = {}
+    for count in (1, processes):
+        start = time.perf_counter()
+        names, variables, _ = process_file(filename=binary, processes=count)
+        elapsed = time.perf_counter() - start
+
+        results[count] = summarize_symbols(names=names, variables=variables)
+        click.echo(
+            "{} process(es): {:.2f} s, {} variables, {} names".format(
+                count, elapsed, len(variables), len(names)
+            )
+        )
+
+    serial, parallel = results[1], results[processes]
+    differing = [
+        kind
+        for kind, serial_items, parallel_items in zip(
+            ("names", "variables"), serial, parallel
+        )
+        if serial_items != parallel_items
+    ]
+    if len(differing) > 0:
+        raise click.ClickException(
+            "Serial and parallel results differ in: {}".format(", ".join(differing))
+        )
+
+
+def summarize_symbols(names, variables):
+    """Reduce a symbol table to comparable `(names, variables)` lists
+    holding the sorted names and each variable's name, address and type
+    name.
+    """
+
+    # None is a valid name for anonymous types and doesn't sort with str
+    return (
+        sorted(names, key=repr),
+        sorted(
+            (
+                (variable.name, variable.address, type_name(variable))
+                for variable in variables
+            ),
+            key=repr,
+        ),
+    )
+
+
+# bump when the stored classes change in a way old caches can't satisfy
+cache_version = 2
+
+
+def default_cache_directory():
+    return pathlib.Path(appdirs.user_cache_dir("Epyq", "EPC Power")) / "symbols"
+
+
+def file_hash(filename):
+    hash = hashlib.sha256()
+
+    with open(filename, "rb") as f:
+        for block in iter(functools.partial(f.read, 2 ** 20), b""):
+            hash.update(block)
+
+    return hash.hexdigest()
+
+
+def cache_path(filename, cache_directory=None):
+    if cache_directory is None:
+        cache_directory = default_cache_directory()
+
+    return pathlib.Path(cache_directory) / "{}-{}.pickle".format(
+        file_hash(filename), cache_version
+    )
+
+
+def process_file_cached(filename, cache_directory=None):
+    """Equivalent to `process_file()` but the result is stored in
+    `cache_directory` keyed by the hash of the file so that reopening the
+    same binary skips the DWARF processing.
+    """
+
+    path = cache_path(filename=filename, cache_directory=cache_directory)
+
+    try:
+        with open(path, "rb") as f:
+            result = load_symbols(f)
+    except FileNotFoundError:
+        pass
+    except Exception:
+        logger.exception("Ignoring unreadable symbol cache: {}".format(path))
+    else:
+        logger.debug("Loaded symbols for {} from {}".format(filename, path))
+        return result
+
+    result = process_file(filename=filename)
+
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        with tempfile.NamedTemporaryFile(
+            dir=path.parent, suffix=".partial", delete=False
+        ) as f:
+            temporary_path = pathlib.Path(f.name)
+
+            try:
+                dump_symbols(result, f)
+            except BaseException:
+                f.close()
+                temporary_path.unlink()
+                raise
+
+        os.replace(temporary_path, path)
+    except Exception:
+        logger.exception("Unable to store symbol cache: {}".format(path))
+
+    return result
+
+
+def symbol_nodes(result):
+    """The attrs instances, such as types and variables, reachable from
+    `result` through containers and the attributes of other instances.
+    """
+
+    nodes = []
+    seen = set()
+    remaining = [result]
+
+    while len(remaining) > 0:
+        item = remaining.pop()
+
+        if id(item) in seen:
+            continue
+
+        seen.add(id(item))
+
+        if attr.has(type(item)):
+            nodes.append(item)
+            remaining.extend(vars(item).values())
+        elif isinstance(item, dict):
+            remaining.extend(item.keys())
+            remaining.extend(item.values())
+        elif isinstance(item, (list, tuple, set, frozenset)):
+            remaining.extend(item)
+
+    return nodes
+
+
+def dump_symbols(result, file):
+    """Pickle `result` without recursing through the nested types.
+
+    Plain pickling follows each type into the types it refers to and can
+    exceed the recursion limit for deeply nested types.  Instead, the
+    classes of all instances are stored first and then the state of each
+    instance with references to the others replaced by their indexes.
+    """
+
+    nodes = symbol_nodes(result)
+    indexes = {id(node): i for i, node in enumerate(nodes)}
+
+    pickle.dump(
+        [type(node) for node in nodes],
+        file,
+        protocol=pickle.HIGHEST_PROTOCOL,
+    )
+
+    pickler = pickle.Pickler(file, protocol=pickle.HIGHEST_PROTOCOL)
+    pickler.persistent_id = lambda item: indexes.get(id(item))
+    pickler.dump(([vars(node) for node in nodes], result))
+
+
+def load_symbols(file):
+    """Load a result stored by `dump_symbols()`."""
+
+    nodes = [cls.__new__(cls) for cls in pickle.load(file)]
+
+    unpickler = pickle.Unpickler(file)
+    unpickler.persistent_load = nodes.__getitem__
+    states, result = unpickler.load()
+
+    for node, state in zip(nodes, states):
+        vars(node).update(state)
+
+    return result
+
+
 def testit(names, variables):
     def nonesorter(a):
         if a[0] is None:
@@ -1,19 +1,28 @@
 import collections
+import contextlib
 import csv
 import functools
 import io
+import os
+import pathlib
+import shutil
+import tempfile
 import textwrap
+import zipfile
 
 import attr
+import numpy
 import twisted.internet.defer
 import twisted.internet.task
 
 from PyQt5 import QtCore, QtWidgets
 
+import epyqlib.cmemoryparser
 import epyqlib.twisted.busproxy
 import epyqlib.twisted.cancalibrationprotocol as ccp
 import epyqlib.twisted.nvs
 import epyqlib.utils.qt
+import epyqlib.utils.twisted
 from epyqlib.tabs.files.log_manager import LogManager
 
 __copyright__ = "Copyright 2017, EPC Power Corp."
@@ -52,13 +61,28 @@ class DataLogger:
             protocol=self.nv_protocol, reactor=reactor, bus=self.bus
         )
 
-    def pull_raw_log(self, path):
+    def pull_raw_log(self, path, sinks=()):
+        """Pull the log into the raw file at `path`.  Blocks are written
+        as they are uploaded and also handed to each of `sinks` such as
+        `LogStream.feed()`.
+        """
+
         pull_fake_log = False
         if pull_fake_log:
             d = twisted.internet.defer.execute(self._pull_raw_log_fake)
+            d.addCallback(write_to_file, path=path)
         else:
-            d = self._pull_raw_log()
-        d.addCallback(write_to_file, path=path)
+            f = open(path, "wb")
+
+            def sink(block):
+                f.write(block)
+
+                for s in sinks:
+                    s(block)
+
+            d = self._pull_raw_log(sink=sink)
+            d.addBoth(epyqlib.utils.twisted.detour_result, f.close)
+
         d.addCallback(
             lambda _: twisted.internet.defer.ensureDeferred(
                 self._notify_new_raw_log(path)
@@ -97,7 +121,7 @@ class DataLogger:
         await LogManager.get_instance().add_pending_log(path, build_hash, serial_number)
 
     @twisted.internet.defer.inlineCallbacks
-    def _pull_raw_log(self):
+    def _pull_raw_log(self, sink=None):
         unsupported = UnsupportedError(
             "Pull of raw log is not supported for this device",
         )
@@ -149,6 +173,7 @@ class DataLogger:
             address=0,
             octets=readable_octets,
             progress=self.progress,
+            sink=sink,
         )
         yield self.ccp_protocol.disconnect(end_of_session=1)
 
@@ -227,17 +252,9 @@ def generate_records(
             path = ".".join(variable.path())
             value = variable.variable.unpack(data)
             type_ = variable.fields.type
-            scaling = 1
-            if type_ in scaling_cache:
-                scaling = scaling_cache[type_]
-            else:
-                if type_.startswith("_iq"):
-                    n = type_.lstrip("_iq")
-                    if n == "":
-                        n = 24
-                    else:
-                        n = int(n)
-                    scaling = 1 << n
+            scaling = scaling_cache.get(type_)
+            if scaling is None:
+                scaling = iq_scaling(type_)
                 scaling_cache[type_] = scaling
 
             row[path] = value / scaling
@@ -248,48 +265,587 @@ def generate_records(
             )
             cache.subscribe(partial, chunk)
 
-        for chunk in raw_chunks:
-            chunk_bytes = bytearray(data_stream.read(len(chunk)))
-            if len(chunk_bytes) != len(chunk):
-                text = (
-                    "Unexpected EOF found in the middle of a record.  "
-                    "Continuing with partially extracted log."
-                )
-                raise EOFError(text)
+        with cache.batch():
+            for chunk in raw_chunks:
+                chunk_bytes = bytearray(data_stream.read(len(chunk)))
+                if len(chunk_bytes) != len(chunk):
+                    text = (
+                        "Unexpected EOF found in the middle of a record.  "
+                        "Continuing with partially extracted log."
+                    )
+                    raise EOFError(text)
 
-            chunk.set_bytes(chunk_bytes)
-            cache.update(chunk)
+                chunk.set_bytes(chunk_bytes)
+                cache.update(chunk)
 
         cache.unsubscribe_all()
         yield row
 
 
+def iq_scaling(type_name):
+    if not type_name.startswith("_iq"):
+        return 1
+
+    n = type_name.lstrip("_iq")
+    if n == "":
+        n = 24
+    else:
+        n = int(n)
+
+    return 1 << n
+
+
+def big_endian_integers(data):
+    """Interpret each row of a 2D uint8 array as a big endian unsigned
+    integer of up to 64 bits.
+    """
+
+    rows, width = data.shape
+    padded = numpy.zeros((rows, 8), dtype=numpy.uint8)
+    padded[:, 8 - width :] = data
+
+    return padded.view(">u8")[:, 0].astype(numpy.uint64)
+
+
+def swap_words(data):
+    """Reverse the order of the target's words within each row, as
+    `epyqlib.cmemoryparser` does before unpacking.
+    """
+
+    word_bytes = epyqlib.cmemoryparser.bits_per_byte // 8
+    rows, width = data.shape
+
+    return data.reshape(rows, width // word_bytes, word_bytes)[:, ::-1, :].reshape(
+        rows, width
+    )
+
+
+def sign_extend(values, bits):
+    values = values.astype(numpy.int64)
+
+    if bits < 64:
+        sign = numpy.int64(1) << numpy.int64(bits - 1)
+        values = (values ^ sign) - sign
+
+    return values
+
+
+def swap_value_words(values, bits):
+    word_bits = epyqlib.cmemoryparser.bits_per_byte
+    words = bits // word_bits
+    mask = numpy.uint64((1 << word_bits) - 1)
+
+    swapped = numpy.zeros_like(values)
+    for i in range(words):
+        word = (values >> numpy.uint64(word_bits * i)) & mask
+        swapped |= word << numpy.uint64(word_bits * (words - 1 - i))
+
+    return swapped
+
+
+def decode_column(variable, data):
+    """Vectorized equivalent of `variable.unpack()` for each row of `data`.
+    Returns `None` for types that are not handled here.
+    """
+
+    base = epyqlib.cmemoryparser.base_type(variable)
+    rows, width = data.shape
+    word_bits = epyqlib.cmemoryparser.bits_per_byte
+
+    if isinstance(base, epyqlib.cmemoryparser.Type):
+        format = base.format
+        if format.is_integer():
+            signed = format.is_signed_integer()
+        elif format.is_floating_point():
+            signed = None
+        else:
+            return None
+    elif isinstance(
+        base,
+        (epyqlib.cmemoryparser.EnumerationType, epyqlib.cmemoryparser.PointerType),
+    ):
+        signed = False
+    else:
+        return None
+
+    if width > 8:
+        return None
+
+    bit_size = None
+    if isinstance(variable, epyqlib.cmemoryparser.StructMember):
+        bit_size = variable.bit_size
+
+    if bit_size is not None:
+        if signed is None:
+            return None
+
+        # bit fields are extracted before the words are swapped
+        shift = width * 8 - variable.bit_offset - bit_size
+        mask = numpy.uint64((1 << bit_size) - 1)
+        values = (big_endian_integers(data) >> numpy.uint64(shift)) & mask
+
+        if base.bytes > 1 and bit_size % word_bits == 0:
+            values = swap_value_words(values, bits=bit_size)
+
+        bits = bit_size
+    else:
+        if base.bytes > 1 and (width * 8) % word_bits == 0:
+            data = swap_words(data)
+
+        if signed is None:
+            types = {4: ">f4", 8: ">f8"}
+            if width not in types:
+                return None
+
+            return numpy.ascontiguousarray(data).view(types[width])[:, 0]
+
+        values = big_endian_integers(data)
+        bits = width * 8
+
+    if signed:
+        return sign_extend(values, bits=bits)
+
+    return values
+
+
+@attr.s
+class VariableLayout:
+    path = attr.ib()
+    variable = attr.ib()
+    offsets = attr.ib()
+    missing = attr.ib()
+    scaling = attr.ib()
+
+    def decode(self, records):
+        data = records[:, self.offsets]
+        if self.missing.any():
+            data[:, self.missing] = 0
+
+        values = decode_column(variable=self.variable, data=data)
+
+        if values is None:
+            values = numpy.array(
+                [self.variable.unpack(bytearray(row)) for row in data],
+                dtype=object,
+            )
+
+        return values / self.scaling
+
+
+@attr.s
+class RecordLayout:
+    """Where each logged variable is found in a record and how to decode
+    it, calculated once per log so that all records can be decoded together.
+    """
+
+    record_length = attr.ib()
+    variables = attr.ib()
+
+    @classmethod
+    def build(cls, raw_chunks, variables_and_chunks):
+        record_offsets = {}
+        record_length = 0
+        for raw_chunk in raw_chunks:
+            word_bytes = raw_chunk._bits_per_byte // 8
+
+            # later chunks win, as they would when updating the cache
+            for i, address in enumerate(raw_chunk.addresses()):
+                record_offsets[address] = record_length + i * word_bytes
+
+            record_length += len(raw_chunk)
+
+        variables = []
+        for node, chunk in variables_and_chunks.items():
+            word_bytes = chunk._bits_per_byte // 8
+
+            offsets = []
+            missing = []
+            for address in chunk.addresses():
+                offset = record_offsets.get(address)
+                for i in range(word_bytes):
+                    missing.append(offset is None)
+                    offsets.append(0 if offset is None else offset + i)
+
+            variables.append(
+                VariableLayout(
+                    path=".".join(node.path()),
+                    variable=node.variable,
+                    offsets=numpy.array(offsets, dtype=numpy.intp),
+                    missing=numpy.array(missing, dtype=bool),
+                    scaling=iq_scaling(node.fields.type),
+                )
+            )
+
+        return cls(record_length=record_length, variables=variables)
+
+    def decode(self, data, sample_period_us, first_record=0):
+        """Decode the complete records in `data` into columns keyed by
+        path.  Any trailing partial record is ignored.
+        """
+
+        count = len(data) // self.record_length
+        records = numpy.frombuffer(
+            data,
+            dtype=numpy.uint8,
+            count=count * self.record_length,
+        ).reshape(count, self.record_length)
+
+        timestamps = numpy.arange(first_record, first_record + count, dtype=numpy.int64)
+        columns = collections.OrderedDict()
+        columns[".time"] = timestamps * sample_period_us / 1000000
+
+        for variable in self.variables:
+            columns[variable.path] = variable.decode(records)
+
+        return columns
+
+
+default_records_per_group = 10000
+
+
+@attr.s
+class CsvLogWriter:
+    path = attr.ib()
+    _file = attr.ib(default=None, init=False)
+    _writer = attr.ib(default=None, init=False)
+    _fieldnames = attr.ib(default=None, init=False)
+
+    def __attrs_post_init__(self):
+        self._file = open(self.path, "w", newline="")
+        self._writer = csv.writer(self._file)
+
+    def write(self, columns):
+        if len(columns[".time"]) == 0:
+            return
+
+        if self._fieldnames is None:
+            self._fieldnames = sorted(columns.keys(), key=str.casefold)
+            self._writer.writerow(self._fieldnames)
+
+        self._writer.writerows(
+            zip(*(columns[name].tolist() for name in self._fieldnames))
+        )
+
+    def close(self):
+        self._file.close()
+
+
+@attr.s
+class NpzColumn:
+    file = attr.ib()
+    dtype = attr.ib()
+    length = attr.ib(default=0)
+
+
+@attr.s
+class NpzLogWriter:
+    """Write one array per variable to a NumPy `.npz` file.
+
+    Row groups are appended to a temporary file per column and only
+    assembled into the archive on close, so memory use is independent of
+    the log length.
+    """
+
+    path = attr.ib()
+    _directory = attr.ib(factory=tempfile.TemporaryDirectory, init=False)
+    _columns = attr.ib(factory=collections.OrderedDict, init=False)
+    _closed = attr.ib(default=False, init=False)
+
+    def write(self, columns):
+        for name, values in columns.items():
+            if values.dtype == object:
+                values = values.astype(numpy.float64)
+
+            column = self._columns.get(name)
+            if column is None:
+                column = NpzColumn(
+                    file=open(
+                        os.path.join(self._directory.name, str(len(self._columns))),
+                        "w+b",
+                    ),
+                    dtype=values.dtype,
+                )
+                self._columns[name] = column
+
+            column.file.write(numpy.ascontiguousarray(values, dtype=column.dtype))
+            column.length += len(values)
+
+    def close(self):
+        if self._closed:
+            return
+
+        self._closed = True
+
+        try:
+            with zipfile.ZipFile(self.path, "w", allowZip64=True) as archive:
+                for name, column in self._columns.items():
+                    column.file.seek(0)
+                    with archive.open(name + ".npy", "w", force_zip64=True) as f:
+                        numpy.lib.format.write_array_header_1_0(
+                            f,
+                            {
+                                "descr": numpy.lib.format.dtype_to_descr(column.dtype),
+                                "fortran_order": False,
+                                "shape": (column.length,),
+                            },
+                        )
+                        shutil.copyfileobj(column.file, f)
+        finally:
+            for column in self._columns.values():
+                column.file.close()
+            self._directory.cleanup()
+
+
+@attr.s
+class ParquetLogWriter:
+    """Write row groups to a Parquet file, requires pyarrow.  Small writes
+    are collected until there are `rows_per_group` rows.
+    """
+
+    path = attr.ib()
+    rows_per_group = attr.ib(default=default_records_per_group)
+    _writer = attr.ib(default=None, init=False)
+    _pending = attr.ib(factory=list, init=False)
+    _pending_rows = attr.ib(default=0, init=False)
+    _closed = attr.ib(default=False, init=False)
+
+    def write(self, columns):
+        self._pending.append(columns)
+        self._pending_rows += len(columns[".time"])
+
+        if self._pending_rows >= self.rows_per_group:
+            self._flush()
+
+    def _flush(self):
+        if self._pending_rows == 0:
+            return
+
+        pending = self._pending
+        self._pending = []
+        self._pending_rows = 0
+
+        self._write(
+            collections.OrderedDict(
+                (name, numpy.concatenate([columns[name] for columns in pending]))
+                for name in pending[0]
+            )
+        )
+
+    def _write(self, columns):
+        import pyarrow
+        import pyarrow.parquet
+
+        names = list(columns.keys())
+        table = pyarrow.Table.from_arrays(
+            [
+                pyarrow.array(
+                    values.astype(numpy.float64) if values.dtype == object else values
+                )
+                for values in columns.values()
+            ],
+            names=names,
+        )
+
+        if self._writer is None:
+            self._writer = pyarrow.parquet.ParquetWriter(
+                os.fspath(self.path), table.schema
+            )
+
+        self._writer.write_table(table)
+
+    def close(self):
+        if self._closed:
+            return
+
+        self._closed = True
+        self._flush()
+
+        if self._writer is not None:
+            self._writer.close()
+
+
+def parquet_available():
+    try:
+        import pyarrow.parquet
+    except ImportError:
+        return False
+
+    return True
+
+
+log_writers = {
+    ".csv": CsvLogWriter,
+    ".npz": NpzLogWriter,
+    ".parquet": ParquetLogWriter,
+}
+
+
+def output_filters():
+    filters = [("CSV", ["csv"]), ("NumPy", ["npz"])]
+
+    if parquet_available():
+        filters.append(("Parquet", ["parquet"]))
+
+    filters.append(("All Files", ["*"]))
+
+    return filters
+
+
+def log_writer(path):
+    suffix = pathlib.Path(path).suffix.casefold()
+
+    try:
+        writer_class = log_writers[suffix]
+    except KeyError:
+        raise UnsupportedError(
+            "Unsupported log output type: {}".format(suffix)
+        ) from None
+
+    if writer_class is ParquetLogWriter and not parquet_available():
+        raise UnsupportedError("Parquet output requires pyarrow")
+
+    return writer_class(path=path)
+
+
+@contextlib.contextmanager
+def open_log_writer(path):
+    writer = log_writer(path=path)
+    try:
+        yield writer
+    finally:
+        writer.close()
+
+
 def parse_log(
     cache,
     chunks,
-    csv_path,
+    path,
     data_stream,
     variables_and_chunks,
     sample_period_us,
     raw_chunks,
+    records_per_group=default_records_per_group,
 ):
-    with open(csv_path, "w", newline="") as f:
-        writer = None
-
-        records = generate_records(
-            cache=cache,
-            chunks=chunks,
-            data_stream=data_stream,
-            variables_and_chunks=variables_and_chunks,
-            sample_period_us=sample_period_us,
-            raw_chunks=raw_chunks,
+    layout = RecordLayout.build(
+        raw_chunks=raw_chunks,
+        variables_and_chunks=variables_and_chunks,
+    )
+
+    if layout.record_length == 0:
+        raise UnsupportedError("No logged chunks to decode")
+
+    group_length = layout.record_length * records_per_group
+    first_record = 0
+
+    with open_log_writer(path=path) as writer:
+        while True:
+            data = data_stream.read(group_length)
+            columns = layout.decode(
+                data=data,
+                sample_period_us=sample_period_us,
+                first_record=first_record,
+            )
+            writer.write(columns)
+            first_record += len(columns[".time"])
+
+            if len(data) < group_length:
+                break
+
+    if len(data) % layout.record_length != 0:
+        text = (
+            "Unexpected EOF found in the middle of a record.  "
+            "Continuing with partially extracted log."
         )
+        raise EOFError(text)
+
+
+@attr.s
+class LogStreamFormat:
+    layout = attr.ib()
+    sample_period_us = attr.ib()
 
-        for row in records:
-            if writer is None:
-                writer = csv.DictWriter(
-                    f, fieldnames=sorted(row.keys(), key=str.casefold)
-                )
-                writer.writeheader()
 
-            writer.writerow(row)
+@attr.s
+class LogStream:
+    """Decode a raw log as it is fed in, such as block by block while it is
+    being pulled from the device.  Only the block header and a trailing
+    partial record are retained between calls to `feed()`.
+
+    `configure` is called with the raw block header once it has been
+    received and must return a `LogStreamFormat`.  Decoded columns are
+    written to `writer`, if any, and emitted via `records_decoded`.
+
+    Errors while decoding do not propagate out of `feed()` so that the
+    raw log can still be pulled completely.  Decoding stops and the error
+    is raised from `close()` for a complete log instead.
+    """
+
+    header_length = attr.ib()
+    configure = attr.ib()
+    writer = attr.ib(default=None)
+    format = attr.ib(default=None, init=False)
+    records = attr.ib(default=0, init=False)
+    error = attr.ib(default=None, init=False)
+    _buffer = attr.ib(factory=bytearray, init=False)
+
+    records_decoded = epyqlib.utils.qt.Signal(object)
+
+    def feed(self, block):
+        if self.error is not None:
+            return
+
+        try:
+            self._feed(block)
+        except Exception as e:
+            self.error = e
+            self._buffer.clear()
+
+    def _feed(self, block):
+        self._buffer.extend(block)
+
+        if self.format is None:
+            if len(self._buffer) < self.header_length:
+                return
+
+            raw_header = bytes(self._buffer[: self.header_length])
+            del self._buffer[: self.header_length]
+            self.format = self.configure(raw_header)
+
+        record_length = self.format.layout.record_length
+        complete = len(self._buffer) - len(self._buffer) % record_length
+        if complete == 0:
+            return
+
+        columns = self.format.layout.decode(
+            data=bytes(self._buffer[:complete]),
+            sample_period_us=self.format.sample_period_us,
+            first_record=self.records,
+        )
+        del self._buffer[:complete]
+        self.records += len(columns[".time"])
+
+        if self.writer is not None:
+            self.writer.write(columns)
+
+        self.records_decoded.emit(columns)
+
+    def close(self, complete=True):
+        """Close the writer and, if the log is expected to be `complete`,
+        check that it did not end part way through a record.
+        """
+
+        if self.writer is not None:
+            self.writer.close()
+
+        if not complete:
+            return
+
+        if self.error is not None:
+            raise self.error
+
+        if self.format is None or len(self._buffer) > 0:
+            text = (
+                "Unexpected EOF found in the middle of a record.  "
+                "Continuing with partially extracted log."
+            )
+            raise EOFError(text)
@@ -83,6 +83,10 @@ __copyright__ = "Copyright 2018, EPC Power Corp."
 __license__ = "GPLv2+"
 
 
+# times per second that views of received values are updated
+live_refresh_rate = 20
+
+
 class CancelError(Exception):
     pass
 
@@ -683,6 +687,7 @@ class Device:
             rx = epyqlib.txrx.TxRx(tx=False, neo=neo_rx)
             notifiees.append(rx)
             rx_model = epyqlib.txrx.TxRxModel(rx)
+            rx_model.set_refresh_rate(live_refresh_rate)
 
             # TODO: put this all in the model...
             rx.changed.connect(rx_model.changed)
@@ -706,6 +711,7 @@ class Device:
 
             tx = epyqlib.txrx.TxRx(tx=True, neo=neo_tx, bus=self.bus)
             tx_model = epyqlib.txrx.TxRxModel(tx)
+            tx_model.set_refresh_rate(live_refresh_rate)
             tx.changed.connect(tx_model.changed)
 
         # TODO: something with sets instead?
@@ -778,6 +784,7 @@ class Device:
                 access_level_path=access_level_path,
                 access_password_path=access_password_path,
                 serial_number_uuid=serial_number_uuid,
+                protocol_window=int(self.raw_dict.get("nv_protocol_window", 1)),
             )
 
             default_metas = [
@@ -835,6 +842,7 @@ class Device:
             self.nv_views = self.ui.findChildren(epyqlib.nvview.NvView)
             if len(self.nv_views) > 0:
                 nv_model = epyqlib.nv.NvModel(self.nvs)
+                nv_model.set_refresh_rate(live_refresh_rate)
                 self.nvs.changed.connect(nv_model.changed)
 
                 self.first_nv_view = self.nv_views[0]
@@ -1322,6 +1330,9 @@ class FrameTimeout(epyqlib.canneo.QtCanListener):
     def start(self):
         self._lost()
 
+    def arbitration_ids(self):
+        return self.frame.arbitration_ids()
+
     def message_received(self, msg):
         if not self.frame.message_received(msg):
             return
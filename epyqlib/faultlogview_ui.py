@@ -0,0 +1,33 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'faultlogview.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.9
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+class Ui_Form(object):
+    def setupUi(self, Form):
+        Form.setObjectName("Form")
+        Form.resize(619, 590)
+        self.gridLayout = QtWidgets.QGridLayout(Form)
+        self.gridLayout.setObjectName("gridLayout")
+        self.tree_view = QtWidgets.QTreeView(Form)
+        self.tree_view.setObjectName("tree_view")
+        self.gridLayout.addWidget(self.tree_view, 1, 0, 1, 1)
+        self.clear_button = QtWidgets.QPushButton(Form)
+        self.clear_button.setObjectName("clear_button")
+        self.gridLayout.addWidget(self.clear_button, 0, 0, 1, 1)
+
+        self.retranslateUi(Form)
+        QtCore.QMetaObject.connectSlotsByName(Form)
+
+    def retranslateUi(self, Form):
+        _translate = QtCore.QCoreApplication.translate
+        Form.setWindowTitle(_translate("Form", "Form"))
+        self.clear_button.setText(_translate("Form", "Clear"))
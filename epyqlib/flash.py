@@ -50,7 +50,7 @@ class Flasher(QObject):
         )
 
         coff = epyqlib.ticoff.Coff()
-        coff.from_stream(file)
+        coff.from_stream(file, memory_map=True)
 
         self.retries = retries
 
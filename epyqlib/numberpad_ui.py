@@ -0,0 +1,243 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'numberpad.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.9
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+class Ui_Form(object):
+    def setupUi(self, Form):
+        Form.setObjectName("Form")
+        Form.resize(832, 363)
+        self.gridLayout = QtWidgets.QGridLayout(Form)
+        self.gridLayout.setObjectName("gridLayout")
+        self.edit = QtWidgets.QLineEdit(Form)
+        self.edit.setAlignment(
+            QtCore.Qt.AlignRight | QtCore.Qt.AlignTrailing | QtCore.Qt.AlignVCenter
+        )
+        self.edit.setObjectName("edit")
+        self.gridLayout.addWidget(self.edit, 1, 2, 1, 4)
+        self.button_decimal = QtWidgets.QPushButton(Form)
+        sizePolicy = QtWidgets.QSizePolicy(
+            QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Minimum
+        )
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(
+            self.button_decimal.sizePolicy().hasHeightForWidth()
+        )
+        self.button_decimal.setSizePolicy(sizePolicy)
+        self.button_decimal.setObjectName("button_decimal")
+        self.gridLayout.addWidget(self.button_decimal, 4, 5, 1, 1)
+        self.button_0 = QtWidgets.QPushButton(Form)
+        sizePolicy = QtWidgets.QSizePolicy(
+            QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Minimum
+        )
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.button_0.sizePolicy().hasHeightForWidth())
+        self.button_0.setSizePolicy(sizePolicy)
+        self.button_0.setObjectName("button_0")
+        self.gridLayout.addWidget(self.button_0, 5, 5, 1, 1)
+        self.accept_button = QtWidgets.QPushButton(Form)
+        sizePolicy = QtWidgets.QSizePolicy(
+            QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Minimum
+        )
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(
+            self.accept_button.sizePolicy().hasHeightForWidth()
+        )
+        self.accept_button.setSizePolicy(sizePolicy)
+        font = QtGui.QFont()
+        font.setFamily("FontAwesome")
+        self.accept_button.setFont(font)
+        self.accept_button.setObjectName("accept_button")
+        self.gridLayout.addWidget(self.accept_button, 3, 6, 1, 1)
+        self.button_backspace = QtWidgets.QPushButton(Form)
+        sizePolicy = QtWidgets.QSizePolicy(
+            QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Minimum
+        )
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(
+            self.button_backspace.sizePolicy().hasHeightForWidth()
+        )
+        self.button_backspace.setSizePolicy(sizePolicy)
+        font = QtGui.QFont()
+        font.setFamily("FontAwesome")
+        self.button_backspace.setFont(font)
+        self.button_backspace.setObjectName("button_backspace")
+        self.gridLayout.addWidget(self.button_backspace, 1, 6, 1, 1)
+        self.button_1 = QtWidgets.QPushButton(Form)
+        sizePolicy = QtWidgets.QSizePolicy(
+            QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Minimum
+        )
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.button_1.sizePolicy().hasHeightForWidth())
+        self.button_1.setSizePolicy(sizePolicy)
+        self.button_1.setObjectName("button_1")
+        self.gridLayout.addWidget(self.button_1, 3, 2, 1, 1)
+        self.button_2 = QtWidgets.QPushButton(Form)
+        sizePolicy = QtWidgets.QSizePolicy(
+            QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Minimum
+        )
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.button_2.sizePolicy().hasHeightForWidth())
+        self.button_2.setSizePolicy(sizePolicy)
+        self.button_2.setObjectName("button_2")
+        self.gridLayout.addWidget(self.button_2, 3, 3, 1, 1)
+        self.button_6 = QtWidgets.QPushButton(Form)
+        sizePolicy = QtWidgets.QSizePolicy(
+            QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Minimum
+        )
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.button_6.sizePolicy().hasHeightForWidth())
+        self.button_6.setSizePolicy(sizePolicy)
+        self.button_6.setObjectName("button_6")
+        self.gridLayout.addWidget(self.button_6, 4, 4, 1, 1)
+        self.button_4 = QtWidgets.QPushButton(Form)
+        sizePolicy = QtWidgets.QSizePolicy(
+            QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Minimum
+        )
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.button_4.sizePolicy().hasHeightForWidth())
+        self.button_4.setSizePolicy(sizePolicy)
+        self.button_4.setObjectName("button_4")
+        self.gridLayout.addWidget(self.button_4, 4, 2, 1, 1)
+        self.button_3 = QtWidgets.QPushButton(Form)
+        sizePolicy = QtWidgets.QSizePolicy(
+            QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Minimum
+        )
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.button_3.sizePolicy().hasHeightForWidth())
+        self.button_3.setSizePolicy(sizePolicy)
+        self.button_3.setObjectName("button_3")
+        self.gridLayout.addWidget(self.button_3, 3, 4, 1, 1)
+        self.label = QtWidgets.QLabel(Form)
+        self.label.setAlignment(QtCore.Qt.AlignCenter)
+        self.label.setObjectName("label")
+        self.gridLayout.addWidget(self.label, 0, 1, 1, 6)
+        self.button_8 = QtWidgets.QPushButton(Form)
+        sizePolicy = QtWidgets.QSizePolicy(
+            QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Minimum
+        )
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.button_8.sizePolicy().hasHeightForWidth())
+        self.button_8.setSizePolicy(sizePolicy)
+        self.button_8.setObjectName("button_8")
+        self.gridLayout.addWidget(self.button_8, 5, 3, 1, 1)
+        self.up_button = QtWidgets.QPushButton(Form)
+        sizePolicy = QtWidgets.QSizePolicy(
+            QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Minimum
+        )
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.up_button.sizePolicy().hasHeightForWidth())
+        self.up_button.setSizePolicy(sizePolicy)
+        font = QtGui.QFont()
+        font.setFamily("FontAwesome")
+        self.up_button.setFont(font)
+        self.up_button.setObjectName("up_button")
+        self.gridLayout.addWidget(self.up_button, 1, 1, 1, 1)
+        self.button_7 = QtWidgets.QPushButton(Form)
+        sizePolicy = QtWidgets.QSizePolicy(
+            QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Minimum
+        )
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.button_7.sizePolicy().hasHeightForWidth())
+        self.button_7.setSizePolicy(sizePolicy)
+        self.button_7.setObjectName("button_7")
+        self.gridLayout.addWidget(self.button_7, 5, 2, 1, 1)
+        spacerItem = QtWidgets.QSpacerItem(
+            0, 0, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum
+        )
+        self.gridLayout.addItem(spacerItem, 5, 7, 1, 1)
+        self.button_5 = QtWidgets.QPushButton(Form)
+        sizePolicy = QtWidgets.QSizePolicy(
+            QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Minimum
+        )
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.button_5.sizePolicy().hasHeightForWidth())
+        self.button_5.setSizePolicy(sizePolicy)
+        self.button_5.setObjectName("button_5")
+        self.gridLayout.addWidget(self.button_5, 4, 3, 1, 1)
+        self.button_9 = QtWidgets.QPushButton(Form)
+        sizePolicy = QtWidgets.QSizePolicy(
+            QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Minimum
+        )
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.button_9.sizePolicy().hasHeightForWidth())
+        self.button_9.setSizePolicy(sizePolicy)
+        self.button_9.setObjectName("button_9")
+        self.gridLayout.addWidget(self.button_9, 5, 4, 1, 1)
+        self.cancel_button = QtWidgets.QPushButton(Form)
+        sizePolicy = QtWidgets.QSizePolicy(
+            QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Minimum
+        )
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(
+            self.cancel_button.sizePolicy().hasHeightForWidth()
+        )
+        self.cancel_button.setSizePolicy(sizePolicy)
+        font = QtGui.QFont()
+        font.setFamily("FontAwesome")
+        self.cancel_button.setFont(font)
+        self.cancel_button.setObjectName("cancel_button")
+        self.gridLayout.addWidget(self.cancel_button, 5, 6, 1, 1)
+        self.line = QtWidgets.QFrame(Form)
+        self.line.setFrameShape(QtWidgets.QFrame.HLine)
+        self.line.setFrameShadow(QtWidgets.QFrame.Sunken)
+        self.line.setObjectName("line")
+        self.gridLayout.addWidget(self.line, 2, 2, 1, 4)
+        spacerItem1 = QtWidgets.QSpacerItem(
+            0, 0, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum
+        )
+        self.gridLayout.addItem(spacerItem1, 5, 0, 1, 1)
+        self.gridLayout.setColumnStretch(0, 1)
+        self.gridLayout.setColumnStretch(1, 1)
+        self.gridLayout.setColumnStretch(2, 1)
+        self.gridLayout.setColumnStretch(3, 1)
+        self.gridLayout.setColumnStretch(4, 1)
+        self.gridLayout.setColumnStretch(5, 1)
+        self.gridLayout.setColumnStretch(6, 1)
+        self.gridLayout.setColumnStretch(7, 1)
+
+        self.retranslateUi(Form)
+        QtCore.QMetaObject.connectSlotsByName(Form)
+
+    def retranslateUi(self, Form):
+        _translate = QtCore.QCoreApplication.translate
+        Form.setWindowTitle(_translate("Form", "Form"))
+        self.button_decimal.setText(_translate("Form", "."))
+        self.button_0.setText(_translate("Form", "0"))
+        self.accept_button.setText(_translate("Form", ""))
+        self.button_backspace.setText(_translate("Form", ""))
+        self.button_1.setText(_translate("Form", "1"))
+        self.button_2.setText(_translate("Form", "2"))
+        self.button_6.setText(_translate("Form", "6"))
+        self.button_4.setText(_translate("Form", "4"))
+        self.button_3.setText(_translate("Form", "3"))
+        self.label.setText(_translate("Form", "TextLabel"))
+        self.button_8.setText(_translate("Form", "8"))
+        self.up_button.setText(_translate("Form", ""))
+        self.button_7.setText(_translate("Form", "7"))
+        self.button_5.setText(_translate("Form", "5"))
+        self.button_9.setText(_translate("Form", "9"))
+        self.cancel_button.setText(_translate("Form", ""))
@@ -22,8 +22,10 @@ import epyqlib.utils.general
 import epyqlib.utils.qt
 import epyqlib.utils.twisted
 import functools
+import heapq
 import itertools
 import json
+import math
 import epyqlib.pyqabstractitemmodel
 from epyqlib.treenode import TreeNode
 from PyQt5.QtCore import Qt, QVariant, QModelIndex, pyqtSignal, pyqtSlot
@@ -199,6 +201,7 @@ class Nvs(TreeNode, epyqlib.canneo.QtCanListener):
         access_level_path=None,
         access_password_path=None,
         serial_number_uuid=None,
+        protocol_window=1,
         parent=None,
     ):
         TreeNode.__init__(self)
@@ -213,7 +216,7 @@ class Nvs(TreeNode, epyqlib.canneo.QtCanListener):
 
         from twisted.internet import reactor
 
-        self.protocol = epyqlib.twisted.nvs.Protocol()
+        self.protocol = epyqlib.twisted.nvs.Protocol(window=protocol_window)
         self.transport = epyqlib.twisted.busproxy.BusProxy(
             protocol=self.protocol, reactor=reactor, bus=bus
         )
@@ -241,6 +244,7 @@ class Nvs(TreeNode, epyqlib.canneo.QtCanListener):
             raise NoNv()
 
         self.set_frames = self.set_frames.multiplex_frames
+        self._nvs_by_uuid = None
         self.status_frames = [
             f for f in self.neo.frames if f.name == self.configuration.status_frame
         ][0].multiplex_frames
@@ -529,13 +533,16 @@ class Nvs(TreeNode, epyqlib.canneo.QtCanListener):
         return all
 
     def nv_from_uuid(self, uuid_):
-        [nv] = [
-            signal
-            for frame in self.neo.frames
-            for signal in frame.signals
-            if signal.parameter_uuid == uuid_
-            if signal.frame in self.set_frames.values()
-        ]
+        if self._nvs_by_uuid is None:
+            set_frames = {id(frame) for frame in self.set_frames.values()}
+            self._nvs_by_uuid = collections.defaultdict(list)
+
+            for frame in self.neo.frames:
+                for signal in frame.signals:
+                    if id(signal.frame) in set_frames:
+                        self._nvs_by_uuid[signal.parameter_uuid].append(signal)
+
+        [nv] = self._nvs_by_uuid.get(uuid_, [])
 
         return nv
 
@@ -595,10 +602,26 @@ class Nvs(TreeNode, epyqlib.canneo.QtCanListener):
             d = twisted.internet.defer.Deferred()
             d.callback(None)
 
+            # with a protocol window all requests are queued up front and
+            # pipelined, otherwise each waits for the previous response
+            pipelined = self.protocol.window > 1
+            requests = []
+
+            def add_request(request):
+                if pipelined:
+                    deferred = request()
+                    if callback is not None:
+                        deferred.addCallback(callback)
+                    requests.append(deferred)
+                else:
+                    d.addCallback(lambda _: request())
+                    if callback is not None:
+                        d.addCallback(callback)
+
             def handle_frame(frame, signals, enumerator):
                 if read:
-                    d.addCallback(
-                        lambda _, enumerator=enumerator: self.protocol.read_multiple(
+                    add_request(
+                        lambda enumerator=enumerator: self.protocol.read_multiple(
                             nv_signals=signals,
                             meta=enumerator,
                             priority=epyqlib.twisted.nvs.Priority.user,
@@ -623,8 +646,8 @@ class Nvs(TreeNode, epyqlib.canneo.QtCanListener):
                     if len(not_none_signals) == 0:
                         return
 
-                    d.addCallback(
-                        lambda _, enumerator=enumerator, not_none_signals=not_none_signals: self.protocol.write_multiple(
+                    add_request(
+                        lambda enumerator=enumerator, not_none_signals=not_none_signals: self.protocol.write_multiple(
                             nv_signals=not_none_signals,
                             meta=enumerator,
                             priority=epyqlib.twisted.nvs.Priority.user,
@@ -632,11 +655,6 @@ class Nvs(TreeNode, epyqlib.canneo.QtCanListener):
                             all_values=True,
                         )
                     )
-                else:
-                    return
-
-                if callback is not None:
-                    d.addCallback(callback)
 
             if only_these is None:
                 only_these = self.all_nv()
@@ -659,6 +677,16 @@ class Nvs(TreeNode, epyqlib.canneo.QtCanListener):
                         signals=signals,
                         enumerator=enumerator,
                     )
+
+            if len(requests) > 0:
+                d.addCallback(
+                    lambda _: twisted.internet.defer.gatherResults(
+                        requests,
+                        consumeErrors=True,
+                    )
+                )
+                d.addCallback(lambda results: results[-1])
+                d.addErrback(epyqlib.utils.twisted.unwrap_first_error)
         finally:
             if not background:
                 d.addCallback(
@@ -674,6 +702,10 @@ class Nvs(TreeNode, epyqlib.canneo.QtCanListener):
 
         return d
 
+    def arbitration_ids(self):
+        status_frame = self.status_frames[0]
+        return ((status_frame.id, status_frame.extended),)
+
     def message_received(self, msg):
         if (
             msg.arbitration_id == self.status_frames[0].id
@@ -767,7 +799,7 @@ class Nvs(TreeNode, epyqlib.canneo.QtCanListener):
             else:
                 continue
 
-            value_set.model.root.append_child(parameter)
+            value_set.root.append_child(parameter)
 
         return value_set
 
@@ -794,7 +826,7 @@ class Nvs(TreeNode, epyqlib.canneo.QtCanListener):
             )
 
     def from_value_set(self, value_set):
-        parameter_nodes = value_set.model.root.nodes_by_filter(
+        parameter_nodes = value_set.root.nodes_by_filter(
             filter=lambda node: isinstance(
                 node,
                 epyqlib.pm.valuesetmodel.Parameter,
@@ -969,14 +1001,149 @@ class Nvs(TreeNode, epyqlib.canneo.QtCanListener):
         self.cyclic_reader.cancel()
 
 
+@attr.s(eq=False)
+class PollEntry:
+    frame = attr.ib()
+    meta = attr.ib()
+    nvs = attr.ib()
+    interval = attr.ib()
+    due = attr.ib(default=0)
+    last = attr.ib(default=None)
+    values = attr.ib(default=None)
+    visible = attr.ib(default=False)
+    order = attr.ib(default=0)
+
+
+@attr.s
+class PollScheduler:
+    """Choose the next frame and meta to poll.
+
+    Each frame and meta pair is polled at its own interval.  The interval is
+    halved when the values change and doubled when they don't, within
+    `minimum_interval` and `maximum_interval`.  Visible pairs are polled at
+    least every `visible_interval` and take precedence once due.
+    """
+
+    minimum_interval = attr.ib(default=0.5)
+    maximum_interval = attr.ib(default=30)
+    visible_interval = attr.ib(default=1)
+    entries = attr.ib(factory=list)
+    _heap = attr.ib(factory=list, init=False)
+    _sequence = attr.ib(factory=itertools.count, init=False)
+    _visible_entries = attr.ib(factory=set, init=False)
+
+    @classmethod
+    def build(cls, nvs, metas, **kwargs):
+        scheduler = cls(**kwargs)
+
+        by_frame = collections.defaultdict(list)
+        for nv in nvs:
+            by_frame[nv.frame].append(nv)
+
+        for meta in metas:
+            for frame, frame_nvs in by_frame.items():
+                scheduler.add(
+                    PollEntry(
+                        frame=frame,
+                        meta=meta,
+                        nvs=frame_nvs,
+                        interval=scheduler.minimum_interval,
+                    )
+                )
+
+        return scheduler
+
+    def add(self, entry):
+        entry.order = len(self.entries)
+        self.entries.append(entry)
+        self._push(entry)
+
+    def _push(self, entry):
+        heapq.heappush(self._heap, (entry.due, next(self._sequence), entry))
+
+    def _effective_interval(self, entry):
+        if entry.visible:
+            return min(entry.interval, self.visible_interval)
+
+        return entry.interval
+
+    def set_visible(self, nvs, now):
+        frames = {nv.frame for nv in nvs}
+        visible_entries = {entry for entry in self.entries if entry.frame in frames}
+
+        changed = visible_entries ^ self._visible_entries
+        self._visible_entries = visible_entries
+
+        for entry in changed:
+            entry.visible = entry in visible_entries
+
+            if entry.last is not None and entry.due != math.inf:
+                entry.due = max(now, entry.last + self._effective_interval(entry))
+                self._push(entry)
+
+    def next(self, now):
+        """Return the entry to poll now, or `None` and the seconds until
+        one will be due.
+        """
+
+        due = [entry for entry in self._visible_entries if entry.due <= now]
+        if len(due) > 0:
+            entry = min(due, key=lambda entry: (entry.due, entry.order))
+            entry.due = math.inf
+
+            return entry, 0
+
+        while len(self._heap) > 0:
+            due, _, entry = self._heap[0]
+
+            if due != entry.due:
+                # superseded by a later push
+                heapq.heappop(self._heap)
+                continue
+
+            if due > now:
+                return None, due - now
+
+            heapq.heappop(self._heap)
+            # until polled() reschedules it
+            entry.due = math.inf
+
+            return entry, 0
+
+        return None, None
+
+    def polled(self, entry, values, now):
+        if values is not None:
+            if entry.values is not None:
+                if values == entry.values:
+                    entry.interval = min(self.maximum_interval, entry.interval * 2)
+                else:
+                    entry.interval = max(self.minimum_interval, entry.interval / 2)
+
+            entry.values = values
+
+        entry.last = now
+        entry.due = now + self._effective_interval(entry)
+        self._push(entry)
+
+
 @attr.s
 class CyclicReader:
     nvs = attr.ib()
     read_call = attr.ib()
     metas = attr.ib()
     pause_requests = attr.ib(factory=weakref.WeakSet)
+    visible_requests = attr.ib(factory=weakref.WeakKeyDictionary)
+    # the bus load budget for polling
+    reads_per_second = attr.ib(default=50)
+    clock = attr.ib(default=time.monotonic)
+    scheduler = attr.ib()
     _deferred = attr.ib(init=False, default=None)
 
+    @scheduler.default
+    def _(self):
+        return PollScheduler.build(nvs=self.nvs, metas=self.metas)
+
     def start(self):
         self._deferred = self._cyclic_read_all()
 
@@ -999,42 +1166,76 @@ class CyclicReader:
     def unpause(self, id):
         self.pause_requests.discard(id)
 
+    def set_visible(self, id, nvs):
+        """Record the NVs currently shown by `id` so they are polled more
+        often.
+        """
+
+        if len(nvs) == 0:
+            self.visible_requests.pop(id, None)
+        else:
+            self.visible_requests[id] = set(nvs)
+
+        self.scheduler.set_visible(
+            nvs=set().union(*self.visible_requests.values()),
+            now=self.clock(),
+        )
+
     @epyqlib.utils.twisted.ensure_deferred
     @epyqlib.utils.twisted.errback_dialog
     @epyqlib.utils.twisted.ignore_cancelled
     async def _cyclic_read_all(self):
-        x = collections.defaultdict(list)
-        for nv in self.nvs:
-            x[nv.frame].append(nv)
+        last_read = -math.inf
 
         while True:
-            for meta in self.metas:
-                for frame, nvs in x.items():
-                    try:
-                        while len(self.pause_requests) > 0:
-                            await epyqlib.utils.twisted.sleep(0.250)
-
-                        await epyqlib.utils.twisted.sleep(0.02)
-
-                        d, _ = await self.read_call(
-                            only_these=nvs,
-                            background=True,
-                            meta=(meta,),
-                        )
-                    except (
-                        epyqlib.twisted.nvs.CanceledError,
-                        epyqlib.twisted.nvs.SendFailedError,
-                    ):
-                        continue
+            while len(self.pause_requests) > 0:
+                await epyqlib.utils.twisted.sleep(0.250)
 
-                    # TODO: CAMPid 0347987975t427567139419439349
-                    for nv in nvs:
-                        if not nv.status_signal.write_only:
-                            value = d[nv.status_signal]
-                            nv.set_meta(value, meta=meta, check_range=False)
-                            nv.set_from_device(
-                                column=getattr(Columns.indexes, meta.name),
-                            )
+            now = self.clock()
+            entry, wait = self.scheduler.next(now=now)
+
+            if entry is None:
+                # check back in case something becomes visible
+                await epyqlib.utils.twisted.sleep(
+                    0.250 if wait is None else min(wait, 0.250),
+                )
+                continue
+
+            wait = last_read + 1 / self.reads_per_second - now
+            if wait > 0:
+                await epyqlib.utils.twisted.sleep(wait)
+
+            last_read = self.clock()
+            meta = entry.meta
+            nvs = entry.nvs
+
+            try:
+                d, _ = await self.read_call(
+                    only_these=nvs,
+                    background=True,
+                    meta=(meta,),
+                )
+            except (
+                epyqlib.twisted.nvs.CanceledError,
+                epyqlib.twisted.nvs.SendFailedError,
+            ):
+                self.scheduler.polled(entry=entry, values=None, now=self.clock())
+                continue
+
+            self.scheduler.polled(
+                entry=entry,
+                values=tuple(d.get(nv.status_signal) for nv in nvs),
+                now=self.clock(),
+            )
+
+            # TODO: CAMPid 0347987975t427567139419439349
+            for nv in nvs:
+                if not nv.status_signal.write_only:
+                    value = d[nv.status_signal]
+                    nv.set_meta(value, meta=meta, check_range=False)
+                    nv.set_from_device(
+                        column=getattr(Columns.indexes, meta.name),
+                    )
 
 
 class Nv(epyqlib.canneo.Signal, TreeNode):
@@ -1976,12 +2177,12 @@ class NvModel(epyqlib.pyqabstractitemmodel.PyQAbstractItemModel):
 
         drop_list = [
             parameter
-            for parameter in value_set.model.root.children
+            for parameter in value_set.root.children
             if (not parameter.writable or parameter.value is None)
         ]
 
         for parameter in drop_list:
-            value_set.model.root.remove_child(child=parameter)
+            value_set.root.remove_child(child=parameter)
 
         try:
             value_set.save()
@@ -2042,7 +2243,7 @@ class NvModel(epyqlib.pyqabstractitemmodel.PyQAbstractItemModel):
 
         value_set = epyqlib.pm.valuesetmodel.loadp(path)
 
-        parameter_nodes = value_set.model.root.nodes_by_filter(
+        parameter_nodes = value_set.root.nodes_by_filter(
             filter=lambda node: isinstance(
                 node,
                 epyqlib.pm.valuesetmodel.Parameter,
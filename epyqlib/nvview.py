@@ -189,9 +189,59 @@ class NvView(QtWidgets.QWidget):
 
         self.auth_key = None
 
+        # the visible parameters are polled more often so keep the cyclic
+        # reader informed, without recalculating on every scroll step
+        self.visible_timer = QtCore.QTimer()
+        self.visible_timer.setSingleShot(True)
+        self.visible_timer.setInterval(100)
+        self.visible_timer.timeout.connect(self.update_visible_nvs)
+
+        view.verticalScrollBar().valueChanged.connect(self.visible_timer.start)
+        view.expanded.connect(self.visible_timer.start)
+        view.collapsed.connect(self.visible_timer.start)
+
     def terminate(self):
+        self.visible_timer.stop()
         self.device = None
 
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.visible_timer.start()
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self.visible_timer.start()
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.visible_timer.start()
+
+    def visible_nvs(self):
+        if not self.isVisible():
+            return set()
+
+        view = self.ui.tree_view
+        height = view.viewport().height()
+
+        nvs = set()
+        index = view.indexAt(QtCore.QPoint(0, 0))
+        while index.isValid() and view.visualRect(index).top() < height:
+            model_index = epyqlib.utils.qt.resolve_index_to_model(index)
+            node = model_index.model().node_from_index(model_index)
+            if isinstance(node, epyqlib.nv.Nv):
+                nvs.add(node)
+
+            index = view.indexBelow(index)
+
+        return nvs
+
+    def update_visible_nvs(self):
+        model = self.nonproxy_model()
+        if model is None:
+            return
+
+        model.root.cyclic_reader.set_visible(self, self.visible_nvs())
+
     def configure_diff_proxy(self, proxy):
         self.diff_proxy = proxy
         self.diff_reference_column_changed(
@@ -646,6 +696,10 @@ class NvView(QtWidgets.QWidget):
         else:
             model.root.cyclic_reader.pause(self)
 
+        self.ui.tree_view.model().layoutChanged.connect(self.visible_timer.start)
+        self.ui.tree_view.model().modelReset.connect(self.visible_timer.start)
+        self.visible_timer.start()
+
     def update_diff_reference_columns(self):
         model = self.nonproxy_model()
 
@@ -1,6 +1,8 @@
 import collections
+import concurrent.futures
+import hashlib
+import json
 import os
-import math
 import pathlib
 
 import attr
@@ -76,32 +78,195 @@ class OverlayConfiguration:
     def recipe_overlay_pmvs_paths(self, recipe):
         return [self.reference_path / path for path in recipe.overlay_pmvs_paths]
 
-    def raw(self, echo=lambda *args, **kwargs: None):
-        input_modification_times = []
-        output_modification_times = []
+    def recipe_paths(self, recipe):
+        return RecipePaths(
+            output=self.recipe_output_path(recipe=recipe),
+            base=self.recipe_base_pmvs_path(recipe=recipe),
+            overlays=self.recipe_overlay_pmvs_paths(recipe=recipe),
+        )
+
+    def manifest_path(self):
+        return self.reference_path / self.output_path / ".valueset_recipes.json"
+
+    def load_manifest(self):
+        try:
+            return json.loads(self.manifest_path().read_text(encoding="utf-8"))
+        except (FileNotFoundError, ValueError):
+            return {}
+
+    def save_manifest(self, manifest):
+        path = self.manifest_path()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(manifest, indent=4, sort_keys=True) + "\n")
+
+    def manifest_key(self, recipe):
+        return recipe.output_path.as_posix()
+
+    def recipe_input_digest(self, recipe, hashes):
+        """A digest of the recipe and the content of its input files."""
+
+        relative_paths = [
+            recipe.output_path,
+            recipe.base_pmvs_path,
+            *recipe.overlay_pmvs_paths,
+        ]
 
-        input_modification_times.append(self.path.stat().st_mtime)
+        hash = hashlib.sha256()
+        hash.update(
+            json.dumps([path.as_posix() for path in relative_paths]).encode("utf-8")
+        )
+
+        paths = self.recipe_paths(recipe=recipe)
+        for path in [paths.base, *paths.overlays]:
+            hash.update(file_hash(path=path, hashes=hashes).encode("ascii"))
+
+        return hash.hexdigest()
+
+    def raw_recipes(self, manifest, hashes, echo=lambda *args, **kwargs: None):
+        """The recipes whose inputs changed since their output was cooked or
+        whose output is missing or was modified."""
+
+        raw = []
 
         for recipe in self.recipes:
             output_path = self.recipe_output_path(recipe=recipe)
             echo(f"Checking: {os.fspath(output_path)}")
 
-            try:
-                stat = output_path.stat()
-            except FileNotFoundError:
-                output_modification_time = -math.inf
-            else:
-                output_modification_time = stat.st_mtime
-            output_modification_times.append(output_modification_time)
+            entry = manifest.get(self.manifest_key(recipe=recipe))
+
+            if entry is None or not output_path.exists():
+                raw.append(recipe)
+            elif entry["inputs"] != self.recipe_input_digest(
+                recipe=recipe, hashes=hashes
+            ):
+                raw.append(recipe)
+            elif entry["output"] != file_hash(path=output_path, hashes=hashes):
+                raw.append(recipe)
+
+        return raw
+
+    def raw(self, echo=lambda *args, **kwargs: None):
+        raw_recipes = self.raw_recipes(
+            manifest=self.load_manifest(),
+            hashes={},
+            echo=echo,
+        )
+
+        return len(raw_recipes) > 0
+
+    def cook(self, recipes, jobs=1, echo=lambda *args, **kwargs: None):
+        """Cook the recipes, `jobs` at a time in a process pool if more than
+        one, and record them in the manifest."""
+
+        manifest = self.load_manifest()
+        hashes = {}
+
+        all_paths = []
+        input_digests = []
+        for recipe in recipes:
+            paths = self.recipe_paths(recipe=recipe)
+            all_paths.append(paths)
+            input_digests.append(
+                self.recipe_input_digest(recipe=recipe, hashes=hashes),
+            )
+
+            echo(f"Creating: {os.fspath(paths.output)}")
+            echo(
+                "\n".join(
+                    f"    {os.fspath(path)}" for path in [paths.base, *paths.overlays]
+                ),
+            )
+
+        if jobs == 1:
+            cache = ValueSetCache()
+            cooked = (cook(paths=paths, cache=cache) for paths in all_paths)
+            executor = None
+        else:
+            executor = concurrent.futures.ProcessPoolExecutor(
+                max_workers=jobs,
+                initializer=_initialize_worker,
+            )
+            cooked = executor.map(_cook_in_worker, all_paths)
+
+        try:
+            for recipe, input_digest, output_path in zip(
+                recipes, input_digests, cooked
+            ):
+                manifest[self.manifest_key(recipe=recipe)] = {
+                    "inputs": input_digest,
+                    "output": file_hash(path=output_path, hashes={}),
+                }
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+            self.save_manifest(manifest)
+
+
+@attr.s(frozen=True)
+class RecipePaths:
+    output = attr.ib()
+    base = attr.ib()
+    overlays = attr.ib()
+
 
-            overlay_pmvs_paths = self.recipe_overlay_pmvs_paths(recipe=recipe)
+def file_hash(path, hashes):
+    path = pathlib.Path(path).resolve()
 
-            for overlay_pmvs_path in overlay_pmvs_paths:
-                input_modification_times.append(
-                    overlay_pmvs_path.stat().st_mtime,
-                )
+    digest = hashes.get(path)
+    if digest is None:
+        digest = hashlib.sha256(path.read_bytes()).hexdigest()
+        hashes[path] = digest
 
-        return min(output_modification_times) < max(input_modification_times)
+    return digest
+
+
+@attr.s
+class ValueSetCache:
+    """Loaded value sets by path so that bases and overlays shared by
+    recipes are only loaded once.  The cached value sets are not to be
+    modified, `load_copy()` provides one that can be.
+    """
+
+    value_sets = attr.ib(default=attr.Factory(dict))
+
+    def load(self, path):
+        path = pathlib.Path(path).resolve()
+
+        value_set = self.value_sets.get(path)
+        if value_set is None:
+            value_set = epyqlib.pm.valuesetmodel.loadp(path)
+            self.value_sets[path] = value_set
+
+        return value_set
+
+    def load_copy(self, path):
+        return self.load(path).copy()
+
+
+def cook(paths, cache):
+    result_value_set = cache.load_copy(paths.base)
+
+    for path in paths.overlays:
+        result_value_set.overlay(cache.load(path))
+
+    paths.output.parent.mkdir(parents=True, exist_ok=True)
+    result_value_set.save(path=paths.output)
+
+    return paths.output
+
+
+_worker_cache = None
+
+
+def _initialize_worker():
+    global _worker_cache
+
+    _worker_cache = ValueSetCache()
+
+
+def _cook_in_worker(paths):
+    return cook(paths=paths, cache=_worker_cache)
 
 
 @click.group(name="value-sets")
@@ -143,7 +308,7 @@ def generate_recipes(value_set_path_strings, common_output_path_string):
 
     all_parameters_by_uuid = collections.defaultdict(list)
     for value_set in value_sets:
-        for parameter in value_set.model.root.children:
+        for parameter in value_set.root.children:
             all_parameters_by_uuid[parameter.parameter_uuid].append(parameter)
 
     common_uuids = [
@@ -169,7 +334,7 @@ def generate_recipes(value_set_path_strings, common_output_path_string):
             writable=reference_parameter.writable,
         )
 
-        common_value_set.model.root.append_child(new_parameter)
+        common_value_set.root.append_child(new_parameter)
 
     for value_set in value_sets:
         value_set.strip_common(reference=common_value_set)
@@ -191,43 +356,41 @@ def generate_recipes(value_set_path_strings, common_output_path_string):
     "--if-raw/--assume-raw",
     "only_if_raw",
     default=False,
+    help="Only cook recipes with changed inputs or outputs",
 )
-def cli(configuration_path_string, only_if_raw):
+@click.option(
+    "--jobs",
+    type=int,
+    default=1,
+    help="Recipes to cook in parallel, one per CPU when 0",
+)
+def cli(configuration_path_string, only_if_raw, jobs):
     configuration_path = pathlib.Path(configuration_path_string)
 
     configuration = OverlayConfiguration.load(configuration_path)
 
+    recipes = configuration.recipes
+
     if only_if_raw:
-        if not configuration.raw(echo=click.echo):
+        recipes = configuration.raw_recipes(
+            manifest=configuration.load_manifest(),
+            hashes={},
+            echo=click.echo,
+        )
+
+        if len(recipes) == 0:
             click.echo(
                 "Generated files appear to be up to date, skipping cooking",
             )
 
             return
 
-        click.echo("Generated files appear to be out of date, starting cooking")
-
-    for recipe in configuration.recipes:
-        output_path = configuration.recipe_output_path(recipe=recipe)
-        click.echo(f"Creating: {os.fspath(output_path)}")
-
-        base_pmvs_path = configuration.recipe_base_pmvs_path(recipe=recipe)
-
-        overlay_pmvs_paths = configuration.recipe_overlay_pmvs_paths(
-            recipe=recipe,
-        )
-
-        all_pmvs_paths = [base_pmvs_path, *overlay_pmvs_paths]
-
         click.echo(
-            "\n".join(f"    {os.fspath(path)}" for path in all_pmvs_paths),
+            f"{len(recipes)} of {len(configuration.recipes)} generated files"
+            f" appear to be out of date, starting cooking"
         )
 
-        result_value_set = epyqlib.pm.valuesetmodel.loadp(base_pmvs_path)
-
-        for path in overlay_pmvs_paths:
-            overlay_value_set = epyqlib.pm.valuesetmodel.loadp(path)
-            result_value_set.overlay(overlay_value_set)
+    if jobs == 0:
+        jobs = os.cpu_count()
 
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        result_value_set.save(path=output_path)
+    configuration.cook(recipes=recipes, jobs=jobs, echo=click.echo)
@@ -48,11 +48,9 @@ def _post_load(value_set, root=None):
     if root is None:
         root = Root()
 
-    if value_set.model is None:
-        value_set.model = epyqlib.attrsmodel.Model(
-            root=root,
-            columns=columns,
-        )
+    if value_set.root is None:
+        epyqlib.attrsmodel.check_uuids(root)
+        value_set.root = root
 
 
 def copy_parameter_data(
@@ -95,7 +93,7 @@ def copy_parameter_data(
                 if maximum is None:
                     maximum = calculated_maximum
 
-            value_set.model.root.append_child(
+            value_set.root.append_child(
                 Parameter(
                     name=name,
                     parameter_uuid=node.uuid,
@@ -105,7 +103,7 @@ def copy_parameter_data(
                 ),
             )
 
-            value_set.model.root.children.sort()
+            value_set.root.children.sort()
 
     if base_node is None:
         base_node = value_set.parameter_model.root
@@ -206,7 +204,7 @@ types = epyqlib.attrsmodel.Types(
 @attr.s
 class ValueSet:
     parameter_model = attr.ib(default=None)
-    model = attr.ib(default=None)
+    root = attr.ib(default=None)
     path = attr.ib(default=None)
     filters = attr.ib(
         default=(
@@ -214,6 +212,23 @@ class ValueSet:
             ("All Files", ["*"]),
         )
     )
+    _model = attr.ib(default=None, init=False, repr=False)
+
+    @property
+    def model(self):
+        """The Qt item model of the tree.  It is only built when first used
+        such as by a view so loading and saving alone stay headless."""
+
+        if self._model is None:
+            self._model = epyqlib.attrsmodel.Model(
+                root=self.root,
+                columns=columns,
+            )
+
+        return self._model
+
+    def parameter_by_parameter_uuid(self):
+        return {parameter.parameter_uuid: parameter for parameter in self.root.children}
 
     def save(self, path=None, parent=None):
         if path is None:
@@ -232,9 +247,9 @@ class ValueSet:
 
             self.path = pathlib.Path(path)
 
-        sorted_children = sorted(self.model.root.children)
+        sorted_children = sorted(self.root.children)
 
-        sorted_root = attr.evolve(self.model.root, children=sorted_children)
+        sorted_root = attr.evolve(self.root, children=sorted_children)
 
         s = graham.dumps(sorted_root, indent=4).data
 
@@ -244,6 +259,19 @@ class ValueSet:
             if not s.endswith("\n"):
                 f.write("\n")
 
+    def copy(self):
+        """A value set with copies of the parameters that can be modified
+        without affecting this one."""
+
+        root = Root(name=self.root.name, uuid=self.root.uuid)
+        for parameter in self.root.children:
+            root.append_child(attr.evolve(parameter))
+
+        value_set = ValueSet(parameter_model=self.parameter_model, path=self.path)
+        _post_load(value_set, root=root)
+
+        return value_set
+
     def overlay(self, overlay):
         attribute_names = [
             "value",
@@ -253,17 +281,14 @@ class ValueSet:
             "maximum",
         ]
 
-        parameter_from_parameter_uuid = {
-            parameter.parameter_uuid: parameter
-            for parameter in self.model.root.children
-        }
+        parameter_from_parameter_uuid = self.parameter_by_parameter_uuid()
 
-        for overlay_parameter in overlay.model.root.children:
+        for overlay_parameter in overlay.root.children:
             base_parameter = parameter_from_parameter_uuid.get(
                 overlay_parameter.parameter_uuid,
             )
             if base_parameter is None:
-                self.model.root.append_child(attr.evolve(overlay_parameter))
+                self.root.append_child(attr.evolve(overlay_parameter))
                 continue
 
             for name in attribute_names:
@@ -272,14 +297,11 @@ class ValueSet:
                     setattr(base_parameter, name, value)
 
     def strip_common(self, reference):
-        reference_parameter_by_uuid = {
-            parameter.parameter_uuid: parameter
-            for parameter in reference.model.root.children
-        }
+        reference_parameter_by_uuid = reference.parameter_by_parameter_uuid()
 
         drop_list = []
 
-        for output_parameter in self.model.root.children:
+        for output_parameter in self.root.children:
             reference_parameter = reference_parameter_by_uuid.get(
                 output_parameter.parameter_uuid,
             )
@@ -301,7 +323,7 @@ class ValueSet:
                 drop_list.append(output_parameter)
 
         for parameter in drop_list:
-            self.model.root.remove_child(child=parameter)
+            self.root.remove_child(child=parameter)
 
 
 # TODO: CAMPid 943896754217967154269254167
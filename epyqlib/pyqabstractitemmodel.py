@@ -2,8 +2,6 @@
 
 # TODO: """DocString if there is one"""
 
-import weakref
-
 from epyqlib.treenode import TreeNode
 import epyqlib.utils.qt
 from PyQt5.QtCore import (
@@ -11,6 +9,7 @@ from PyQt5.QtCore import (
     QAbstractItemModel,
     QVariant,
     QModelIndex,
+    QTimer,
     pyqtSignal,
     pyqtSlot,
 )
@@ -20,6 +19,17 @@ __copyright__ = "Copyright 2016, EPC Power Corp."
 __license__ = "GPLv2+"
 
 
+# key marking coalesced changes where one of them covered all roles
+all_roles = object()
+
+
+def role_list(roles):
+    if all_roles in roles:
+        return []
+
+    return list(roles)
+
+
 class PyQAbstractItemModel(QAbstractItemModel):
     root_changed = pyqtSignal(TreeNode)
 
@@ -34,6 +44,7 @@ class PyQAbstractItemModel(QAbstractItemModel):
         QAbstractItemModel.__init__(self, parent=parent)
 
         self.root = root
+        self.index_root()
         self.checkbox_columns = checkbox_columns
         self.editable_columns = editable_columns
 
@@ -42,7 +53,9 @@ class PyQAbstractItemModel(QAbstractItemModel):
         else:
             self.alignment = Qt.AlignTop | Qt.AlignLeft
 
-        self.index_from_node_cache = weakref.WeakKeyDictionary()
+        self.changed_timer = None
+        self.changed_cells = {}
+        self.changed_ranges = {}
 
         self.role_functions = {
             Qt.DisplayRole: self.data_display,
@@ -196,18 +209,10 @@ class PyQAbstractItemModel(QAbstractItemModel):
 
         parent = node.tree_parent
 
-        if parent in [None, self.root]:
+        if parent is None or parent is self.root:
             return QModelIndex()
 
-        grandparent = parent.tree_parent
-        if grandparent is None:
-            return QModelIndex()
-        row = grandparent.row_of_child(parent)
-
-        if row == -1:
-            raise Exception("row == -1")
-
-        return self.createIndex(row, 0, parent)
+        return self.index_from_node(parent)
 
     def node_from_index(self, index):
         if index.isValid():
@@ -215,26 +220,137 @@ class PyQAbstractItemModel(QAbstractItemModel):
         else:
             return self.root
 
+    def index_root(self):
+        # constant time rows for parent() and index_from_node() which
+        # views call for every visible item
+        if self.root is not None and self.root.tree_index is None:
+            self.root.build_index()
+
     def index_from_node(self, node):
         # TODO  make up another role for identification?
-        if node in self.index_from_node_cache:
-            index = self.index_from_node_cache[node]
-        else:
-            if node is self.root:
-                index = QModelIndex()
-            else:
-                index = self.index(
-                    row=node.tree_parent.row_of_child(node),
-                    column=0,
-                    parent=self.index_from_node(node.tree_parent),
-                )
+        if node is self.root:
+            return QModelIndex()
+
+        grandparent = node.tree_parent
+        if grandparent is None:
+            return QModelIndex()
 
-                self.index_from_node_cache[node] = index
+        row = grandparent.row_of_child(node)
 
-        return index
+        if row == -1:
+            raise Exception("row == -1")
+
+        return self.createIndex(row, 0, node)
 
     @pyqtSlot(TreeNode, int, TreeNode, int, list)
     def changed(self, start_node, start_column, end_node, end_column, roles):
+        if self.changed_timer is None:
+            self.emit_changed(start_node, start_column, end_node, end_column, roles)
+            return
+
+        if end_node is start_node:
+            _, columns, changed_roles = self.changed_cells.setdefault(
+                id(start_node),
+                (start_node, set(), {}),
+            )
+            columns.update(range(start_column, end_column + 1))
+        else:
+            *_, changed_roles = self.changed_ranges.setdefault(
+                (id(start_node), start_column, id(end_node), end_column),
+                (start_node, start_column, end_node, end_column, {}),
+            )
+
+        if len(roles) == 0:
+            # no roles means all roles so the union has to stay empty
+            changed_roles[all_roles] = None
+        else:
+            changed_roles.update(dict.fromkeys(roles))
+
+        if not self.changed_timer.isActive():
+            self.changed_timer.start()
+
+    def set_refresh_rate(self, refresh_rate):
+        """Collect the changes passed to `changed()` and emit them at most
+        `refresh_rate` times per second with a single `dataChanged` per
+        range of contiguous rows.  `None` emits each change immediately.
+        """
+
+        self.flush_changed()
+
+        if refresh_rate is None:
+            self.changed_timer = None
+            return
+
+        self.changed_timer = QTimer(self)
+        self.changed_timer.setSingleShot(True)
+        self.changed_timer.setInterval(round(1000 / refresh_rate))
+        self.changed_timer.timeout.connect(self.flush_changed)
+
+    def in_tree(self, node):
+        return node is self.root or any(
+            ancestor is self.root for ancestor in node.ancestors()
+        )
+
+    @pyqtSlot()
+    def flush_changed(self):
+        if self.changed_timer is not None:
+            self.changed_timer.stop()
+
+        cells, self.changed_cells = self.changed_cells, {}
+        ranges, self.changed_ranges = self.changed_ranges, {}
+
+        for start_node, start_column, end_node, end_column, roles in ranges.values():
+            if self.in_tree(start_node) and self.in_tree(end_node):
+                self.emit_changed(
+                    start_node, start_column, end_node, end_column, role_list(roles)
+                )
+
+        rows_by_parent = {}
+        for node, columns, roles in cells.values():
+            if node is self.root:
+                self.emit_changed(
+                    node, min(columns), node, max(columns), role_list(roles)
+                )
+                continue
+
+            parent = node.tree_parent
+            if parent is None:
+                continue
+
+            row = parent.row_of_child(node)
+            if row == -1:
+                continue
+
+            _, rows = rows_by_parent.setdefault(id(parent), (parent, {}))
+            rows[row] = (columns, roles)
+
+        for parent, rows in rows_by_parent.values():
+            # removed from the tree since the change
+            if not self.in_tree(parent):
+                continue
+
+            parent_index = self.index_from_node(parent)
+
+            runs = []
+            for row in sorted(rows):
+                if len(runs) > 0 and runs[-1][-1] == row - 1:
+                    runs[-1].append(row)
+                else:
+                    runs.append([row])
+
+            for run in runs:
+                columns = set().union(*(rows[row][0] for row in run))
+                roles = {}
+                for row in run:
+                    roles.update(rows[row][1])
+
+                self.dataChanged.emit(
+                    self.index(run[0], min(columns), parent_index),
+                    self.index(run[-1], max(columns), parent_index),
+                    role_list(roles),
+                )
+
+    def emit_changed(self, start_node, start_column, end_node, end_column, roles):
         start_index = self.index_from_node(start_node)
         start_row = start_index.row()
         start_parent = start_index.parent()
@@ -260,7 +376,6 @@ class PyQAbstractItemModel(QAbstractItemModel):
 
     @pyqtSlot()
     def end_insert_rows(self):
-        self.index_from_node_cache.clear()
         self.endInsertRows()
 
     @pyqtSlot(TreeNode, int, int)
@@ -269,13 +384,13 @@ class PyQAbstractItemModel(QAbstractItemModel):
 
     @pyqtSlot()
     def end_remove_rows(self):
-        self.index_from_node_cache.clear()
         self.endRemoveRows()
 
     @pyqtSlot()
     def set_root(self, root):
         self.beginResetModel()
         self.root = root
+        self.index_root()
         self.endResetModel()
         self.root_changed.emit(root)
 
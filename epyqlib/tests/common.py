@@ -4,9 +4,12 @@ import locale
 import os
 import pathlib
 import sys
+import uuid
 
 import attr
 
+import epyqlib.treenode
+
 
 library_path = pathlib.Path(__file__).parents[2].resolve()
 
@@ -133,3 +136,44 @@ def use_locale(*s):
     yield
 
     locale.setlocale(locale.LC_ALL, old)
+
+
+class Node(epyqlib.treenode.TreeNode):
+    def __init__(self, name):
+        super().__init__()
+
+        self.name = name
+        self.uuid = uuid.uuid4()
+        self.fields = [name]
+
+    def unique(self):
+        return self.name
+
+
+def build_tree(width, depth, name="root", indexed=False):
+    def build(name, depth):
+        node = Node(name=name)
+
+        if depth > 0:
+            for i in range(width):
+                node.append_child(build(name=f"{name}.{i}", depth=depth - 1))
+
+        return node
+
+    root = build(name=name, depth=depth)
+
+    if indexed:
+        root.build_index()
+
+    return root
+
+
+def all_nodes(root):
+    nodes = []
+    root.traverse(
+        call_this=lambda node, payload: payload.append(node),
+        payload=nodes,
+        internal_nodes=True,
+    )
+
+    return nodes
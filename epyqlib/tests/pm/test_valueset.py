@@ -0,0 +1,180 @@
+import decimal
+import json
+import time
+import uuid
+
+import click.testing
+import pytest
+
+import epyqlib.pm.valueset
+import epyqlib.pm.valuesetmodel
+
+
+def write_value_set(path, values):
+    value_set = epyqlib.pm.valuesetmodel.create_blank()
+
+    for parameter_uuid, value in values.items():
+        value_set.root.append_child(
+            epyqlib.pm.valuesetmodel.Parameter(
+                name=str(parameter_uuid),
+                value=decimal.Decimal(value),
+                parameter_uuid=parameter_uuid,
+            )
+        )
+
+    value_set.save(path=path)
+
+
+def values(path):
+    value_set = epyqlib.pm.valuesetmodel.loadp(path)
+
+    return {
+        parameter.parameter_uuid: parameter.value
+        for parameter in value_set.root.children
+    }
+
+
+@pytest.fixture
+def kitchen(tmp_path):
+    a, b, c = (uuid.uuid4() for _ in range(3))
+
+    write_value_set(tmp_path / "base.pmvs", {a: 1, b: 2})
+    write_value_set(tmp_path / "first.pmvs", {b: 20})
+    write_value_set(tmp_path / "second.pmvs", {c: 30})
+
+    recipes = {
+        "one.pmvs": ["first.pmvs"],
+        "two.pmvs": ["second.pmvs"],
+        "three.pmvs": ["first.pmvs", "second.pmvs"],
+    }
+
+    configuration_path = tmp_path / "recipes.json"
+    configuration_path.write_text(
+        json.dumps(
+            {
+                "_type": "valueset_overlay_configuration",
+                "output_path": "output",
+                "recipes": [
+                    {
+                        "_type": "valueset_overlay_recipe",
+                        "output_path": output,
+                        "base_pmvs_path": "base.pmvs",
+                        "overlay_pmvs_paths": overlays,
+                    }
+                    for output, overlays in recipes.items()
+                ],
+            }
+        )
+    )
+
+    return dict(
+        path=tmp_path,
+        configuration_path=configuration_path,
+        uuids=(a, b, c),
+    )
+
+
+def cook(configuration_path, *args):
+    result = click.testing.CliRunner().invoke(
+        epyqlib.pm.valueset.cli,
+        ["--configuration", str(configuration_path), *args],
+        catch_exceptions=False,
+    )
+    assert result.exit_code == 0
+
+    return [
+        line.split(":", 1)[1].strip()
+        for line in result.output.splitlines()
+        if line.startswith("Creating:")
+    ]
+
+
+@pytest.mark.parametrize("jobs", ["1", "2"])
+def test_cook(kitchen, jobs):
+    path = kitchen["path"]
+    a, b, c = kitchen["uuids"]
+
+    created = cook(kitchen["configuration_path"], "--if-raw", "--jobs", jobs)
+
+    assert len(created) == 3
+    assert values(path / "output" / "one.pmvs") == {a: 1, b: 20}
+    assert values(path / "output" / "two.pmvs") == {a: 1, b: 2, c: 30}
+    assert values(path / "output" / "three.pmvs") == {a: 1, b: 20, c: 30}
+
+    # the cached base was not modified by the overlays
+    assert values(path / "base.pmvs") == {a: 1, b: 2}
+
+
+def test_cook_only_raw(kitchen):
+    path = kitchen["path"]
+    configuration_path = kitchen["configuration_path"]
+    a, b, c = kitchen["uuids"]
+
+    cook(configuration_path, "--if-raw")
+    assert cook(configuration_path, "--if-raw") == []
+
+    write_value_set(path / "second.pmvs", {c: 31})
+    assert sorted(cook(configuration_path, "--if-raw")) == [
+        str(path / "output" / "three.pmvs"),
+        str(path / "output" / "two.pmvs"),
+    ]
+    assert values(path / "output" / "three.pmvs") == {a: 1, b: 20, c: 31}
+
+    (path / "output" / "one.pmvs").write_text("modified")
+    assert cook(configuration_path, "--if-raw") == [
+        str(path / "output" / "one.pmvs"),
+    ]
+
+    assert len(cook(configuration_path, "--assume-raw")) == 3
+
+
+def test_load_is_headless(tmp_path):
+    path = tmp_path / "values.pmvs"
+    parameter_uuid = uuid.uuid4()
+    write_value_set(path, {parameter_uuid: 7})
+
+    value_set = epyqlib.pm.valuesetmodel.loadp(path)
+
+    assert value_set._model is None
+    (parameter,) = value_set.root.children
+    assert value_set.parameter_by_parameter_uuid() == {parameter_uuid: parameter}
+
+    model = value_set.model
+
+    assert value_set.model is model
+    assert model.root is value_set.root
+    assert model.node_from_uuid(parameter.uuid) is parameter
+
+
+def test_uuid_lookup_after_save(tmp_path):
+    path = tmp_path / "values.pmvs"
+    write_value_set(path, {uuid.uuid4(): 7})
+
+    value_set = epyqlib.pm.valuesetmodel.loadp(path)
+    value_set.model
+    value_set.save(path=path)
+
+    (parameter,) = value_set.root.children
+    assert (
+        value_set.root.nodes_by_attribute(
+            attribute_value=parameter.uuid,
+            attribute_name="uuid",
+        )
+        == {parameter}
+    )
+
+
+@pytest.mark.skip("Just here for benchmarking to make sure it's not too slow")
+def test_benchmark_load(tmp_path):
+    path = tmp_path / "values.pmvs"
+    write_value_set(path, {uuid.uuid4(): i for i in range(5000)})
+
+    start = time.perf_counter()
+    value_set = epyqlib.pm.valuesetmodel.loadp(path)
+    elapsed = time.perf_counter() - start
+    print(f"Loading 5000 parameters took {elapsed:.2f}")
+
+    start = time.perf_counter()
+    value_set.model
+    elapsed = time.perf_counter() - start
+    print(f"Building the Qt model for them took {elapsed:.2f}")
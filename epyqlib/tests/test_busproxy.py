@@ -0,0 +1,192 @@
+import time
+
+import can
+import pytest
+
+import epyqlib.busproxy
+import epyqlib.canneo
+
+
+class Listener(epyqlib.canneo.QtCanListener):
+    def __init__(self, arbitration_ids=None):
+        super().__init__(receiver=self.message_received)
+
+        self._arbitration_ids = arbitration_ids
+        self.received = []
+
+    def arbitration_ids(self):
+        return self._arbitration_ids
+
+    def message_received(self, message):
+        self.received.append(message)
+
+
+def test_notifier_dispatches_by_arbitration_id(qtbot):
+    everything = Listener()
+    standard = Listener(arbitration_ids=[(0x123, False)])
+    extended = Listener(arbitration_ids=[(0x123, True), (0x456, True)])
+
+    notifier = epyqlib.busproxy.NotifierProxy(
+        bus=None,
+        listeners=[everything, standard],
+    )
+    notifier.add(extended)
+
+    messages = [
+        can.Message(arbitration_id=0x123, is_extended_id=False),
+        can.Message(arbitration_id=0x123, is_extended_id=True),
+        can.Message(arbitration_id=0x456, is_extended_id=True),
+        can.Message(arbitration_id=0x789, is_extended_id=True),
+    ]
+
+    for message in messages:
+        notifier.message_received(message)
+
+    assert everything.received == messages
+    assert standard.received == messages[:1]
+    assert extended.received == messages[1:3]
+
+    notifier.remove(extended)
+    notifier.discard(standard)
+    notifier.discard(standard)
+
+    for message in messages:
+        notifier.message_received(message)
+
+    assert everything.received == messages * 2
+    assert standard.received == messages[:1]
+    assert extended.received == messages[1:3]
+    assert notifier.listeners_by_arbitration_id == {}
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+def test_token_bucket_paces_after_burst():
+    clock = FakeClock()
+    bucket = epyqlib.busproxy.TokenBucket(rate=1000, burst=3, clock=clock)
+
+    delays = []
+    for _ in range(6):
+        delay = bucket.take()
+        delays.append(delay)
+        clock.sleep(delay)
+
+    assert delays == pytest.approx([0, 0, 0, 0.001, 0.001, 0.001])
+
+    clock.sleep(1)
+
+    assert [bucket.take() for _ in range(3)] == [0, 0, 0]
+
+
+def test_token_bucket_unlimited():
+    bucket = epyqlib.busproxy.TokenBucket(rate=None, clock=FakeClock())
+
+    assert [bucket.take() for _ in range(10)] == [0] * 10
+
+
+def virtual_bus_pair(channel):
+    sender = can.interface.Bus(bustype="virtual", channel=channel)
+    receiver = can.interface.Bus(bustype="virtual", channel=channel)
+
+    return sender, receiver
+
+
+def test_transmit_queue(qtbot):
+    real_bus, receiver = virtual_bus_pair(channel="test_transmit_queue")
+    bus = epyqlib.busproxy.BusProxy(bus=real_bus, transmit_rate=None)
+    transmitted = Listener()
+    bus.tx_notifier.add(transmitted)
+
+    messages = [
+        can.Message(arbitration_id=i, is_extended_id=False, data=[i])
+        for i in range(100)
+    ]
+    succeeded = []
+
+    try:
+        for message in messages:
+            assert bus.send(
+                message,
+                on_success=lambda message=message: succeeded.append(message),
+            )
+
+        qtbot.waitUntil(lambda: len(succeeded) == len(messages))
+
+        assert succeeded == messages
+        assert transmitted.received == messages
+        assert [receiver.recv(timeout=1).data[0] for _ in messages] == list(
+            range(len(messages))
+        )
+    finally:
+        bus.terminate()
+        receiver.shutdown()
+
+
+def test_transmit_queue_full(qtbot):
+    real_bus, receiver = virtual_bus_pair(channel="test_transmit_queue_full")
+    bus = epyqlib.busproxy.BusProxy(
+        bus=real_bus,
+        transmit_rate=1,
+        transmit_queue_size=2,
+    )
+
+    try:
+        results = [bus.send(can.Message(arbitration_id=1)) for _ in range(5)]
+    finally:
+        bus.terminate()
+        receiver.shutdown()
+
+    # one is taken by the worker and paced while the queue fills
+    assert results[:2] == [True, True]
+    assert results[-1] is False
+
+
+class FailingBus(can.BusABC):
+    def __init__(self):
+        super().__init__(channel="failing")
+        self.channel_info = "failing"
+
+    def send(self, msg, timeout=None):
+        raise can.CanError("transmit buffer full")
+
+    def _recv_internal(self, timeout):
+        time.sleep(timeout)
+        return None, False
+
+
+def test_transmit_failure_goes_offline(qtbot, monkeypatch):
+    monkeypatch.setitem(
+        can.interface.BACKENDS,
+        "failing",
+        (__name__, FailingBus.__name__),
+    )
+    bus = epyqlib.busproxy.BusProxy(bus=FailingBus())
+
+    with qtbot.waitSignal(bus.went_offline):
+        assert bus.send(can.Message(arbitration_id=1))
+
+    assert bus.bus is None
+
+
+def test_transmit_queue_refuses_after_failure(qtbot):
+    transmit_queue = epyqlib.busproxy.TransmitQueue(bus=FailingBus())
+    transmit_queue.start()
+
+    try:
+        with qtbot.waitSignal(transmit_queue.failed):
+            assert transmit_queue.put(can.Message(arbitration_id=1))
+
+        transmit_queue.thread.join(timeout=1)
+
+        assert transmit_queue.put(can.Message(arbitration_id=2)) is False
+    finally:
+        transmit_queue.stop(timeout=1)
@@ -0,0 +1,261 @@
+import collections
+import os
+import random
+import struct
+
+import canmatrix
+import canmatrix.formats
+import numpy
+import pytest
+
+import epyqlib.canneo
+import epyqlib.tests.common
+
+
+def build_frame(signals, size=8):
+    matrix_frame = canmatrix.Frame(
+        name="TestFrame",
+        arbitration_id=canmatrix.ArbitrationId(id=0x123, extended=False),
+        size=size,
+    )
+
+    for name, start_bit, signal_size, little_endian, signed, is_float in signals:
+        matrix_frame.add_signal(
+            canmatrix.Signal(
+                name=name,
+                start_bit=start_bit,
+                size=signal_size,
+                is_little_endian=little_endian,
+                is_signed=signed,
+                is_float=is_float,
+            )
+        )
+
+    return epyqlib.canneo.Frame(frame=matrix_frame, set_value_to_default=False)
+
+
+layouts = {
+    "little": [
+        ("a", 0, 4, True, False, False),
+        ("b", 4, 12, True, True, False),
+        ("c", 16, 16, True, True, False),
+        ("d", 32, 32, True, False, False),
+    ],
+    "big": [
+        ("a", 0, 3, False, False, False),
+        ("b", 3, 13, False, False, False),
+        ("c", 16, 16, False, True, False),
+        ("d", 32, 32, False, True, False),
+    ],
+    "mixed": [
+        ("a", 0, 8, True, False, False),
+        ("b", 8, 8, False, True, False),
+        ("c", 16, 1, True, False, False),
+        ("d", 17, 7, True, False, False),
+        ("e", 32, 32, True, False, False),
+    ],
+    "float": [
+        ("a", 0, 32, True, True, False),
+        ("b", 32, 32, True, False, True),
+    ],
+    "double": [
+        ("a", 0, 64, False, False, True),
+    ],
+}
+
+
+def random_value(signal, random):
+    if signal.signed and signal.signal_size % 8 == 0:
+        # the bitstring reference only handles negative values that
+        # fill whole bytes
+        return random.randrange(
+            -(1 << (signal.signal_size - 1)),
+            1 << (signal.signal_size - 1),
+        )
+
+    return random.randrange(
+        0,
+        1 << (signal.signal_size - (1 if signal.signed else 0)),
+    )
+
+
+@pytest.mark.parametrize("layout", ["little", "big", "mixed"])
+def test_codec_pack_matches_bitstrings(layout):
+    # the bitstring reference is unable to pack floats
+    frame = build_frame(layouts[layout])
+    r = random.Random(0)
+
+    for _ in range(200):
+        data = tuple(random_value(signal=s, random=r) for s in frame.signals)
+
+        expected = epyqlib.canneo.signals_to_bytes(frame.size, frame.signals, data)
+
+        assert frame.pack(data) == expected
+
+
+@pytest.mark.parametrize("layout", layouts)
+def test_codec_unpack_matches_bitstrings(layout):
+    frame = build_frame(layouts[layout])
+    r = random.Random(0)
+
+    for _ in range(200):
+        data = bytes(r.randrange(256) for _ in range(frame.size))
+
+        little, big = epyqlib.canneo.bytes_to_bitstrings(data)
+        expected = epyqlib.canneo.bitstring_to_signal_list(frame.signals, big, little)
+        unpacked = frame.unpack(data, only_return=True)
+
+        assert list(unpacked.values()) == pytest.approx(expected, nan_ok=True)
+
+
+def test_codec_negative_partial_byte():
+    frame = build_frame(layouts["little"])
+
+    data = (1, -2, -3, 4)
+    unpacked = frame.unpack(frame.pack(data), only_return=True)
+
+    assert tuple(unpacked.values()) == data
+
+
+def test_codec_overflow():
+    frame = build_frame(layouts["little"])
+
+    with pytest.raises(epyqlib.canneo.UnableToPackError):
+        frame.pack((1, 2, 3, 1 << 32))
+
+
+def test_codec_float():
+    frame = build_frame(layouts["float"])
+
+    payload = frame.pack((0, 1.5))
+
+    assert payload[4:] == struct.pack("<f", 1.5)
+    assert frame.unpack(payload, only_return=True)[frame.signals[-1]] == 1.5
+
+
+def test_codec_double():
+    frame = build_frame(layouts["double"])
+
+    payload = frame.pack((-2.25,))
+
+    assert payload == struct.pack(">d", -2.25)
+    assert frame.unpack(payload, only_return=True)[frame.signals[0]] == -2.25
+
+
+@pytest.fixture(scope="module")
+def neo():
+    (matrix,) = canmatrix.formats.loadp(
+        os.fspath(epyqlib.tests.common.symbol_files["customer"]),
+    ).values()
+
+    return epyqlib.canneo.Neo(matrix=matrix)
+
+
+def test_unpack_batch_matches_unpack(neo):
+    r = random.Random(0)
+    frames = [frame for frame in neo.frames if frame.mux_name is None]
+
+    timestamps = []
+    ids = []
+    payloads = []
+    expected = collections.defaultdict(list)
+
+    for timestamp in range(2000):
+        frame = r.choice(frames)
+        data = bytes(r.randrange(256) for _ in range(frame.size))
+
+        multiplex_frames = getattr(frame, "multiplex_frames", None)
+        if multiplex_frames is not None:
+            multiplex_value = r.choice(list(multiplex_frames))
+            frame = multiplex_frames[multiplex_value]
+            data = frame.codec().pack(
+                [multiplex_value] + [0] * (len(frame.signals) - 1)
+            )
+
+        timestamps.append(timestamp)
+        ids.append(frame.id)
+        payloads.append(list(data))
+
+        for signal, value in frame.unpack(data, only_return=True).items():
+            expected[signal].append((timestamp, value))
+
+    columns = neo.unpack_batch(timestamps=timestamps, ids=ids, payloads=payloads)
+
+    assert set(columns) == set(expected)
+
+    for signal, column in columns.items():
+        timestamps, values = zip(*expected[signal])
+        assert column.timestamps.tolist() == list(timestamps)
+        assert column.raw.tolist() == list(values)
+        assert column.scaled.tolist() == pytest.approx(
+            [float(signal.offset) + v * float(signal.factor) for v in values]
+        )
+
+
+def test_unpack_batch_extended():
+    matrix = canmatrix.CanMatrix()
+    for name, extended in [("Standard", False), ("Extended", True)]:
+        frame = canmatrix.Frame(
+            name=name,
+            arbitration_id=canmatrix.ArbitrationId(id=0x123, extended=extended),
+            size=8,
+        )
+        frame.add_signal(
+            canmatrix.Signal(
+                name=name,
+                start_bit=0,
+                size=8,
+                is_little_endian=True,
+                is_signed=False,
+            )
+        )
+        matrix.add_frame(frame)
+
+    neo = epyqlib.canneo.Neo(matrix=matrix)
+    standard = neo.frame_by_name("Standard").signals[0]
+    extended = neo.frame_by_name("Extended").signals[0]
+
+    columns = neo.unpack_batch(
+        timestamps=[0, 1, 2],
+        ids=[0x123, 0x123, 0x123],
+        payloads=[[1] + [0] * 7, [2] + [0] * 7, [3] + [0] * 7],
+        extended=[False, True, False],
+    )
+
+    assert set(columns) == {standard, extended}
+    assert columns[standard].timestamps.tolist() == [0, 2]
+    assert columns[standard].raw.tolist() == [1, 3]
+    assert columns[extended].timestamps.tolist() == [1]
+    assert columns[extended].raw.tolist() == [2]
+
+    # without the flags the shared id is ambiguous
+    assert neo.unpack_batch(timestamps=[0], ids=[0x123], payloads=[[1] * 8]) == {}
+
+
+@pytest.mark.parametrize("layout", layouts)
+def test_unpack_arrays_matches_unpack(layout):
+    frame = build_frame(layouts[layout])
+    r = random.Random(0)
+
+    payloads = [bytes(r.randrange(256) for _ in range(8)) for _ in range(200)]
+    little = numpy.frombuffer(b"".join(payloads), dtype="<u8").astype(numpy.uint64)
+    big = numpy.frombuffer(b"".join(payloads), dtype=">u8").astype(numpy.uint64)
+
+    arrays = frame.codec().unpack_arrays(little=little, big=big)
+
+    for payload, *values in zip(payloads, *arrays):
+        expected = frame.codec().unpack(payload)
+        assert [v.item() for v in values] == pytest.approx(expected, nan_ok=True)
+
+
+def test_frame_by_id(neo):
+    for frame in neo.frames:
+        if frame.mux_name is not None:
+            continue
+
+        assert neo.frame_by_id(frame.id) is frame
+        assert neo.frame_by_id(frame.id, extended=frame.extended) is frame
+        assert neo.frame_by_id(frame.id, extended=not frame.extended) is None
+        assert (frame.id, frame.extended) in neo.arbitration_ids()
+
+    assert neo.frame_by_id(0x1FFFFFFF, extended=True) is None
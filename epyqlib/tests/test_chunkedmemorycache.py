@@ -0,0 +1,153 @@
+import random
+
+import pytest
+
+import epyqlib.chunkedmemorycache
+import epyqlib.utils.general
+
+
+bits_per_byte = 16
+word_bytes = bits_per_byte // 8
+
+
+def random_cache(r, count=200, span=2000):
+    cache = epyqlib.chunkedmemorycache.Cache(bits_per_byte=bits_per_byte)
+
+    for i in range(count):
+        address = r.randrange(span)
+        # mostly small variables with the occasional large struct or array
+        size = r.choice([1, 1, 2, 2, 4, r.randrange(1, 300)])
+        cache.add(
+            cache.new_chunk(
+                address=address,
+                bytes=b"\x00" * size * word_bytes,
+                reference=i,
+            )
+        )
+
+    return cache
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_overlapping_chunks_matches_brute_force(seed):
+    r = random.Random(seed)
+    cache = random_cache(r=r)
+
+    for _ in range(200):
+        address = r.randrange(-10, 2100)
+        length = r.randrange(0, 50)
+
+        expected = {
+            chunk.reference
+            for chunk in cache._chunks
+            if chunk.overlaps_address_length(address=address, length=length)
+        }
+        overlapping = cache.overlapping_chunks(address=address, length=length)
+
+        assert {chunk.reference for chunk in overlapping} == expected
+
+
+def test_update_notifies_overlapping_subscribers():
+    cache = epyqlib.chunkedmemorycache.Cache(bits_per_byte=bits_per_byte)
+    chunks = [
+        cache.new_chunk(address=address, bytes=b"\x00" * size * word_bytes)
+        for address, size in [(0, 100), (10, 2), (12, 1), (50, 1), (100, 1)]
+    ]
+
+    updated = []
+    for i, chunk in enumerate(chunks):
+        cache.add(chunk)
+        cache.subscribe(
+            lambda data, i=i: updated.append((i, bytes(data))),
+            chunk,
+        )
+
+    update = cache.new_chunk(address=11, bytes=b"\x01\x02\x03\x04")
+    cache.update(update)
+
+    assert sorted(updated) == [
+        (0, b"\x00" * 22 + b"\x01\x02\x03\x04" + b"\x00" * 174),
+        (1, b"\x00\x00\x01\x02"),
+        (2, b"\x03\x04"),
+    ]
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_contiguous_chunks(seed):
+    r = random.Random(seed)
+    cache = random_cache(r=r, count=50)
+
+    addresses = sorted(
+        {address for chunk in cache._chunks for address in chunk.addresses()}
+    )
+    expected = [
+        (start, end + 1)
+        for start, end in epyqlib.utils.general.generate_ranges(addresses)
+    ]
+
+    assert [chunk.bounds() for chunk in cache.contiguous_chunks()] == expected
+
+
+def test_shared_matches_unshared():
+    r = random.Random(0)
+    caches = [random_cache(r=random.Random(1)) for _ in range(2)]
+    caches[1].shared = True
+
+    received = [{}, {}]
+    for cache, values in zip(caches, received):
+        for chunk in cache._chunks:
+            cache.subscribe(
+                lambda data, chunk=chunk.reference, values=values: values.__setitem__(
+                    chunk, bytes(data)
+                ),
+                chunk,
+            )
+
+    for _ in range(100):
+        address = r.randrange(-10, 2100)
+        data = bytes(r.randrange(256) for _ in range(r.randrange(1, 50) * word_bytes))
+
+        for cache in caches:
+            cache.update(cache.new_chunk(address=address, bytes=data))
+
+    assert received[0] == received[1]
+    assert [bytes(c._bytes) for c in caches[0]._chunks] == [
+        bytes(c._bytes) for c in caches[1]._chunks
+    ]
+    assert all(chunk.shared() for chunk in caches[1]._chunks)
+
+
+def test_shared_chunks_added_later_keep_values():
+    cache = epyqlib.chunkedmemorycache.Cache(bits_per_byte=bits_per_byte, shared=True)
+    first = cache.new_chunk(address=0, bytes=b"\x00" * 4 * word_bytes)
+    cache.add(first)
+    cache.update(cache.new_chunk(address=0, bytes=b"\x01\x02\x03\x04"))
+
+    second = cache.new_chunk(address=1, bytes=b"\x00" * 4 * word_bytes)
+    cache.add(second)
+    cache.update(cache.new_chunk(address=4, bytes=b"\x05\x06"))
+
+    assert bytes(first._bytes) == b"\x01\x02\x03\x04" + b"\x00" * 4
+    assert bytes(second._bytes) == b"\x03\x04" + b"\x00" * 4 + b"\x05\x06"
+
+
+@pytest.mark.parametrize("shared", [False, True])
+def test_batch_notifies_once(shared):
+    cache = epyqlib.chunkedmemorycache.Cache(bits_per_byte=bits_per_byte, shared=shared)
+    chunk = cache.new_chunk(address=0, bytes=b"\x00" * 10 * word_bytes)
+    cache.add(chunk)
+    cache.add(cache.new_chunk(address=20, bytes=b"\x00" * 10 * word_bytes))
+
+    updated = []
+    cache.subscribe(lambda data: updated.append(bytes(data)), chunk)
+    ranges = []
+    cache.subscribe_ranges(ranges.append)
+
+    with cache.batch():
+        for address in [0, 1, 2, 25]:
+            cache.update(cache.new_chunk(address=address, bytes=b"\xff\xff"))
+
+        assert updated == []
+
+    assert updated == [b"\xff" * 6 + b"\x00" * 14]
+    assert ranges == [[(0, 3), (25, 26)]]
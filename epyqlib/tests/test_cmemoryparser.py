@@ -1,4 +1,8 @@
+import collections
 import pathlib
+import random
+import struct
+import sys
 
 import pytest
 
@@ -17,3 +21,274 @@ outs = tuple(sorted((here / "outs").glob("*.out")))
 )
 def test_load(path):
     epyqlib.cmemoryparser.process_file(filename=path)
+
+
+@pytest.mark.parametrize(
+    argnames="path",
+    argvalues=outs,
+    ids=[out.name for out in outs],
+)
+def test_parallel_matches_serial(path):
+    serial_names, serial_variables, _ = epyqlib.cmemoryparser.process_file(
+        filename=path,
+    )
+    names, variables, _ = epyqlib.cmemoryparser.process_file(
+        filename=path,
+        processes=2,
+    )
+
+    assert variables == serial_variables
+    assert names == serial_names
+
+
+def test_resolve_across_tables():
+    cmp = epyqlib.cmemoryparser
+
+    int16 = integer(name="int", bytes=1, signed=True)
+    typedef = cmp.TypeDef(name="int16_t", type=(20, 10))
+    struct = cmp.Struct(name="Thing", bytes=1)
+    struct.members["a"] = cmp.StructMember(name="a", type=20, location=0)
+    variable = cmp.Variable(name="thing", type=40, address=0x100)
+    pointer = cmp.PointerType(type=30)
+
+    tables = [
+        {
+            "DW_TAG_variable": {50: variable},
+            "DW_TAG_pointer_type": {40: pointer},
+        },
+        {
+            "DW_TAG_base_type": {10: int16},
+            "DW_TAG_structure_type": {30: struct},
+            "DW_TAG_typedef": {20: typedef},
+        },
+    ]
+
+    names, variables, _ = cmp.resolve_symbol_tables(tables)
+
+    assert variables == [variable]
+    assert variable.type is pointer
+    assert pointer.type is struct
+    assert struct.members["a"].type is typedef
+    assert typedef.type is int16
+    assert names["Thing"] == [struct]
+
+
+@pytest.mark.parametrize("count", [1, 3, 4, 10])
+def test_split_evenly(count):
+    sequence = list(range(10))
+
+    groups = epyqlib.cmemoryparser.split_evenly(sequence, count=count)
+
+    assert [item for group in groups for item in group] == sequence
+    assert len(groups) == count
+    assert max(map(len, groups)) - min(map(len, groups)) <= 1
+
+
+def integer(name, bytes, signed):
+    return epyqlib.cmemoryparser.Type(
+        name=name,
+        bytes=bytes,
+        format=(
+            epyqlib.cmemoryparser.TypeFormats.signed
+            if signed
+            else epyqlib.cmemoryparser.TypeFormats.unsigned
+        ),
+    )
+
+
+def unpack_types():
+    cmp = epyqlib.cmemoryparser
+
+    int16 = integer(name="int", bytes=1, signed=True)
+    uint16 = integer(name="unsigned int", bytes=1, signed=False)
+    int32 = integer(name="long", bytes=2, signed=True)
+    uint32 = integer(name="unsigned long", bytes=2, signed=False)
+    int64 = integer(name="long long", bytes=4, signed=True)
+    float32 = cmp.Type(name="float", bytes=2, format=cmp.TypeFormats.float)
+    enumeration = cmp.EnumerationType(bytes=1, name="State")
+    pointer = cmp.PointerType(type=int16)
+    array = cmp.ArrayType(type=int32, bytes=6, dimensions=[3])
+
+    def members(*members):
+        return collections.OrderedDict((member.name, member) for member in members)
+
+    inner = cmp.Struct(
+        name="Inner",
+        bytes=6,
+        members=members(
+            cmp.StructMember(name="big", type=int64, location=0),
+            cmp.StructMember(name="small", type=uint16, location=4),
+            cmp.StructMember(
+                name="flag", type=uint16, location=5, bit_offset=15, bit_size=1
+            ),
+        ),
+    )
+
+    union = cmp.Union(
+        bytes=2,
+        name="Either",
+        members=members(
+            cmp.UnionMember(name="integer", type=uint32),
+            cmp.UnionMember(name="real", type=float32),
+        ),
+    )
+
+    outer = cmp.Struct(
+        name="Outer",
+        bytes=25,
+        members=members(
+            cmp.StructMember(name="a", type=int16, location=0),
+            cmp.StructMember(name="b", type=uint32, location=1),
+            cmp.StructMember(
+                name="x", type=uint16, location=3, bit_offset=0, bit_size=3
+            ),
+            cmp.StructMember(
+                name="y", type=int16, location=3, bit_offset=3, bit_size=5
+            ),
+            cmp.StructMember(
+                name="z", type=uint32, location=4, bit_offset=4, bit_size=20
+            ),
+            cmp.StructMember(
+                name="w", type=int32, location=4, bit_offset=24, bit_size=8
+            ),
+            cmp.StructMember(name="f", type=float32, location=6),
+            cmp.StructMember(name="e", type=enumeration, location=8),
+            cmp.StructMember(name="p", type=pointer, location=9),
+            cmp.StructMember(name="array", type=array, location=11),
+            cmp.StructMember(name="inner", type=inner, location=17),
+            cmp.StructMember(name="either", type=union, location=23),
+        ),
+    )
+
+    typedef = cmp.TypeDef(name="_iq20", type=int32)
+
+    return [
+        int16,
+        uint16,
+        int32,
+        uint32,
+        int64,
+        float32,
+        enumeration,
+        pointer,
+        array,
+        inner,
+        union,
+        outer,
+        typedef,
+        outer.members["z"],
+        outer.members["y"],
+        outer.members["b"],
+    ]
+
+
+@pytest.mark.parametrize(
+    argnames="type",
+    argvalues=unpack_types(),
+    ids=lambda type: type.name,
+)
+def test_compiled_unpack_matches_bits(type, monkeypatch):
+    r = random.Random(0)
+    size = epyqlib.cmemoryparser.base_type(type).bytes * 2
+    samples = [bytearray(r.randrange(256) for _ in range(size)) for _ in range(200)]
+
+    compiled = [type.unpack(sample) for sample in samples]
+    assert epyqlib.cmemoryparser.compiled_unpacker(type=type, data=samples[0])
+
+    monkeypatch.setattr(
+        epyqlib.cmemoryparser,
+        "compiled_unpacker",
+        lambda type, data: None,
+    )
+    expected = [type.unpack(bytearray(sample)) for sample in samples]
+
+    # repr() so that matching NaNs compare equal
+    assert repr(compiled) == repr(expected)
+
+
+def test_compiled_unpack_double():
+    # the bit string implementation does not support 64-bit floats
+    double = epyqlib.cmemoryparser.Type(
+        name="long double",
+        bytes=4,
+        format=epyqlib.cmemoryparser.TypeFormats.float,
+    )
+    data = struct.pack(">d", -1.25)
+    words = [data[i : i + 2] for i in range(0, len(data), 2)]
+
+    assert double.unpack(bytearray(b"".join(reversed(words)))) == -1.25
+
+
+def test_process_file_cached(tmp_path, monkeypatch):
+    binary = tmp_path / "binary.out"
+    binary.write_bytes(b"not really a binary")
+    cache_directory = tmp_path / "cache"
+
+    types = unpack_types()
+    variables = [
+        epyqlib.cmemoryparser.Variable(name=type.name, type=type, address=i)
+        for i, type in enumerate(types)
+    ]
+    names = collections.defaultdict(list)
+    for type in types:
+        names[type.name].append(type)
+
+    processed = []
+
+    def process_file(filename):
+        processed.append(filename)
+        return names, variables, 16
+
+    monkeypatch.setattr(epyqlib.cmemoryparser, "process_file", process_file)
+
+    first = epyqlib.cmemoryparser.process_file_cached(
+        filename=binary, cache_directory=cache_directory
+    )
+    second = epyqlib.cmemoryparser.process_file_cached(
+        filename=binary, cache_directory=cache_directory
+    )
+
+    assert processed == [binary]
+    assert first == second
+
+    loaded_names, loaded_variables, _ = second
+    assert loaded_variables[0].type is loaded_names[types[0].name][0]
+
+    binary.write_bytes(b"a different binary")
+    epyqlib.cmemoryparser.process_file_cached(
+        filename=binary, cache_directory=cache_directory
+    )
+
+    assert processed == [binary, binary]
+
+
+def test_symbols_dump_deeply_nested(tmp_path):
+    type = epyqlib.cmemoryparser.Type(
+        name="int", bytes=1, format=epyqlib.cmemoryparser.TypeFormats.signed
+    )
+    for i in range(5 * sys.getrecursionlimit()):
+        type = epyqlib.cmemoryparser.TypeDef(name="t{}".format(i), type=type)
+
+    variables = [epyqlib.cmemoryparser.Variable(name="a", type=type, address=0)]
+    names = {type.name: [type]}
+
+    path = tmp_path / "symbols.pickle"
+    with open(path, "wb") as f:
+        epyqlib.cmemoryparser.dump_symbols((names, variables, 16), f)
+
+    with open(path, "rb") as f:
+        (
+            loaded_names,
+            loaded_variables,
+            bits_per_byte,
+        ) = epyqlib.cmemoryparser.load_symbols(f)
+
+    assert bits_per_byte == 16
+    assert loaded_variables[0].type is loaded_names[type.name][0]
+    assert loaded_variables[0].name == "a"
+
+    loaded = loaded_variables[0].type
+    while isinstance(loaded, epyqlib.cmemoryparser.TypeDef):
+        loaded = loaded.type
+
+    assert loaded.name == "int"
@@ -0,0 +1,319 @@
+import csv
+import io
+import random
+
+import numpy
+import pytest
+
+import epyqlib.chunkedmemorycache
+import epyqlib.cmemoryparser as cmp
+import epyqlib.datalogger
+import epyqlib.variableselectionmodel
+
+
+bits_per_byte = 16
+word_bytes = bits_per_byte // 8
+
+
+def integer(name, bytes, signed):
+    return cmp.Type(
+        name=name,
+        bytes=bytes,
+        format=cmp.TypeFormats.signed if signed else cmp.TypeFormats.unsigned,
+    )
+
+
+def variable_nodes():
+    int16 = integer(name="int", bytes=1, signed=True)
+    uint32 = integer(name="unsigned long", bytes=2, signed=False)
+    int64 = integer(name="long long", bytes=4, signed=True)
+    float32 = cmp.Type(name="float", bytes=2, format=cmp.TypeFormats.float)
+    iq20 = cmp.TypeDef(name="_iq20", type=integer(name="long", bytes=2, signed=True))
+    enumeration = cmp.EnumerationType(bytes=1, name="State")
+
+    def node(name, type, address):
+        return epyqlib.variableselectionmodel.VariableNode(
+            variable=cmp.Variable(name=name, type=type, address=address),
+        )
+
+    def member(name, type, address, bit_offset, bit_size):
+        return epyqlib.variableselectionmodel.VariableNode(
+            variable=cmp.StructMember(
+                name=name,
+                type=type,
+                location=0,
+                bit_offset=bit_offset,
+                bit_size=bit_size,
+            ),
+            name=name,
+            address=address,
+        )
+
+    return [
+        node(name="a", type=int16, address=0x100),
+        node(name="B", type=uint32, address=0x101),
+        node(name="c", type=int64, address=0x103),
+        node(name="d", type=float32, address=0x200),
+        node(name="e", type=iq20, address=0x202),
+        node(name="f", type=enumeration, address=0x204),
+        member(name="g", type=int16, address=0x205, bit_offset=3, bit_size=5),
+        member(name="h", type=uint32, address=0x206, bit_offset=7, bit_size=16),
+    ]
+
+
+@pytest.fixture
+def log():
+    cache = epyqlib.chunkedmemorycache.Cache(bits_per_byte=bits_per_byte)
+    for node in variable_nodes():
+        cache.add(
+            cache.new_chunk(
+                address=node.address(),
+                bytes=b"\x00" * word_bytes * node.fields.size,
+                reference=node,
+            )
+        )
+
+    raw_chunks = [
+        cache.new_chunk(address=address, bytes=b"\x00" * word_bytes * size)
+        for address, size in [(0x100, 8), (0x200, 8)]
+    ]
+
+    return dict(
+        cache=cache,
+        chunks=cache.contiguous_chunks(),
+        variables_and_chunks={chunk.reference: chunk for chunk in cache._chunks},
+        sample_period_us=250,
+        raw_chunks=raw_chunks,
+    )
+
+
+def reference_csv(data, **log):
+    f = io.StringIO(newline="")
+    writer = None
+
+    records = epyqlib.datalogger.generate_records(
+        data_stream=io.BytesIO(data),
+        **log,
+    )
+
+    try:
+        for row in records:
+            if writer is None:
+                writer = csv.DictWriter(
+                    f, fieldnames=sorted(row.keys(), key=str.casefold)
+                )
+                writer.writeheader()
+
+            writer.writerow(row)
+    except EOFError:
+        pass
+
+    return f.getvalue()
+
+
+@pytest.mark.parametrize("partial", [False, True])
+def test_parse_log_matches_generate_records(log, tmp_path, partial):
+    r = random.Random(0)
+    record_length = sum(len(chunk) for chunk in log["raw_chunks"])
+    data = bytes(r.randrange(256) for _ in range(100 * record_length))
+    if partial:
+        data += b"\x00" * (record_length // 2)
+
+    expected = reference_csv(data=data, **log)
+
+    csv_path = tmp_path / "log.csv"
+
+    if partial:
+        with pytest.raises(EOFError):
+            epyqlib.datalogger.parse_log(
+                path=csv_path,
+                data_stream=io.BytesIO(data),
+                records_per_group=7,
+                **log,
+            )
+    else:
+        epyqlib.datalogger.parse_log(
+            path=csv_path,
+            data_stream=io.BytesIO(data),
+            records_per_group=7,
+            **log,
+        )
+
+    with open(csv_path, newline="") as f:
+        assert f.read() == expected
+
+
+def random_log_data(log, records):
+    r = random.Random(0)
+    record_length = sum(len(chunk) for chunk in log["raw_chunks"])
+
+    return bytes(r.randrange(256) for _ in range(records * record_length))
+
+
+def expected_columns(log, data):
+    layout = epyqlib.datalogger.RecordLayout.build(
+        raw_chunks=log["raw_chunks"],
+        variables_and_chunks=log["variables_and_chunks"],
+    )
+
+    return layout.decode(data=data, sample_period_us=log["sample_period_us"])
+
+
+def test_parse_log_npz(log, tmp_path):
+    data = random_log_data(log=log, records=100)
+    path = tmp_path / "log.npz"
+
+    epyqlib.datalogger.parse_log(
+        path=path,
+        data_stream=io.BytesIO(data),
+        records_per_group=7,
+        **log,
+    )
+
+    expected = expected_columns(log=log, data=data)
+
+    with numpy.load(path) as loaded:
+        assert set(loaded.files) == set(expected)
+
+        for name, values in expected.items():
+            assert loaded[name].tolist() == values.tolist()
+
+
+def test_parse_log_parquet(log, tmp_path):
+    pyarrow_parquet = pytest.importorskip("pyarrow.parquet")
+
+    data = random_log_data(log=log, records=100)
+    path = tmp_path / "log.parquet"
+
+    epyqlib.datalogger.parse_log(
+        path=path,
+        data_stream=io.BytesIO(data),
+        records_per_group=7,
+        **log,
+    )
+
+    expected = expected_columns(log=log, data=data)
+    table = pyarrow_parquet.read_table(str(path))
+
+    assert set(table.column_names) == set(expected)
+
+    for name, values in expected.items():
+        assert table.column(name).to_pylist() == values.tolist()
+
+
+def test_parse_log_unsupported_output(log, tmp_path):
+    with pytest.raises(epyqlib.datalogger.UnsupportedError):
+        epyqlib.datalogger.parse_log(
+            path=tmp_path / "log.xyz",
+            data_stream=io.BytesIO(b""),
+            **log,
+        )
+
+
+@pytest.mark.parametrize("partial", [False, True])
+def test_log_stream_matches_parse_log(log, tmp_path, qapp, partial):
+    header = b"\x12\x34" * 5
+    data = random_log_data(log=log, records=100)
+    raw = header + data
+    if partial:
+        raw += b"\x00"
+
+    def configure(raw_header):
+        assert raw_header == header
+
+        return epyqlib.datalogger.LogStreamFormat(
+            layout=epyqlib.datalogger.RecordLayout.build(
+                raw_chunks=log["raw_chunks"],
+                variables_and_chunks=log["variables_and_chunks"],
+            ),
+            sample_period_us=log["sample_period_us"],
+        )
+
+    path = tmp_path / "log.npz"
+    stream = epyqlib.datalogger.LogStream(
+        header_length=len(header),
+        configure=configure,
+        writer=epyqlib.datalogger.log_writer(path=path),
+    )
+
+    decoded = []
+    stream.records_decoded.connect(decoded.append)
+
+    r = random.Random(0)
+    remaining = raw
+    while len(remaining) > 0:
+        # the CCP upload hands over at most 255 bytes at a time
+        size = r.randrange(1, 256)
+        stream.feed(remaining[:size])
+        remaining = remaining[size:]
+
+    if partial:
+        with pytest.raises(EOFError):
+            stream.close()
+    else:
+        stream.close()
+
+    expected = expected_columns(log=log, data=data)
+
+    assert stream.records == 100
+    assert sum(len(columns[".time"]) for columns in decoded) == 100
+
+    with numpy.load(path) as loaded:
+        for name, values in expected.items():
+            assert loaded[name].tolist() == values.tolist()
+
+
+@pytest.mark.parametrize("suffix", [".csv", ".npz", ".parquet"])
+def test_log_writer_close_twice(log, tmp_path, suffix):
+    if suffix == ".parquet":
+        pytest.importorskip("pyarrow.parquet")
+
+    data = random_log_data(log=log, records=10)
+    path = tmp_path / ("log" + suffix)
+
+    writer = epyqlib.datalogger.log_writer(path=path)
+    writer.write(expected_columns(log=log, data=data))
+    writer.close()
+    written = path.read_bytes()
+    writer.close()
+
+    assert len(written) > 0
+    assert path.read_bytes() == written
+
+
+def test_parse_log_no_raw_chunks(log, tmp_path):
+    log["raw_chunks"] = []
+
+    with pytest.raises(epyqlib.datalogger.UnsupportedError):
+        epyqlib.datalogger.parse_log(
+            path=tmp_path / "log.csv",
+            data_stream=io.BytesIO(b"\x00" * 100),
+            **log,
+        )
+
+
+def test_output_filters_include_all_files():
+    assert epyqlib.datalogger.output_filters()[-1] == ("All Files", ["*"])
+
+
+class MismatchError(Exception):
+    pass
+
+
+@pytest.mark.parametrize("complete", [False, True])
+def test_log_stream_decode_error_deferred_to_close(qapp, complete):
+    def configure(raw_header):
+        raise MismatchError()
+
+    stream = epyqlib.datalogger.LogStream(header_length=2, configure=configure)
+
+    for block in [b"\x00", b"\x00\x00", b"\x00" * 10]:
+        stream.feed(block)
+
+    assert isinstance(stream.error, MismatchError)
+
+    if complete:
+        with pytest.raises(MismatchError):
+            stream.close()
+    else:
+        stream.close(complete=False)
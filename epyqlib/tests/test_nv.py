@@ -0,0 +1,89 @@
+import attr
+import pytest
+
+import epyqlib.nv
+
+
+@attr.s(eq=False)
+class Nv:
+    frame = attr.ib()
+
+
+def build_scheduler(frame_count=3, metas=(0, 1), **kwargs):
+    frames = ["frame {}".format(i) for i in range(frame_count)]
+    nvs = [Nv(frame=frame) for frame in frames for _ in range(2)]
+
+    scheduler = epyqlib.nv.PollScheduler.build(nvs=nvs, metas=metas, **kwargs)
+
+    return scheduler, frames, nvs
+
+
+def poll_all_due(scheduler, now, values=()):
+    polled = []
+
+    while True:
+        entry, _ = scheduler.next(now=now)
+        if entry is None:
+            return polled
+
+        polled.append((entry.frame, entry.meta))
+        scheduler.polled(entry=entry, values=values, now=now)
+
+
+def test_first_cycle_polls_everything_in_order():
+    scheduler, frames, nvs = build_scheduler()
+
+    assert poll_all_due(scheduler=scheduler, now=0) == [
+        (frame, meta) for meta in (0, 1) for frame in frames
+    ]
+
+    entry, wait = scheduler.next(now=0)
+    assert entry is None
+    assert wait == scheduler.minimum_interval
+
+
+@pytest.mark.parametrize("changes", [False, True])
+def test_interval_adapts_to_changes(changes):
+    scheduler, frames, nvs = build_scheduler(
+        frame_count=1,
+        metas=(0,),
+        minimum_interval=0.5,
+        maximum_interval=4,
+    )
+    (entry,) = scheduler.entries
+    entry.interval = 2
+
+    now = 0
+    for i in range(10):
+        now += entry.interval
+        polled, _ = scheduler.next(now=now)
+        assert polled is entry
+        scheduler.polled(entry=entry, values=(i if changes else 0,), now=now)
+
+    if changes:
+        assert entry.interval == scheduler.minimum_interval
+    else:
+        assert entry.interval == scheduler.maximum_interval
+
+
+def test_visible_polled_first_and_more_often():
+    scheduler, frames, nvs = build_scheduler(
+        minimum_interval=10,
+        maximum_interval=10,
+        visible_interval=1,
+    )
+
+    poll_all_due(scheduler=scheduler, now=0)
+
+    scheduler.set_visible(nvs=[nvs[-1]], now=0.5)
+
+    assert poll_all_due(scheduler=scheduler, now=0.5) == []
+    assert poll_all_due(scheduler=scheduler, now=1) == [
+        (frames[-1], 0),
+        (frames[-1], 1),
+    ]
+
+    scheduler.set_visible(nvs=[], now=1.5)
+
+    assert poll_all_due(scheduler=scheduler, now=5) == []
+    assert len(poll_all_due(scheduler=scheduler, now=11)) == len(frames) * 2
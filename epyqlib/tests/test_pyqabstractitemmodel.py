@@ -0,0 +1,202 @@
+import PyQt5.QtCore
+import PyQt5.QtTest
+import pytest
+
+import epyqlib.pyqabstractitemmodel
+import epyqlib.tests.common
+
+
+class Model(epyqlib.pyqabstractitemmodel.PyQAbstractItemModel):
+    headers = ["Name"]
+
+
+def check_indexes(model):
+    for node in epyqlib.tests.common.all_nodes(model.root):
+        index = model.index_from_node(node)
+
+        if node is model.root:
+            assert not index.isValid()
+            continue
+
+        assert model.node_from_index(index) is node
+        assert index.row() == node.tree_parent.row_of_child(node)
+        assert model.node_from_index(model.parent(index)) is node.tree_parent
+        assert model.index(index.row(), 0, model.parent(index)) == index
+
+
+def test_indexes_follow_structure(qapp):
+    root = epyqlib.tests.common.build_tree(width=4, depth=3)
+    model = Model(root=root)
+    tester = PyQt5.QtTest.QAbstractItemModelTester(
+        model,
+        PyQt5.QtTest.QAbstractItemModelTester.FailureReportingMode.Fatal,
+    )
+
+    check_indexes(model)
+
+    parent = root.children[2]
+    model.begin_insert_rows(parent, 1, 1)
+    parent.insert_child(
+        1, epyqlib.tests.common.build_tree(width=2, depth=1, name="inserted")
+    )
+    model.end_insert_rows()
+    check_indexes(model)
+
+    model.begin_remove_rows(root, 0, 0)
+    root.remove_child(row=0)
+    model.end_remove_rows()
+    check_indexes(model)
+
+    model.layoutAboutToBeChanged.emit()
+    parent.children.reverse()
+    model.layoutChanged.emit()
+    check_indexes(model)
+
+    model.set_root(parent)
+    check_indexes(model)
+
+
+def changed_ranges(model, emitted):
+    def cell(index):
+        return model.node_from_index(index), index.column()
+
+    return [
+        (cell(top_left), cell(bottom_right), roles)
+        for top_left, bottom_right, roles in emitted
+    ]
+
+
+def test_changed_coalesced(qapp):
+    root = epyqlib.tests.common.build_tree(width=6, depth=2)
+    model = Model(root=root)
+    model.set_refresh_rate(20)
+
+    emitted = []
+    model.dataChanged.connect(
+        lambda top_left, bottom_right, roles: emitted.append(
+            (top_left, bottom_right, roles)
+        )
+    )
+
+    parent = root.children[1]
+    a, b, c, d, e, f = parent.children
+    display = [PyQt5.QtCore.Qt.DisplayRole]
+    tool_tip = [PyQt5.QtCore.Qt.ToolTipRole]
+
+    model.changed(a, 0, a, 0, display)
+    model.changed(b, 2, b, 3, display)
+    model.changed(a, 1, a, 1, tool_tip)
+    model.changed(c, 0, c, 0, display)
+    model.changed(e, 0, e, 0, display)
+    model.changed(f, 0, f, 0, display)
+    parent.remove_child(child=f)
+
+    assert emitted == []
+    assert model.changed_timer.isActive()
+
+    model.flush_changed()
+
+    assert not model.changed_timer.isActive()
+    assert changed_ranges(model=model, emitted=emitted) == [
+        ((a, 0), (c, 3), display + tool_tip),
+        ((e, 0), (e, 0), display),
+    ]
+
+
+def test_changed_empty_roles_mean_all(qapp):
+    root = epyqlib.tests.common.build_tree(width=4, depth=2)
+    model = Model(root=root)
+    model.set_refresh_rate(20)
+
+    emitted = []
+    model.dataChanged.connect(
+        lambda top_left, bottom_right, roles: emitted.append(
+            (top_left, bottom_right, roles)
+        )
+    )
+
+    a, b, c, d = root.children[0].children
+    display = [PyQt5.QtCore.Qt.DisplayRole]
+
+    model.changed(a, 0, a, 0, display)
+    model.changed(b, 0, b, 0, [])
+    model.changed(d, 0, d, 0, display)
+    model.changed(root.children[1], 0, root.children[2], 0, [])
+    model.changed(root.children[1], 0, root.children[2], 0, display)
+    model.flush_changed()
+
+    assert changed_ranges(model=model, emitted=emitted) == [
+        ((root.children[1], 0), (root.children[2], 0), []),
+        ((a, 0), (b, 0), []),
+        ((d, 0), (d, 0), display),
+    ]
+
+
+def test_changed_emitted_by_timer(qtbot):
+    root = epyqlib.tests.common.build_tree(width=3, depth=2)
+    model = Model(root=root)
+    model.set_refresh_rate(20)
+    node = root.children[0].children[0]
+
+    with qtbot.waitSignal(model.dataChanged, timeout=1000) as blocker:
+        model.changed(node, 0, node, 0, [PyQt5.QtCore.Qt.DisplayRole])
+
+    top_left, bottom_right, roles = blocker.args
+    assert model.node_from_index(top_left) is node
+    assert bottom_right == top_left
+
+
+def test_changed_immediate_by_default(qapp):
+    root = epyqlib.tests.common.build_tree(width=3, depth=2)
+    model = Model(root=root)
+    node = root.children[2].children[1]
+
+    emitted = []
+    model.dataChanged.connect(
+        lambda top_left, bottom_right, roles: emitted.append(
+            (top_left, bottom_right, roles)
+        )
+    )
+
+    model.changed(node, 0, node, 0, [PyQt5.QtCore.Qt.DisplayRole])
+
+    assert changed_ranges(model=model, emitted=emitted) == [
+        ((node, 0), (node, 0), [PyQt5.QtCore.Qt.DisplayRole]),
+    ]
+
+
+@pytest.mark.skip("Just here for benchmarking to make sure it's not too slow")
+def test_scroll_and_filter_benchmark(qapp):
+    import time
+
+    # wide like the parameter frames of an nvview
+    root = epyqlib.tests.common.Node(name="root")
+    for i in range(2000):
+        root.append_child(
+            epyqlib.tests.common.build_tree(width=10, depth=1, name=f"root.{i}")
+        )
+
+    model = Model(root=root)
+    proxy = PyQt5.QtCore.QSortFilterProxyModel()
+    proxy.setSourceModel(model)
+    proxy.setRecursiveFilteringEnabled(True)
+
+    def scroll(model, parent=PyQt5.QtCore.QModelIndex()):
+        for row in range(model.rowCount(parent)):
+            index = model.index(row, 0, parent)
+            model.data(index, PyQt5.QtCore.Qt.DisplayRole)
+            model.parent(index)
+            scroll(model=model, parent=index)
+
+    start = time.perf_counter()
+    scroll(model=model)
+    scrolled = time.perf_counter()
+    proxy.setFilterFixedString(".1")
+    scroll(model=proxy)
+    filtered = time.perf_counter()
+
+    print(
+        f"{len(epyqlib.tests.common.all_nodes(root))} nodes,"
+        f" scroll: {scrolled - start:.3f}s,"
+        f" filter: {filtered - scrolled:.3f}s"
+    )
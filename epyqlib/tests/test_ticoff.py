@@ -0,0 +1,156 @@
+import io
+import struct
+
+import pytest
+
+import epyqlib.ticoff
+
+
+def build_coff():
+    strings = bytearray(b"\x00\x00\x00\x00")
+
+    def name(text):
+        encoded = text.encode("ascii")
+        if len(encoded) <= 8:
+            return encoded
+
+        offset = len(strings)
+        strings.extend(encoded + b"\x00")
+        return struct.pack("<2L", 0, offset)
+
+    header_size = struct.calcsize(epyqlib.ticoff.Coff.header_fmt)
+    optheader_size = struct.calcsize(epyqlib.ticoff.Coff.optheader_fmt)
+    section_size = struct.calcsize(epyqlib.ticoff.Section.section_fmt)
+
+    sections = [
+        # name, address, data
+        (".text", 0x3000, bytes(range(32))),
+        (".stack", 0x400, None),
+        (".debug_info", 0x0, b"\x12\x34" * 8),
+        (".cinit", 0x2000, b"\xff" * 8),
+    ]
+    data_start = header_size + optheader_size + len(sections) * section_size
+
+    section_headers = b""
+    section_data = b""
+    for section_name, address, data in sections:
+        if data is None:
+            pointer = 0
+            size = 0
+        else:
+            pointer = data_start + len(section_data)
+            # sizes are in 16-bit words
+            size = len(data) // 2
+            section_data += data
+
+        section_headers += struct.pack(
+            epyqlib.ticoff.Section.section_fmt,
+            name(section_name),
+            size,
+            address,
+            size,
+            pointer,
+            0,
+            0,
+            0,
+            0,
+            0x20,
+            0,
+            0,
+        )
+
+    symbols = [
+        # name, value, section number, storage class
+        ("_counter", 0x400, 1, 2),
+        ("_a_rather_long_name", 0x402, 1, 2),
+        ("_main", 0x3000, 0, 2),
+        ("odd", 0, -1, 200),
+    ]
+    symbol_table = b"".join(
+        struct.pack(
+            epyqlib.ticoff.Symbol.symbol_fmt,
+            name(symbol_name),
+            value,
+            section_number,
+            0,
+            bytes([storage_class]),
+            b"\x00",
+        )
+        for symbol_name, value, section_number, storage_class in symbols
+    )
+
+    symbol_table_ptr = data_start + len(section_data)
+    header = struct.pack(
+        epyqlib.ticoff.Coff.header_fmt,
+        0xC2,
+        len(sections),
+        0,
+        symbol_table_ptr,
+        len(symbols),
+        optheader_size,
+        0,
+        0x9D,
+    )
+    optheader = struct.pack(
+        epyqlib.ticoff.Coff.optheader_fmt, 0x108, 0, 0, 0, 0, 0x3000, 0, 0
+    )
+
+    return header + optheader + section_headers + section_data + symbol_table + strings
+
+
+@pytest.fixture
+def coff_path(tmp_path):
+    path = tmp_path / "binary.out"
+    path.write_bytes(build_coff())
+
+    return path
+
+
+def load(path, memory_map):
+    coff = epyqlib.ticoff.Coff()
+    coff.from_file(path, memory_map=memory_map)
+
+    return coff
+
+
+def test_memory_map_matches_stream(coff_path):
+    expected = load(coff_path, memory_map=False)
+    coff = load(coff_path, memory_map=True)
+
+    assert coff.header == expected.header
+    assert coff.optheader == expected.optheader
+    assert coff.sections == expected.sections
+    assert coff.symbols == expected.symbols
+    assert coff.variables == expected.variables
+    assert coff.entry_point == expected.entry_point
+
+    assert [s.name for s in coff.sections] == [
+        ".debug_info",
+        ".stack",
+        ".cinit",
+        ".text",
+    ]
+    assert coff.symbols[1].name == "_a_rather_long_name"
+    assert coff.symbols[3].storage_class == b"\xc8"
+
+    for section in coff.sections:
+        if section.data is not None:
+            assert isinstance(section.data, memoryview)
+
+
+def test_memory_map_without_file(coff_path):
+    expected = load(coff_path, memory_map=False)
+
+    coff = epyqlib.ticoff.Coff()
+    coff.from_stream(io.BytesIO(coff_path.read_bytes()), memory_map=True)
+
+    assert coff.sections == expected.sections
+    assert coff.symbols == expected.symbols
+
+
+def test_memory_map_truncated(tmp_path):
+    path = tmp_path / "binary.out"
+    path.write_bytes(build_coff()[:30])
+
+    with pytest.raises(EOFError):
+        load(path, memory_map=True)
@@ -0,0 +1,128 @@
+import uuid
+
+import pytest
+
+import epyqlib.treenode
+import epyqlib.tests.common
+
+
+def check_lookups(root):
+    for node in epyqlib.tests.common.all_nodes(root):
+        for row, child in enumerate(node.children):
+            assert node.row_of_child(child) == row
+            assert node.child_by_name(child.name) is child
+
+        assert (
+            root.nodes_by_attribute(
+                attribute_value=node.uuid,
+                attribute_name="uuid",
+            )
+            == {node}
+        )
+
+
+@pytest.mark.parametrize("indexed", [False, True])
+def test_lookups_after_changes(indexed):
+    root = epyqlib.tests.common.build_tree(indexed=indexed, width=5, depth=3)
+    check_lookups(root)
+
+    parent = root.children[1]
+    removed = parent.children[2]
+    parent.remove_child(child=removed)
+    parent.insert_child(0, epyqlib.tests.common.Node(name="inserted"))
+    parent.append_child(epyqlib.tests.common.Node(name="appended"))
+    root.children[3].insert_child(1, removed)
+    check_lookups(root)
+
+    parent.children.sort(key=lambda node: node.name)
+    parent.children[0].name = "renamed"
+    parent.children[1].uuid = uuid.uuid4()
+    check_lookups(root)
+
+    with pytest.raises(epyqlib.treenode.NotFoundError):
+        parent.child_by_name("appended")
+
+    assert parent.row_of_child(root) == -1
+
+
+@pytest.mark.parametrize("indexed", [False, True])
+def test_removed_not_found(indexed):
+    root = epyqlib.tests.common.build_tree(indexed=indexed, width=5, depth=3)
+    parent = root.children[0]
+    child = parent.children[0]
+    parent.remove_child(child=child)
+
+    with pytest.raises(epyqlib.treenode.NotFoundError):
+        root.nodes_by_attribute(attribute_value=child.uuid, attribute_name="uuid")
+
+    with pytest.raises(epyqlib.treenode.NotFoundError):
+        parent.child_by_name(child.name)
+
+    assert child.tree_index is None
+
+
+@pytest.mark.parametrize("indexed", [False, True])
+def test_uuid_outside_of_subtree(indexed):
+    root = epyqlib.tests.common.build_tree(indexed=indexed, width=5, depth=3)
+    node = root.children[0].children[0]
+
+    with pytest.raises(epyqlib.treenode.NotFoundError):
+        root.children[1].nodes_by_attribute(
+            attribute_value=node.uuid,
+            attribute_name="uuid",
+        )
+
+
+@pytest.mark.parametrize("indexed", [False, True])
+def test_multiple_children_by_name(indexed):
+    root = epyqlib.tests.common.build_tree(indexed=indexed, width=5, depth=3)
+    root.append_child(epyqlib.tests.common.Node(name=root.children[0].name))
+
+    with pytest.raises(epyqlib.treenode.MultipleFoundError):
+        root.child_by_name(root.children[0].name)
+
+
+@pytest.mark.skip("Just here for benchmarking to make sure it's not too slow")
+@pytest.mark.parametrize("indexed", [False, True])
+def test_lookup_benchmark(indexed):
+    import time
+
+    root = epyqlib.tests.common.build_tree(indexed=indexed, width=22, depth=3)
+    nodes = epyqlib.tests.common.all_nodes(root)[-1000:]
+
+    start = time.perf_counter()
+    for node in nodes:
+        node.tree_parent.row_of_child(node)
+        node.tree_parent.child_by_name(node.name)
+        root.nodes_by_attribute(attribute_value=node.uuid, attribute_name="uuid")
+    end = time.perf_counter()
+
+    print(
+        f"{len(epyqlib.tests.common.all_nodes(root))} nodes,"
+        f" {len(nodes)} lookups: {end - start:.3f}s"
+    )
+
+
+@pytest.mark.parametrize("indexed", [False, True])
+def test_uuid_after_unindexed_changes(indexed):
+    root = epyqlib.tests.common.build_tree(indexed=indexed, width=5, depth=3)
+    parent = root.children[0]
+    moved, removed = parent.children[:2]
+
+    # reparented without removing it from the original children
+    other = epyqlib.tests.common.Node(name="other")
+    moved.tree_parent = other
+    other.children.append(moved)
+
+    parent.children.remove(removed)
+
+    assert (
+        root.nodes_by_attribute(
+            attribute_value=moved.uuid,
+            attribute_name="uuid",
+        )
+        == {moved}
+    )
+
+    with pytest.raises(epyqlib.treenode.NotFoundError):
+        root.nodes_by_attribute(attribute_value=removed.uuid, attribute_name="uuid")
@@ -5,7 +5,9 @@ import epyqlib.device
 import epyqlib.twisted.busproxy
 import epyqlib.twisted.cancalibrationprotocol as ccp
 import pytest
+import random
 import sys
+import time
 
 from PyQt5.QtCore import QTimer
 
@@ -118,3 +120,42 @@ def test_payload_assignment_error():
 def test_message_length_error():
     with pytest.raises(ccp.MessageLengthError):
         ccp.HostCommand(code=ccp.CommandCode.connect, dlc=5)
+
+
+@pytest.mark.parametrize("length", [0, 1, 6, 7, 1000])
+def test_crc_matches_bitwise(length):
+    r = random.Random(length)
+    data = bytes(r.randrange(256) for _ in range(length))
+
+    expected = ccp.crc_bitwise(data=data)
+
+    assert ccp.crc(data=data) == expected
+
+    incremental = None
+    for chunk in ccp.chunkit(it=data, n=6):
+        incremental = ccp.crc(data=chunk, crc=incremental)
+
+    if length > 0:
+        assert incremental == expected
+
+    expected = ccp.crc_bitwise(data=ccp.endianness_swap_2byte(data))
+
+    assert ccp.swapped_crc(data=data) == expected
+
+
+@pytest.mark.skip("Just here for benchmarking to make sure it's not too slow")
+def test_benchmark_crc():
+    r = random.Random(0)
+    data = bytes(r.randrange(256) for _ in range(2 ** 20))
+
+    start = time.perf_counter()
+    expected = ccp.crc_bitwise(data=ccp.endianness_swap_2byte(data))
+    elapsed = time.perf_counter() - start
+    print(f"Bitwise crc of 1 MiB took {elapsed:.2f}")
+
+    start = time.perf_counter()
+    crc = ccp.swapped_crc(data=data)
+    elapsed = time.perf_counter() - start
+    print(f"Table crc of 1 MiB took {elapsed:.2f}")
+
+    assert crc == expected
@@ -0,0 +1,270 @@
+import os
+
+import can
+import canmatrix.formats
+import pytest
+import twisted.internet.task
+
+import epyqlib.busproxy
+import epyqlib.canneo
+import epyqlib.nv
+import epyqlib.tests.common
+import epyqlib.twisted.nvs
+
+
+class Transport:
+    def __init__(self):
+        self.written = []
+
+    def write(self, message):
+        self.written.append(message)
+        return True
+
+    write_passive = write
+
+
+def response_to(message, frame):
+    # the customer status frame layout matches the set frame layout
+    return can.Message(
+        arbitration_id=frame.status_frame.id,
+        is_extended_id=frame.status_frame.extended,
+        data=message.data,
+    )
+
+
+@pytest.fixture(scope="module")
+def nvs(qapp):
+    (matrix,) = canmatrix.formats.loadp(
+        os.fspath(epyqlib.tests.common.symbol_files["customer"]),
+    ).values()
+
+    neo = epyqlib.canneo.Neo(
+        matrix=matrix,
+        frame_class=epyqlib.nv.Frame,
+        signal_class=epyqlib.nv.Nv,
+        strip_summary=False,
+    )
+
+    return epyqlib.nv.Nvs(
+        neo=neo,
+        bus=epyqlib.busproxy.BusProxy(),
+        configuration="j1939",
+        metas=epyqlib.nv.meta_limits_first,
+    )
+
+
+def make_protocol(window, timeout=1):
+    clock = twisted.internet.task.Clock()
+    transport = Transport()
+    protocol = epyqlib.twisted.nvs.Protocol(
+        timeout=timeout,
+        window=window,
+        reactor=clock,
+    )
+    protocol.makeConnection(transport)
+
+    return protocol, transport, clock
+
+
+def parameter_frames(nvs, count):
+    frames = sorted(
+        {nv.frame for nv in nvs.all_nv() if nv.frame.read_write.min <= 0},
+        key=lambda frame: frame.mux.value,
+    )
+
+    return frames[:count]
+
+
+def read(protocol, frame, meta=epyqlib.nv.MetaEnum.value, **kwargs):
+    return protocol.read_multiple(
+        nv_signals=frame.parameter_signals,
+        meta=meta,
+        all_values=True,
+        **kwargs,
+    )
+
+
+def test_pipelined_reads_out_of_order(nvs):
+    protocol, transport, clock = make_protocol(window=4)
+    frames = parameter_frames(nvs=nvs, count=10)
+
+    results = {}
+    for frame in frames:
+        d = read(protocol=protocol, frame=frame)
+        d.addCallback(lambda result, frame=frame: results.setdefault(frame, result))
+
+    responded = 0
+    while responded < len(frames):
+        assert len(transport.written) - responded <= 4
+        in_flight = transport.written[responded:]
+        assert len(in_flight) > 0
+
+        for message in reversed(in_flight):
+            (frame,) = [f for f in frames if f.mux.value == message.data[0]]
+            protocol.dataReceived(response_to(message=message, frame=frame))
+
+        responded += len(in_flight)
+        clock.advance(0)
+
+    assert set(results) == set(frames)
+    for frame, (values, meta) in results.items():
+        assert meta == epyqlib.nv.MetaEnum.value
+        assert set(values) == {s.status_signal for s in frame.parameter_signals}
+
+
+def test_same_frame_and_meta_not_overlapped(nvs):
+    protocol, transport, clock = make_protocol(window=4)
+    (frame,) = parameter_frames(nvs=nvs, count=1)
+
+    first = read(protocol=protocol, frame=frame)
+    second = read(protocol=protocol, frame=frame)
+    other_meta = read(protocol=protocol, frame=frame, meta=epyqlib.nv.MetaEnum.minimum)
+
+    assert len(transport.written) == 2
+
+    protocol.dataReceived(response_to(message=transport.written[0], frame=frame))
+    clock.advance(0)
+
+    assert first.called
+    assert not second.called
+    assert not other_meta.called
+    assert len(transport.written) == 3
+
+
+def test_per_request_timeout(nvs):
+    protocol, transport, clock = make_protocol(window=2, timeout=1)
+    frames = parameter_frames(nvs=nvs, count=3)
+
+    deferreds = [read(protocol=protocol, frame=frame) for frame in frames]
+    failures = []
+    for d in deferreds:
+        d.addErrback(failures.append)
+
+    clock.advance(0.5)
+    protocol.dataReceived(response_to(message=transport.written[0], frame=frames[0]))
+    clock.advance(0)
+
+    assert deferreds[0].called
+    assert len(transport.written) == 3
+
+    clock.advance(0.5)
+
+    assert [f.type for f in failures] == [epyqlib.twisted.nvs.RequestTimeoutError]
+
+    clock.advance(0.5)
+
+    assert len(failures) == 2
+
+
+def test_priority_preserved_while_window_full(nvs):
+    protocol, transport, clock = make_protocol(window=1)
+    frames = parameter_frames(nvs=nvs, count=4)
+
+    for frame in frames[:3]:
+        read(protocol=protocol, frame=frame)
+
+    read(
+        protocol=protocol,
+        frame=frames[3],
+        priority=epyqlib.twisted.nvs.Priority.user,
+    )
+
+    sent = []
+    while len(sent) < len(frames):
+        (message,) = transport.written[len(sent) :]
+        (frame,) = [f for f in frames if f.mux.value == message.data[0]]
+        sent.append(frame)
+        protocol.dataReceived(response_to(message=message, frame=frame))
+        clock.advance(0)
+
+    assert sent == [frames[0], frames[3], frames[1], frames[2]]
+
+
+def multi_signal_frame(nvs):
+    return next(
+        frame
+        for frame in parameter_frames(nvs=nvs, count=None)
+        if len(frame.parameter_signals) >= 3
+    )
+
+
+def decode(frame, message):
+    values = frame.unpack(message.data, only_return=True)
+    read_write = frame.read_write.enumeration[values[frame.read_write]]
+
+    return read_write, values
+
+
+def respond_all(protocol, transport, clock, frame, responded):
+    while len(transport.written) > responded:
+        message = transport.written[responded]
+        protocol.dataReceived(response_to(message=message, frame=frame))
+        responded += 1
+        clock.advance(0)
+
+    return responded
+
+
+def test_write_uses_recent_values(nvs):
+    protocol, transport, clock = make_protocol(window=1)
+    frame = multi_signal_frame(nvs=nvs)
+    a, b, *_ = frame.parameter_signals
+
+    read(protocol=protocol, frame=frame)
+    responded = respond_all(protocol, transport, clock, frame, responded=0)
+    _, read_values = decode(frame=frame, message=transport.written[0])
+
+    written = protocol.write_multiple(
+        nv_signals={a: 1},
+        meta=epyqlib.nv.MetaEnum.value,
+    )
+    responded = respond_all(protocol, transport, clock, frame, responded)
+
+    assert written.called
+    assert len(transport.written) == 2
+    read_write, values = decode(frame=frame, message=transport.written[1])
+    assert read_write == "Write"
+    assert values[a] == 1
+    assert values[b] == read_values[b]
+
+    clock.advance(protocol.recent_lifetime + 1)
+
+    protocol.write_multiple(nv_signals={a: 0}, meta=epyqlib.nv.MetaEnum.value)
+    respond_all(protocol, transport, clock, frame, responded)
+
+    assert [decode(frame=frame, message=m)[0] for m in transport.written[2:]] == [
+        "Read",
+        "Write",
+    ]
+
+
+def test_queued_writes_coalesce(nvs):
+    protocol, transport, clock = make_protocol(window=1)
+    frame = multi_signal_frame(nvs=nvs)
+    a, b, c, *_ = frame.parameter_signals
+
+    read(protocol=protocol, frame=frame)
+
+    results = []
+    for signals in [{a: 1}, {b: 1}, {a: 0, c: 1}]:
+        d = protocol.write_multiple(
+            nv_signals=signals,
+            meta=epyqlib.nv.MetaEnum.value,
+            all_values=True,
+        )
+        d.addCallback(results.append)
+
+    respond_all(protocol, transport, clock, frame, responded=0)
+
+    assert [decode(frame=frame, message=m)[0] for m in transport.written] == [
+        "Read",
+        "Write",
+    ]
+    _, values = decode(frame=frame, message=transport.written[1])
+    assert (values[a], values[b], values[c]) == (0, 1, 1)
+
+    assert [set(values) for values, meta in results] == [
+        {a.status_signal},
+        {b.status_signal},
+        {a.status_signal, c.status_signal},
+    ]
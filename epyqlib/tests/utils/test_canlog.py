@@ -0,0 +1,161 @@
+import io
+
+import can
+import numpy
+import pytest
+
+import epyqlib.utils.canlog
+
+
+def pythoncan_message(i):
+    return can.Message(
+        timestamp=i / 10,
+        arbitration_id=0x100 + i,
+        is_extended_id=i % 2 == 0,
+        data=bytes(range(i % 9)),
+    )
+
+
+def test_message_buffer_wraps():
+    buffer = epyqlib.utils.canlog.MessageBuffer(capacity=5)
+
+    for i in range(12):
+        buffer.append_pythoncan(pythoncan_message(i))
+
+    assert len(buffer) == 5
+
+    messages = list(buffer)
+    assert [m.id.value for m in messages] == [0x100 + i for i in range(7, 12)]
+    assert [bytes(m.data) for m in messages] == [
+        bytes(range(i % 9)) for i in range(7, 12)
+    ]
+    assert buffer[-1] == messages[-1]
+    assert buffer[0] == messages[0]
+
+    arrays = buffer.arrays()
+    assert len(arrays) == 2
+    assert all(numpy.shares_memory(array, buffer.array) for array in arrays)
+    assert numpy.concatenate([a["time"] for a in arrays]).tolist() == [
+        m.time for m in messages
+    ]
+
+
+def test_message_buffer_round_trip():
+    buffer = epyqlib.utils.canlog.MessageBuffer(capacity=3)
+
+    message = epyqlib.utils.canlog.Message(
+        time=None,
+        type=epyqlib.utils.canlog.MessageType.Tx,
+        id=epyqlib.utils.canlog.Id(value=0x1FFFFFFF, extended=True),
+        data=bytearray(b"\x01\x02"),
+    )
+    buffer.append(message)
+
+    assert list(buffer) == [message]
+
+    buffer.clear()
+
+    assert list(buffer) == []
+
+
+def test_log_uses_buffer(qtbot):
+    log = epyqlib.utils.canlog.Log(name="test")
+
+    log.message_received_signal.emit(pythoncan_message(0))
+    log.start()
+    for i in range(1, 4):
+        log.message_received_signal.emit(pythoncan_message(i))
+    log.stop()
+    log.message_received_signal.emit(pythoncan_message(4))
+
+    assert [m.id.value for m in log.messages] == [0x101, 0x102, 0x103]
+    assert log.minimum_timestamp() == 0.1
+
+
+def sample_messages(count=25):
+    return [
+        epyqlib.utils.canlog.Message(
+            time=i * 0.125,
+            type=epyqlib.utils.canlog.MessageType.Rx,
+            id=epyqlib.utils.canlog.Id(value=0x7F0 + i, extended=i % 3 == 0),
+            data=bytearray(range(i % 9)),
+        )
+        for i in range(count)
+    ]
+
+
+def test_trc_v1_1_round_trip():
+    messages = sample_messages()
+
+    f = io.StringIO()
+    epyqlib.utils.canlog.to_trc_v1_1(messages, f, chunk_size=7)
+    f.seek(0)
+
+    assert list(epyqlib.utils.canlog.from_trc(f)) == messages
+
+
+def test_trc_v1_3_merges_buses():
+    messages = sample_messages()
+
+    f = io.StringIO()
+    epyqlib.utils.canlog.to_trc_v1_3({1: messages[::2], 2: messages[1::2]}, f)
+    f.seek(0)
+
+    assert list(epyqlib.utils.canlog.from_trc(f)) == messages
+
+
+trc_status_and_remote = {
+    "1.1": """\
+;$FILEVERSION=1.1
+     1)      1841.0  Rx         0100  2  01 02
+     2)      2000.0  Warng  FFFFFFFF  4  00 00 00 08  BUSHEAVY
+     3)      2500.0  Rx         0200  4  RTR
+""",
+    "1.3": """\
+;$FILEVERSION=1.3
+     1)      1841.0 1  Rx         0100 -  2    01 02
+     2)      2000.0 1  Warng  FFFFFFFF -  4    00 00 00 08  BUSHEAVY
+     3)      2200.0 1  Error      0000 Rx  5    04 00 00 05 00
+     4)      2500.0 1  Rx         0200 -  4    RTR
+""",
+}
+
+
+@pytest.mark.parametrize("version", trc_status_and_remote)
+def test_trc_status_and_remote_frames(version):
+    f = io.StringIO(trc_status_and_remote[version])
+
+    assert list(epyqlib.utils.canlog.from_trc(f)) == [
+        epyqlib.utils.canlog.Message(
+            time=1.841,
+            type=epyqlib.utils.canlog.MessageType.Rx,
+            id=epyqlib.utils.canlog.Id(value=0x100, extended=False),
+            data=bytearray(b"\x01\x02"),
+        ),
+        epyqlib.utils.canlog.Message(
+            time=2.5,
+            type=epyqlib.utils.canlog.MessageType.Rx,
+            id=epyqlib.utils.canlog.Id(value=0x200, extended=False),
+            data=bytearray(),
+        ),
+    ]
+
+
+def test_candump_round_trip():
+    messages = sample_messages()
+
+    f = io.StringIO()
+    epyqlib.utils.canlog.to_candump(messages, f, chunk_size=4)
+    f.seek(0)
+
+    assert f.getvalue().splitlines()[1] == "(0.125000) can0 7F1#00"
+    assert list(epyqlib.utils.canlog.from_candump(f)) == messages
+
+
+def test_to_arrays():
+    messages = sample_messages()
+
+    arrays = list(epyqlib.utils.canlog.to_arrays(messages, chunk_size=10))
+
+    assert [len(array) for array in arrays] == [10, 10, 5]
+    assert numpy.concatenate(arrays)["id"].tolist() == [m.id.value for m in messages]
@@ -0,0 +1,139 @@
+import attr
+import can
+import canmatrix
+import pytest
+
+import epyqlib.busproxy
+import epyqlib.canneo
+import epyqlib.utils.canlog
+import epyqlib.utils.canreplay
+
+
+@attr.s
+class FakeClock:
+    now = attr.ib(default=100.0)
+    sleeps = attr.ib(factory=list)
+
+    def clock(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def messages(times):
+    return [
+        epyqlib.utils.canlog.Message(
+            time=t,
+            type=epyqlib.utils.canlog.MessageType.Rx,
+            id=epyqlib.utils.canlog.Id(value=0x123, extended=False),
+            data=bytearray([i]),
+        )
+        for i, t in enumerate(times)
+    ]
+
+
+@pytest.mark.parametrize("speed, expected", [(1, [1, 2]), (10, [0.1, 0.2]), (None, [])])
+def test_replay_pacing(speed, expected):
+    clock = FakeClock()
+    received = []
+
+    replay = epyqlib.utils.canreplay.Replay(
+        messages=messages(times=[5, 6, 6, 8]),
+        speed=speed,
+        clock=clock.clock,
+        sleep=clock.sleep,
+    )
+    throughput = replay.run(target=received.append)
+
+    assert clock.sleeps == pytest.approx(expected)
+    assert [m.data[0] for m in received] == [0, 1, 2, 3]
+    assert throughput.messages == 4
+    assert throughput.seconds == pytest.approx(sum(expected))
+
+
+def test_replay_to_bus_proxy(qtbot):
+    received = []
+
+    class Listener(epyqlib.canneo.QtCanListener):
+        def __init__(self):
+            super().__init__(receiver=received.append)
+
+    bus_proxy = epyqlib.busproxy.BusProxy()
+    bus_proxy.notifier.add(Listener())
+
+    replay = epyqlib.utils.canreplay.Replay(messages=messages([0, 1]), speed=None)
+    throughput = replay.to_bus_proxy(bus_proxy=bus_proxy)
+
+    assert throughput.messages == 2
+    assert [message.arbitration_id for message in received] == [0x123, 0x123]
+    assert all(isinstance(message, can.Message) for message in received)
+
+
+def test_replay_counts_decoded_frames(qtbot):
+    frame = canmatrix.Frame(
+        name="TestFrame",
+        arbitration_id=canmatrix.ArbitrationId(id=0x123, extended=False),
+        size=1,
+    )
+    frame.add_signal(canmatrix.Signal(name="a", start_bit=0, size=8))
+    matrix = canmatrix.CanMatrix()
+    matrix.add_frame(frame)
+
+    neo = epyqlib.canneo.Neo(matrix=matrix, rx_interval=1)
+    bus_proxy = epyqlib.busproxy.BusProxy()
+    bus_proxy.notifier.add(neo)
+    counter = epyqlib.utils.canreplay.FrameCounter.connect(neo=neo)
+
+    replay = epyqlib.utils.canreplay.Replay(
+        messages=messages([0, 0.5, 1, 1.5, 2]),
+        speed=None,
+    )
+    throughput = replay.to_bus_proxy(bus_proxy=bus_proxy)
+
+    assert throughput.messages == 5
+    assert counter.count == 3
+
+
+def test_throughput_str():
+    throughput = epyqlib.utils.canreplay.Throughput(messages=10, seconds=2, frames=4)
+
+    assert str(throughput) == (
+        "10 messages fed in 2.000 s, 5 messages/s\n4 frames decoded, 2 frames/s"
+    )
+
+
+def test_replay_start_does_not_block(qtbot):
+    received = []
+    replay = epyqlib.utils.canreplay.Replay(
+        messages=messages([0, 0.1, 0.2]),
+        speed=1,
+    )
+
+    with qtbot.waitSignal(replay.finished, timeout=2000) as blocker:
+        replay.start(target=received.append)
+        assert len(received) < 3
+
+    assert blocker.args[0].messages == 3
+    assert len(received) == 3
+
+
+def test_replay_to_virtual_bus(qtbot):
+    received = []
+
+    class Listener(epyqlib.canneo.QtCanListener):
+        def __init__(self):
+            super().__init__(receiver=received.append)
+
+    replay = epyqlib.utils.canreplay.Replay(
+        messages=messages([0, 0.01, 0.02, 0.03]),
+        speed=10,
+    )
+    throughput = replay.to_virtual_bus(
+        listeners=[Listener()],
+        channel="test_replay_to_virtual_bus",
+    )
+
+    assert throughput.messages == 4
+    assert [message.data[0] for message in received] == [0, 1, 2, 3]
@@ -10,7 +10,9 @@ from builtins import bytes, object, range
 from array import array
 from collections import namedtuple
 from optparse import OptionParser
-from struct import unpack, calcsize
+from struct import unpack, unpack_from, iter_unpack, calcsize
+import io
+import mmap
 
 
 # See file COPYING in this source tree
@@ -38,6 +40,32 @@ def read_struct(file, format):
     return ret
 
 
+def unpack_buffer(buffer, offset, format):
+    """unpack struct data formatted according to format from buffer at offset"""
+    if offset + calcsize(format) > len(buffer):
+        raise EOFError
+    return unpack_from(format, buffer, offset)
+
+
+def map_stream(file):
+    """memory map the file backing the stream, reading it instead when
+    there is no file to map"""
+    try:
+        return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    except (AttributeError, io.UnsupportedOperation, ValueError):
+        # no file descriptor or an empty file
+        file.seek(0)
+        return file.read()
+
+
+def buffer_cstr(buffer, offset):
+    """read zero terminated c string from buffer at offset"""
+    end = buffer.find(b"\0", offset)
+    if end < 0:
+        raise RuntimeError("EOF while reading cstr")
+    return buffer[offset:end].decode("latin-1")
+
+
 def read_cstr(file):
     """read zero terminated c string from file"""
     output = ""
@@ -181,11 +209,15 @@ class Coff(object):
         if filename is not None:
             self.from_file(filename)
 
-    def from_file(self, name):
+    def from_file(self, name, memory_map=False):
         with open(name, "rb") as f:
-            self.from_stream(f)
+            self.from_stream(f, memory_map=memory_map)
+
+    def from_stream(self, f, memory_map=False):
+        if memory_map:
+            self.from_buffer(map_stream(f))
+            return
 
-    def from_stream(self, f):
         self.header = self.Header(*read_struct(f, self.header_fmt))
         self.optheader = self.OptionalHeader(*read_struct(f, self.optheader_fmt))
         self.sections = []
@@ -232,6 +264,77 @@ class Coff(object):
             # if symbol.number_of_aux_entries:
             #     read_struct(f, Symbol.symbol_auxiliary_format)
 
+        self.index()
+
+    def from_buffer(self, buffer):
+        """Load from a bytes-like buffer holding the whole file such as a
+        memory map.  Section data are memoryview slices of the buffer so a
+        mapped file is only read as the data are accessed.
+        """
+        buffer = memoryview(buffer)
+
+        self.header = self.Header(*unpack_buffer(buffer, 0, self.header_fmt))
+        offset = calcsize(self.header_fmt)
+        self.optheader = self.OptionalHeader(
+            *unpack_buffer(buffer, offset, self.optheader_fmt)
+        )
+        offset += calcsize(self.optheader_fmt)
+
+        symbol_size = calcsize(Symbol.symbol_fmt)
+        symbols_start = self.header.symbol_table_ptr
+        symbols_end = symbols_start + self.header.symbol_count * symbol_size
+        if symbols_end > len(buffer):
+            raise EOFError
+        strings = bytes(buffer[symbols_end:])
+
+        def name(value):
+            parts = unpack("<2L", value)
+            if parts[0] == 0:
+                return buffer_cstr(strings, parts[1])
+            else:
+                return str(value.decode("ascii").rstrip("\0"))
+
+        self.sections = []
+        for i in range(self.header.section_count):
+            section = Section(
+                *unpack_buffer(buffer, offset, Section.section_fmt), data=None
+            )
+            offset += calcsize(Section.section_fmt)
+            section = section._replace(name=name(section.name))
+            if section.raw_data_ptr and section.raw_data_size:
+                # TODO: `2 *` is hard coded to handle the 2-bytes per
+                #       address scenario.  This should obviously be
+                #       detected somehow, unless it is always correct.
+                data = buffer[
+                    section.raw_data_ptr : section.raw_data_ptr
+                    + 2 * section.raw_data_size
+                ]
+                section = section._replace(data=data)
+            self.sections.append(section)
+
+        storage_classes = {flag[0]: flag for flag in Symbol.symbol_flags}
+
+        self.symbols = []
+        for fields in iter_unpack(Symbol.symbol_fmt, buffer[symbols_start:symbols_end]):
+            symbol = Symbol(*fields)
+            try:
+                symbol = symbol._replace(name=name(symbol.name))
+            except UnicodeDecodeError:
+                # TODO: not sure what to do with these
+                pass
+            symbol = symbol._replace(
+                number_of_aux_entries=symbol.number_of_aux_entries[0]
+            )
+            storage_class = storage_classes.get(symbol.storage_class[0])
+            if storage_class is None:
+                print("bad {}".format(symbol))
+            else:
+                symbol = symbol._replace(storage_class=storage_class)
+            self.symbols.append(symbol)
+
+        self.index()
+
+    def index(self):
         stack_section_number = next(
             i for i, s in enumerate(self.sections) if s.name == ".stack"
         )
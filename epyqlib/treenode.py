@@ -24,7 +24,141 @@ class Signals(PyQt5.QtCore.QObject):
     child_removed_complete = PyQt5.QtCore.pyqtSignal("PyQt_PyObject")
 
 
+_missing = object()
+
+
+class TreeIndex:
+    """Lookups by uuid, of children by name and of the row of a child for
+    the tree under `root`.  Kept up to date as children are inserted and
+    removed through the `TreeNode` methods.  Changes to the attributes of
+    the nodes are not tracked.  Stale or missing results fall back to
+    scanning, but after renaming a node to the name of a sibling `rebuild()`
+    is needed for `TreeNode.child_by_name()` to report both.
+    """
+
+    def __init__(self, root):
+        self.root = root
+        self.by_uuid = {}
+        self.by_name = {}
+        self.rows = {}
+
+        self.rebuild()
+
+    def rebuild(self):
+        self.by_uuid.clear()
+        self.by_name.clear()
+        self.rows.clear()
+
+        self.add(self.root)
+
+    def add(self, node):
+        node.tree_index = self
+
+        uuid = getattr(node, "uuid", None)
+        if uuid is not None:
+            self.by_uuid[uuid] = node
+
+        self.index_names(parent=node)
+
+        for child in node.children:
+            self.add(child)
+
+    def discard(self, node):
+        node.tree_index = None
+
+        uuid = getattr(node, "uuid", None)
+        if self.by_uuid.get(uuid) is node:
+            del self.by_uuid[uuid]
+
+        self.by_name.pop(id(node), None)
+        self.rows.pop(id(node), None)
+
+        for child in node.children:
+            self.discard(child)
+
+    def index_names(self, parent):
+        names = {}
+
+        for child in parent.children:
+            name = getattr(child, "name", _missing)
+            if name is not _missing:
+                names.setdefault(name, []).append(child)
+
+        self.by_name[id(parent)] = names
+
+        return names
+
+    def added(self, parent, child, row):
+        self.add(child)
+
+        name = getattr(child, "name", _missing)
+        if name is not _missing:
+            self.by_name[id(parent)].setdefault(name, []).append(child)
+
+        rows = self.rows.get(id(parent))
+        if rows is not None:
+            if row == len(parent.children) - 1:
+                rows[id(child)] = row
+            else:
+                del self.rows[id(parent)]
+
+    def removed(self, parent, child, row):
+        self.discard(child)
+
+        for children in self.by_name.get(id(parent), {}).values():
+            for i, named in enumerate(children):
+                if named is child:
+                    del children[i]
+                    break
+
+        rows = self.rows.get(id(parent))
+        if rows is not None:
+            if row == len(parent.children):
+                del rows[id(child)]
+            else:
+                del self.rows[id(parent)]
+
+    def node_by_uuid(self, uuid):
+        node = self.by_uuid.get(uuid)
+
+        if node is None or node.tree_index is not self or node.uuid != uuid:
+            return None
+
+        return node
+
+    def children_by_name(self, parent, name):
+        def valid(children):
+            return all(
+                child.tree_parent is parent and child.name == name for child in children
+            )
+
+        children = self.by_name[id(parent)].get(name, [])
+
+        if len(children) == 0 or not valid(children):
+            # possibly renamed since indexing
+            children = self.index_names(parent=parent).get(name, [])
+
+        return list(children)
+
+    def row_of_child(self, parent, child):
+        rows = self.rows.get(id(parent))
+
+        if rows is not None:
+            row = rows.get(id(child))
+            if row is not None:
+                if row < len(parent.children) and parent.children[row] is child:
+                    return row
+
+        # first use or the children were modified directly
+        rows = {id(item): i for i, item in enumerate(parent.children)}
+        self.rows[id(parent)] = rows
+
+        return rows.get(id(child), -1)
+
+
 class TreeNode:
+    tree_index = None
+
     def __init__(self, tx=False, parent=None, children=None):
         self.last = None
 
@@ -54,15 +188,25 @@ class TreeNode:
         if self.tree_parent is not None:
             self.tree_parent.append_child(self)
 
+    def build_index(self):
+        """Index this tree for constant time lookups by uuid, of children by
+        name and of the row of a child.  See `TreeIndex`."""
+
+        return TreeIndex(root=self)
+
     def insert_child(self, i, child):
         self.children.insert(i, child)
         child.tree_parent = self
+        if self.tree_index is not None:
+            self.tree_index.added(parent=self, child=child, row=i)
         self.pyqt_signals.child_added.emit(child, i)
         self.pyqt_signals.child_added_complete.emit(child)
 
     def append_child(self, child):
         self.children.append(child)
         child.tree_parent = self
+        if self.tree_index is not None:
+            self.tree_index.added(parent=self, child=child, row=len(self.children) - 1)
         self.pyqt_signals.child_added.emit(child, len(self.children) - 1)
         self.pyqt_signals.child_added_complete.emit(child)
 
@@ -73,6 +217,9 @@ class TreeNode:
             return None
 
     def row_of_child(self, child):
+        if self.tree_index is not None:
+            return self.tree_index.row_of_child(parent=self, child=child)
+
         for i, item in enumerate(self.children):
             if item is child:
                 return i
@@ -89,6 +236,8 @@ class TreeNode:
         child.parent = None
         child.tree_parent = None
         self.children.remove(child)
+        if self.tree_index is not None:
+            self.tree_index.removed(parent=self, child=child, row=row)
 
         self.pyqt_signals.child_removed.emit(tree_parent, child, row)
         self.pyqt_signals.child_removed_complete.emit(child)
@@ -144,7 +293,16 @@ class TreeNode:
 
             return getattr(node, attribute_name) == attribute_value
 
-        nodes = self.nodes_by_filter(filter=matches)
+        nodes = None
+        if attribute_name == "uuid" and self.tree_index is not None:
+            nodes = self.indexed_nodes_by_uuid(uuid=attribute_value)
+
+        if nodes is None:
+            nodes = self.nodes_by_filter(filter=matches)
+
+            if attribute_name == "uuid" and self.tree_index is not None:
+                for node in nodes:
+                    self.tree_index.by_uuid[attribute_value] = node
 
         if len(nodes) == 0 and raise_:
             raise NotFoundError(
@@ -156,6 +314,26 @@ class TreeNode:
 
         return nodes
 
+    def indexed_nodes_by_uuid(self, uuid):
+        node = self.tree_index.node_by_uuid(uuid=uuid)
+
+        if node is None:
+            # not indexed such as when assigned after the node was added
+            return None
+
+        child = node
+        while child is not self:
+            parent = child.tree_parent
+
+            if parent is None or parent.row_of_child(child) == -1:
+                # outside of this tree or the tree was modified without
+                # updating the index so scan to be sure
+                return None
+
+            child = parent
+
+        return {node}
+
     def nodes_by_filter(self, filter, collection=None):
         def visit(node, matches):
             if filter(node):
@@ -192,11 +370,14 @@ class TreeNode:
         return nodes
 
     def child_by_name(self, name):
-        sentinel = object()
-
-        children = [
-            child for child in self.children if getattr(child, "name", sentinel) == name
-        ]
+        if self.tree_index is not None:
+            children = self.tree_index.children_by_name(parent=self, name=name)
+        else:
+            children = [
+                child
+                for child in self.children
+                if getattr(child, "name", _missing) == name
+            ]
 
         if len(children) == 0:
             raise NotFoundError(f"Child with name {name!r} not found")
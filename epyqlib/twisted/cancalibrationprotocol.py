@@ -1,3 +1,4 @@
+import array
 import logging
 import can
 import collections
@@ -5,6 +6,7 @@ import enum
 import epyqlib.utils.twisted
 import functools
 import itertools
+import sys
 import twisted.internet.defer
 import twisted.protocols.policies
 
@@ -436,10 +438,8 @@ class Handler(QObject, twisted.protocols.policies.TimeoutMixin):
 
         if download is not None:
             # TODO: OOP this
-            self._crc = crc(data=endianness_swap_2byte(chunk), crc=self._crc)
-            self.continuous_crc = crc(
-                data=endianness_swap_2byte(chunk), crc=self.continuous_crc
-            )
+            self._crc = swapped_crc(data=chunk, crc=self._crc)
+            self.continuous_crc = swapped_crc(data=chunk, crc=self.continuous_crc)
             logger.debug("Continuous CRC: {:04X}".format(self.continuous_crc))
             self._crc_length += len(chunk)
 
@@ -498,10 +498,19 @@ class Handler(QObject, twisted.protocols.policies.TimeoutMixin):
         # return self._internal_deferred
 
     @twisted.internet.defer.inlineCallbacks
-    def upload_block(self, address_extension, address, octets, progress=None):
+    def upload_block(
+        self, address_extension, address, octets, progress=None, sink=None
+    ):
+        """Upload `octets` bytes starting at `address`.
+
+        The data is returned as a single `bytearray` unless `sink` is
+        passed, in which case each block is handed to `sink` as it arrives
+        and nothing is accumulated.
+        """
+
         yield self.set_mta(address=address, address_extension=address_extension)
 
-        data = bytearray()
+        data = bytearray() if sink is None else None
 
         remaining = octets
         update_period = octets // 100  # 1%
@@ -519,7 +528,11 @@ class Handler(QObject, twisted.protocols.policies.TimeoutMixin):
                 if since_update >= update_period:
                     progress.update(octets - remaining)
                     since_update = 0
-            data.extend(block)
+
+            if sink is None:
+                data.extend(block)
+            else:
+                sink(block)
 
         twisted.internet.defer.returnValue(data)
 
@@ -759,7 +772,7 @@ class Handler(QObject, twisted.protocols.policies.TimeoutMixin):
         self._deferred.cancel()
 
 
-def crc(data, crc=None):
+def crc_bitwise(data, crc=None):
     if crc is None:
         crc = 0xFFFF
 
@@ -775,6 +788,62 @@ def crc(data, crc=None):
     return crc
 
 
+# the bitwise crc of each single byte value starting from zero
+crc_table = tuple(crc_bitwise(data=[byte], crc=0) for byte in range(256))
+
+
+def table_crc(data, crc=None):
+    """Equivalent to `crc_bitwise()` but one table lookup per byte.  Pass the
+    result as `crc` to continue the calculation with more data."""
+
+    if crc is None:
+        crc = 0xFFFF
+
+    table = crc_table
+    for byte in data:
+        crc = (crc >> 8) ^ table[(crc ^ byte) & 0xFF]
+
+    return crc
+
+
+crc = table_crc
+
+
+@functools.lru_cache(maxsize=None)
+def word_crc_table():
+    """Like `crc_table` but for two bytes per lookup, the first in the low
+    byte of the index.  Built on first use."""
+
+    def two_bytes(crc):
+        crc = (crc >> 8) ^ crc_table[crc & 0xFF]
+        return (crc >> 8) ^ crc_table[crc & 0xFF]
+
+    return tuple(two_bytes(crc) for crc in range(0x10000))
+
+
+def swapped_crc(data, crc=None):
+    """The crc of `data` after `endianness_swap_2byte()` such as for a whole
+    section as it is downloaded.  As with the swap a trailing odd byte is
+    ignored."""
+
+    if crc is None:
+        crc = 0xFFFF
+
+    data = bytes(data)
+
+    # swapping each pair puts the first byte of the pair in the high byte of
+    # a little endian word so the original data is read as big endian words
+    words = array.array("H", data[: len(data) - len(data) % 2])
+    if sys.byteorder == "little":
+        words.byteswap()
+
+    table = word_crc_table()
+    for word in words:
+        crc = table[crc ^ word]
+
+    return crc
+
+
 class IdentifierTypeError(ValueError):
     pass
 
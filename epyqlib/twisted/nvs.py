@@ -1,5 +1,6 @@
 import collections
 import enum
+import itertools
 import logging
 import queue
 import textwrap
@@ -7,7 +8,6 @@ import time
 
 import attr
 import twisted.internet.defer
-import twisted.protocols.policies
 
 import epyqlib.nv
 import epyqlib.utils.general
@@ -73,6 +73,7 @@ class Priority(enum.IntEnum):
 @attr.s
 class Request:
     priority = attr.ib()
+    sequence = attr.ib()
     read = attr.ib(cmp=False)
     meta = attr.ib(cmp=False)
     signals = attr.ib(cmp=False)
@@ -80,20 +81,63 @@ class Request:
     passive = attr.ib(cmp=False)
     all_values = attr.ib(cmp=False)
     frame = attr.ib(cmp=False)
-    send_time = attr.ib(default=None)
+    send_time = attr.ib(default=None, cmp=False)
+    timeout_call = attr.ib(default=None, cmp=False)
+    # raw values sent for parameter signals that were not requested
+    fill = attr.ib(default=attr.Factory(dict), cmp=False)
+    # the original requests when several writes have been coalesced
+    merged = attr.ib(default=attr.Factory(list), cmp=False)
 
+    def key(self):
+        """Identify the responses to this request.  Only one request per key
+        may be in flight at a time.
+        """
 
-class Protocol(twisted.protocols.policies.TimeoutMixin):
-    def __init__(self, timeout=1):
-        self._deferred = None
+        meta = None
+        if self.frame.status_frame.meta_signal is not None:
+            meta = self.meta.value
 
+        return self.frame.mux.value, meta
+
+    def targets(self):
+        """The requests to respond to when this one completes."""
+
+        if len(self.merged) == 0:
+            return [self]
+
+        return self.merged
+
+    def merge(self, other):
+        if len(self.merged) == 0:
+            self.merged.append(attr.evolve(self, merged=[]))
+
+        self.merged.append(other)
+        self.signals = {**self.signals, **other.signals}
+
+
+@attr.s
+class Recent:
+    time = attr.ib()
+    values = attr.ib()
+
+
+class Protocol:
+    def __init__(self, timeout=1, window=1, reactor=None, recent_lifetime=1):
         self._state = State.idle
         self._previous_state = self._state
 
-        self._active = False
-
-        self._request_memory = None
         self._timeout = timeout
+        self.window = window
+        self._reactor = reactor
+
+        self._in_flight = {}
+        self._sequence = itertools.count()
+
+        # raw parameter values from the latest response per frame and meta
+        # and the time they were received
+        self.recent_lifetime = recent_lifetime
+        self._recent = {}
+        self._queued_writes = {}
 
         self.requests = queue.PriorityQueue()
 
@@ -109,30 +153,34 @@ class Protocol(twisted.protocols.policies.TimeoutMixin):
         self._previous_state = self._state
         self._state = new_state
 
+    @property
+    def reactor(self):
+        if self._reactor is None:
+            import twisted.internet.reactor
+
+            self._reactor = twisted.internet.reactor
+
+        return self._reactor
+
     def makeConnection(self, transport):
         self._transport = transport
         logger.debug("Protocol.makeConnection(): {}".format(transport))
 
-    def _start_transaction(self):
-        if self._active:
-            raise Exception("Protocol is already active")
+    def _transaction_over(self, request):
+        if request.timeout_call is not None:
+            if request.timeout_call.active():
+                request.timeout_call.cancel()
+            request.timeout_call = None
 
-        self._active = True
+        if self._in_flight.get(request.key()) is request:
+            del self._in_flight[request.key()]
 
-    def _transaction_over(self):
-        self.setTimeout(None)
-        import twisted.internet
+        if len(self._in_flight) == 0:
+            self.state = State.idle
 
-        twisted.internet.reactor.callLater(0, self._transaction_over_after_delay)
-        d = self._deferred
-        self._deferred = None
-        self._request_memory = None
-        self.state = State.idle
-        return d
+        self.reactor.callLater(0, self._get)
 
-    def _transaction_over_after_delay(self):
-        self._active = False
-        self._get()
+        return [target.deferred for target in request.targets()]
 
     def read(
         self,
@@ -252,6 +300,7 @@ class Protocol(twisted.protocols.policies.TimeoutMixin):
                 signals=nv_signals,
                 deferred=deferred,
                 priority=priority,
+                sequence=next(self._sequence),
                 passive=passive,
                 all_values=all_values,
                 frame=frame,
@@ -261,88 +310,123 @@ class Protocol(twisted.protocols.policies.TimeoutMixin):
         return deferred
 
     def _put(self, request):
+        if request.read:
+            # don't let later writes skip ahead of this read
+            self._queued_writes.pop(request.key(), None)
+        else:
+            queued = self._queued_writes.get(request.key())
+            if (
+                queued is not None
+                and queued.passive == request.passive
+                and queued.priority <= request.priority
+            ):
+                queued.merge(request)
+                return
+
+            self._queued_writes[request.key()] = request
+
         self.requests.put(request)
         self._get()
 
-    def _get(self):
-        if not self._active:
-            while True:
-                try:
-                    request = self.requests.get(block=False)
-                except queue.Empty:
-                    self.cancel_queued = False
-                else:
-                    if self.cancel_queued:
-                        request.deferred.errback(CanceledError())
-                    elif request.read:
-                        self._read_write(request)
-                    else:
-                        self._read_before_write(request)
-
-                if not self.cancel_queued:
-                    break
+    def _recent_values(self, request):
+        recent = self._recent.get(request.key())
 
-    def _read_before_write(self, request):
-        if isinstance(request.signals, dict):
-            nonskip = request.signals
-        else:
-            nonskip = {
-                s: (
-                    s.value
-                    if request.meta == epyqlib.nv.MetaEnum.value
-                    else getattr(s.meta, request.meta.name).value
-                )
-                for s in request.signals
-            }
+        if recent is None:
+            return None
+
+        if self.reactor.seconds() - recent.time > self.recent_lifetime:
+            return None
+
+        return recent.values
+
+    def _remember(self, request, signals):
+        values = {}
+        for status_signal, value in signals.items():
+            set_signal = getattr(status_signal, "set_signal", None)
+            if set_signal in request.frame.parameter_signals:
+                values[set_signal] = value
+
+        self._recent[request.key()] = Recent(
+            time=self.reactor.seconds(),
+            values=values,
+        )
 
-        skip_signals = set(request.frame.parameter_signals) - set(nonskip.keys())
+    def _forget(self, request):
+        self._recent.pop(request.key(), None)
 
-        if len(skip_signals) == 0:
+    def _get(self):
+        blocked = []
+
+        while self.cancel_queued or len(self._in_flight) < self.window:
             try:
+                request = self.requests.get(block=False)
+            except queue.Empty:
+                self.cancel_queued = False
+                break
+
+            if request.key() in self._in_flight and not self.cancel_queued:
+                # responses to requests with the same key can't be told apart
+                # so wait for the one in flight, keeping the original order.
+                # queued writes may still be merged in the meantime.
+                blocked.append(request)
+                continue
+
+            if self._queued_writes.get(request.key()) is request:
+                del self._queued_writes[request.key()]
+
+            if self.cancel_queued:
+                for target in request.targets():
+                    target.deferred.errback(CanceledError())
+            elif request.read:
                 self._read_write(request)
-            except Exception as e:
-                request.deferred.errback(e)
-        else:
-            d = twisted.internet.defer.Deferred()
-            d.callback(None)
-
-            def read_then_write(args, nonskip=nonskip):
-                values, meta = args
-                data = {k: v for k, v in nonskip.items()}
-                for s, v in values.items():
-                    s = s.set_signal
-                    if s in request.frame.parameter_signals:
-                        if s not in data:
-                            data[s] = s.from_human(v)
-
-                return self.write_multiple(
-                    nv_signals=data,
-                    meta=request.meta,
-                    all_values=True,
-                )
+            else:
+                self._read_before_write(request)
 
-            def write_response(args, nonskip=nonskip, request=request):
-                values, meta = args
-                data = {
-                    signal.status_signal: values[signal.status_signal]
-                    for signal in nonskip
-                }
+        for request in blocked:
+            self.requests.put(request)
 
-                request.deferred.callback((data, request.meta))
+    def _read_before_write(self, request):
+        missing = set(request.frame.parameter_signals) - set(request.signals)
+
+        if len(missing) > 0:
+            # prefer a fresh response over values read for this request
+            recent = self._recent_values(request)
+            for values in (recent, request.fill):
+                if values is not None and missing <= values.keys():
+                    request.fill = {s: values[s] for s in missing}
+                    missing = set()
+                    break
 
-            d.addCallback(
-                lambda _: self.read_multiple(
-                    request.frame.parameter_signals, meta=request.meta, all_values=True
-                )
-            )
-            d.addCallback(read_then_write)
-            d.addCallback(write_response)
-            d.addErrback(lambda e: request.deferred.errback(e))
+        if len(missing) == 0:
+            self._read_write(request)
+            return
+
+        def fill_then_write(args):
+            values, meta = args
+            request.fill = {
+                s.set_signal: s.set_signal.from_human(v)
+                for s, v in values.items()
+                if s.set_signal in missing
+            }
+            self.requests.put(request)
+            self._get()
+
+        def errback(failure):
+            for target in request.targets():
+                target.deferred.errback(failure)
+
+        d = self.read_multiple(
+            request.frame.parameter_signals,
+            meta=request.meta,
+            priority=request.priority,
+            passive=request.passive,
+            all_values=True,
+        )
+        d.addCallbacks(fill_then_write, errback)
 
     def _read_write(self, request):
-        self._deferred = request.deferred
         try:
-            self._start_transaction()
+            self._in_flight[request.key()] = request
             self.state = State.reading if request.read else State.writing
 
             (read_write,) = (
@@ -361,6 +445,8 @@ class Protocol(twisted.protocols.policies.TimeoutMixin):
                     data[signal] = signal.value
                 elif signal in request.signals and not request.read:
                     data[signal] = request.signals[signal]
+                elif signal in request.fill and not request.read:
+                    data[signal] = request.fill[signal]
                 else:
                     data[signal] = None
 
@@ -389,91 +475,105 @@ class Protocol(twisted.protocols.policies.TimeoutMixin):
             else:
                 write = self._transport.write
 
-            self._request_memory = request
-
             if not write(request.frame.to_message(data)):
-                self.send_failed()
+                self.send_failed(request)
                 return
 
             request.send_time = time.time()
 
-            self.setTimeout(self._timeout)
+            request.timeout_call = self.reactor.callLater(
+                self._timeout,
+                self.timeoutConnection,
+                request,
+            )
         except Exception as e:
-            self.errback(e)
+            self.errback(request, e)
 
     def dataReceived(self, msg):
+        unpacked = {}
 
-        if not self._active:
-            return
+        for request in tuple(self._in_flight.values()):
+            signals = self._match(request=request, msg=msg, unpacked=unpacked)
 
-        if self._deferred is None:
+            if signals is not None:
+                break
+        else:
             return
 
-        request = self._request_memory
-        if request is None:
-            return
+        self._remember(request=request, signals=signals)
+
+        results = []
+        for target in request.targets():
+            status_signal = tuple(target.signals)[0].status_signal
+
+            if target.all_values:
+                status_signals = {s.status_signal for s in target.signals}
+                value = {
+                    s: s.to_human(value=v)
+                    for s, v in signals.items()
+                    if s in status_signals
+                }
+            else:
+                raw_value = signals[status_signal]
+                value = status_signal.to_human(value=raw_value)
 
+            results.append((value, target.meta))
+
+        self.callback(request, results)
+
+    def _match(self, request, msg, unpacked):
         if not (
             msg.arbitration_id == request.frame.status_frame.id
             and (bool(msg.is_extended_id) == request.frame.status_frame.extended)
         ):
-            return
+            return None
 
         status_signal = tuple(request.signals)[0].status_signal
 
         if status_signal is None:
-            return
+            return None
 
-        signals = status_signal.frame.unpack(msg.data, only_return=True)
+        status_frame = status_signal.frame
+        signals = unpacked.get(status_frame)
+        if signals is None:
+            signals = status_frame.unpack(msg.data, only_return=True)
+            unpacked[status_frame] = signals
 
         mux = status_signal.set_signal.frame.mux.value
         (response_mux_value,) = (
             v for k, v in signals.items() if k.name.endswith("_MUX")
         )
         if response_mux_value != mux:
-            return
+            return None
         meta_mux_value = tuple(
             v for k, v in signals.items() if k.enumeration_name == "Meta"
         )
         if len(meta_mux_value) == 1:
             (meta_mux_value,) = meta_mux_value
             if meta_mux_value != request.meta.value:
-                print(" -- skipping due to unmatched meta")
-                return
+                logger.debug("skipping due to unmatched meta")
+                return None
 
         response_read_write_value = signals[status_signal.frame.command_signal]
         # TODO: handle the enumeration
         if response_read_write_value != request.read:
-            return
-
-        self.setTimeout(None)
+            return None
 
-        if request.all_values:
-            status_signals = {s.status_signal for s in request.signals}
-            value = {
-                s: s.to_human(value=v)
-                for s, v in signals.items()
-                if s in status_signals
-            }
-        else:
-            raw_value = signals[status_signal]
-            value = status_signal.to_human(value=raw_value)
+        return signals
 
-        self.callback(value, request.meta)
-
-    def send_failed(self):
+    def send_failed(self, request):
         self.cancel_queued = True
-        deferred = self._transaction_over()
-        deferred.errback(SendFailedError())
+        self.errback(request, SendFailedError())
+
+    def timeoutConnection(self, request):
+        request.timeout_call = None
 
-    def timeoutConnection(self):
-        request = self._request_memory
         # TODO: report all requested signals
         signal = tuple(request.signals)[0]
         mux_name = signal.frame.mux_name
 
         e = RequestTimeoutError(
-            state=self.state,
+            state=State.reading if request.read else State.writing,
             item=(
                 f"{mux_name}:{signal.name} "
                 f"({request.meta.name}, {request.send_time}, {time.time()}"
@@ -481,22 +581,23 @@ class Protocol(twisted.protocols.policies.TimeoutMixin):
         )
 
         logger.debug(str(e))
-        if self._previous_state in [State.idle]:
-            self.state = self._previous_state
-        deferred = self._transaction_over()
-        deferred.errback(e)
-
-    def callback(self, payload, meta):
-        deferred = self._transaction_over()
-        logger.debug("calling back for {}".format(deferred))
-        deferred.callback((payload, meta))
-
-    def errback(self, payload):
-        deferred = self._transaction_over()
-        logger.debug("erring back for {}".format(deferred))
-        logger.debug("with payload {}".format(payload))
-        deferred.errback(payload)
+        self.errback(request, e)
+
+    def callback(self, request, results):
+        deferreds = self._transaction_over(request)
+        for deferred, result in zip(deferreds, results):
+            logger.debug("calling back for {}".format(deferred))
+            deferred.callback(result)
+
+    def errback(self, request, payload):
+        self._forget(request)
+        deferreds = self._transaction_over(request)
+        for deferred in deferreds:
+            logger.debug("erring back for {}".format(deferred))
+            logger.debug("with payload {}".format(payload))
+            deferred.errback(payload)
 
     def cancel(self):
-        deferred = self._transaction_over()
-        deferred.cancel()
+        for request in tuple(self._in_flight.values()):
+            for deferred in self._transaction_over(request):
+                deferred.cancel()
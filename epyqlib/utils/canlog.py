@@ -1,9 +1,11 @@
-import collections
+import heapq
 import io
 import math
 import textwrap
 
 import attr
+import can
+import numpy
 
 import epyqlib.utils.general
 import epyqlib.canneo
@@ -24,7 +26,7 @@ class Log(epyqlib.canneo.QtCanListener):
     name = attr.ib()
     messages = attr.ib(default=None, hash=False)
     _active = attr.ib(default=False)
-    _messages_factory = attr.ib(default=lambda: collections.deque(maxlen=100000))
+    _messages_factory = attr.ib(default=lambda: MessageBuffer())
 
     def __attrs_post_init__(self):
         super().__init__(receiver=self._message_received)
@@ -33,7 +35,10 @@ class Log(epyqlib.canneo.QtCanListener):
 
     def _message_received(self, message):
         if self._active:
-            self.messages.append(Message.from_pythoncan(message))
+            if isinstance(self.messages, MessageBuffer):
+                self.messages.append_pythoncan(message)
+            else:
+                self.messages.append(Message.from_pythoncan(message))
 
     def start(self):
         self._active = True
@@ -82,6 +87,15 @@ class Message:
             data=bytearray(message.data),
         )
 
+    def to_pythoncan(self):
+        return can.Message(
+            timestamp=0 if self.time is None else self.time,
+            arbitration_id=self.id.value,
+            is_extended_id=self.id.extended,
+            dlc=self.length,
+            data=self.data,
+        )
+
     @property
     def ms(self):
         if self.time is None:
@@ -98,13 +112,160 @@ class Message:
 
     @property
     def data_string_spaced(self):
-        return " ".join("{:02X}".format(b) for b in self.data)
+        return data_string(self.data, separator=" ")
 
     @property
     def length(self):
         return len(self.data)
 
 
+def message_dtype(data_width=8):
+    return numpy.dtype(
+        [
+            ("time", numpy.float64),
+            ("id", numpy.uint32),
+            ("type", numpy.uint8),
+            ("extended", numpy.bool_),
+            ("length", numpy.uint8),
+            ("data", numpy.uint8, (data_width,)),
+        ]
+    )
+
+
+@attr.s(eq=False)
+class MessageBuffer:
+    """Fixed capacity ring buffer of messages stored in a preallocated NumPy
+    structured array.  Once full, the oldest messages are overwritten.
+    Iterating and indexing produce :class:`Message` objects while
+    :meth:`arrays` gives direct access to the stored rows.
+    """
+
+    capacity = attr.ib(default=1_000_000)
+    data_width = attr.ib(default=8)
+    array = attr.ib(init=False)
+    _start = attr.ib(init=False, default=0)
+    _length = attr.ib(init=False, default=0)
+
+    def __attrs_post_init__(self):
+        self.array = numpy.zeros(self.capacity, dtype=message_dtype(self.data_width))
+
+    def __len__(self):
+        return self._length
+
+    def __iter__(self):
+        for array in self.arrays():
+            for row in array:
+                yield self._message_from_row(row)
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self._length
+
+        if not 0 <= index < self._length:
+            raise IndexError("MessageBuffer index out of range")
+
+        return self._message_from_row(
+            self.array[(self._start + index) % self.capacity],
+        )
+
+    def _next_index(self):
+        index = (self._start + self._length) % self.capacity
+
+        if self._length < self.capacity:
+            self._length += 1
+        else:
+            self._start = (self._start + 1) % self.capacity
+
+        return index
+
+    def _store(self, time, type, id, extended, data):
+        length = len(data)
+        if length > self.data_width:
+            raise ValueError(
+                "Unable to store {} data bytes in a buffer {} bytes wide".format(
+                    length,
+                    self.data_width,
+                )
+            )
+
+        self.array[self._next_index()] = (
+            math.nan if time is None else time,
+            id,
+            type,
+            extended,
+            length,
+            tuple(data) + (0,) * (self.data_width - length),
+        )
+
+    def append(self, message):
+        self._store(
+            time=message.time,
+            type=message.type,
+            id=message.id.value,
+            extended=message.id.extended,
+            data=message.data,
+        )
+
+    def append_pythoncan(self, message):
+        self._store(
+            time=message.timestamp,
+            type=MessageType.Rx,
+            id=message.arbitration_id,
+            extended=message.is_extended_id,
+            data=message.data,
+        )
+
+    def clear(self):
+        self._start = 0
+        self._length = 0
+
+    def arrays(self):
+        """Views of the stored rows, oldest first.  There are two views when
+        the stored messages wrap around the end of the buffer.
+        """
+
+        end = self._start + self._length
+
+        if end <= self.capacity:
+            return [self.array[self._start : end]]
+
+        return [self.array[self._start :], self.array[: end - self.capacity]]
+
+    @staticmethod
+    def _message_from_row(row):
+        time = float(row["time"])
+
+        return Message(
+            time=None if math.isnan(time) else time,
+            type=MessageType(row["type"]),
+            id=Id(value=int(row["id"]), extended=bool(row["extended"])),
+            data=bytearray(row["data"][: row["length"]]),
+        )
+
+
+# lookup table to avoid formatting every byte individually
+hex_bytes = tuple("{:02X}".format(b) for b in range(256))
+
+default_chunk_size = 10000
+
+
+def data_string(data, separator=""):
+    return separator.join([hex_bytes[b] for b in data])
+
+
+def to_arrays(messages, chunk_size=default_chunk_size, data_width=8):
+    """Collect an iterable of messages into structured arrays of at most
+    `chunk_size` rows with the same layout as :class:`MessageBuffer` rows.
+    """
+
+    for chunk in epyqlib.utils.general.chunker(messages, chunk_size, factory=list):
+        buffer = MessageBuffer(capacity=len(chunk), data_width=data_width)
+        for message in chunk:
+            buffer.append(message)
+
+        yield buffer.array
+
+
 def to_trc_v1_1_s(messages):
     s = io.StringIO()
 
@@ -115,7 +276,7 @@ def to_trc_v1_1_s(messages):
     return s.read()
 
 
-def to_trc_v1_1(messages, f):
+def to_trc_v1_1(messages, f, chunk_size=default_chunk_size):
     header = textwrap.dedent(
         """\
         ;$FILEVERSION=1.1
@@ -134,14 +295,19 @@ def to_trc_v1_1(messages, f):
         ;   |         |        |        |     |   Data Bytes (hex) ...
         ;   |         |        |        |     |   |
         ;---+--   ----+----  --+--  ----+---  +  -+ -- -- -- -- -- -- --"""
-    ).format(start_time=0, path=f.name, start_string="", version_string="")
+    ).format(
+        start_time=0,
+        path=getattr(f, "name", ""),
+        start_string="",
+        version_string="",
+    )
 
     format = "  ".join(
         (
             "{i: 6d})",
             "{ms: 10.1f}",
             "{type:<5s}",
-            "{id:08X}",
+            "{id:>8s}",
             "{length:1d}",
             "{data}",
         )
@@ -151,20 +317,194 @@ def to_trc_v1_1(messages, f):
     for line in header.splitlines():
         f.write(line.rstrip() + "\n")
 
-    for i, message in enumerate(messages, start=1):
+    numbered = enumerate(messages, start=1)
+    for chunk in epyqlib.utils.general.chunker(numbered, chunk_size):
         f.write(
-            format.format(
-                i=i,
-                ms=message.ms,
-                type=message.type.name,
-                id=message.id.value,
-                length=message.length,
-                data=message.data_string_spaced,
+            "".join(
+                [
+                    format.format(
+                        i=i,
+                        ms=message.ms,
+                        type=message.type.name,
+                        id=format_id(message.id, width=4),
+                        length=message.length,
+                        data=data_string(message.data, separator=" "),
+                    )
+                    for i, message in chunk
+                ]
             )
         )
 
 
-def to_trc_v1_3(messages, bus):
+def to_trc_v1_3(messages, f, chunk_size=default_chunk_size):
     """`messages` should be a dict.  Keys are bus numbers and values are
-    iterables of messages"""
-    raise Exception("Not implemented")
+    iterables of messages ordered by time.  The buses are merged in time
+    order as they are written."""
+
+    header = textwrap.dedent(
+        """\
+        ;$FILEVERSION=1.3
+        ;$STARTTIME={start_time}
+        ;
+        ;   {path}
+        ;
+        ;   Start time: {start_string}
+        ;   Generated by EPyQ {version_string}
+        ;
+        ;   Message Number
+        ;   |         Time Offset (ms)
+        ;   |         |        Bus
+        ;   |         |        |    Type
+        ;   |         |        |    |       ID (hex)
+        ;   |         |        |    |       |    Reserved
+        ;   |         |        |    |       |    |   Data Length Code
+        ;   |         |        |    |       |    |   |    Data Bytes (hex) ...
+        ;   |         |        |    |       |    |   |    |
+        ;---+-- ------+------ +- --+-- ----+--- +- -+-- -+ -- -- -- -- -- -- --"""
+    ).format(
+        start_time=0,
+        path=getattr(f, "name", ""),
+        start_string="",
+        version_string="",
+    )
+
+    format = " ".join(
+        (
+            "{i: 6d})",
+            "{ms: 11.1f}",
+            "{bus:1d} ",
+            "{type:<4s}",
+            "{id:>8s}",
+            "-",
+            "{length:1d}   ",
+            "{data}",
+        )
+    )
+    format += " \n"
+
+    for line in header.splitlines():
+        f.write(line.rstrip() + "\n")
+
+    def tagged(bus, bus_messages):
+        for message in bus_messages:
+            yield message, bus
+
+    merged = heapq.merge(
+        *(tagged(bus, bus_messages) for bus, bus_messages in messages.items()),
+        key=lambda message_bus: math.inf
+        if message_bus[0].time is None
+        else message_bus[0].time,
+    )
+
+    numbered = enumerate(merged, start=1)
+    for chunk in epyqlib.utils.general.chunker(numbered, chunk_size):
+        f.write(
+            "".join(
+                [
+                    format.format(
+                        i=i,
+                        ms=message.ms,
+                        bus=bus,
+                        type=message.type.name,
+                        id=format_id(message.id, width=4),
+                        length=message.length,
+                        data=data_string(message.data, separator=" "),
+                    )
+                    for i, (message, bus) in chunk
+                ]
+            )
+        )
+
+
+def to_candump(messages, f, interface="can0", chunk_size=default_chunk_size):
+    """Write messages in the `candump -L` log file format."""
+
+    format = "({time:.6f}) {interface} {id}#{data}\n"
+
+    for chunk in epyqlib.utils.general.chunker(messages, chunk_size):
+        f.write(
+            "".join(
+                [
+                    format.format(
+                        time=0 if message.time is None else message.time,
+                        interface=interface,
+                        id=format_id(message.id, width=3),
+                        data=data_string(message.data),
+                    )
+                    for message in chunk
+                ]
+            )
+        )
+
+
+def format_id(id, width):
+    if id.extended:
+        width = 8
+
+    return "{:0{}X}".format(id.value, width)
+
+
+def from_trc(f):
+    """Yield messages from a TRC version 1.1 or 1.3 file.  Bus status
+    (`Warng`) and error frame (`Error`) lines are skipped.
+    """
+
+    version = "1.1"
+
+    for line in f:
+        if line.startswith(";"):
+            if line.startswith(";$FILEVERSION="):
+                version = line.partition("=")[2].strip()
+
+            continue
+
+        columns = line.split()
+        if len(columns) == 0:
+            continue
+
+        if version == "1.1":
+            _, milliseconds, type, id, length, *data = columns
+        elif version == "1.3":
+            _, milliseconds, _, type, id, _, length, *data = columns
+        else:
+            raise Exception("Unsupported TRC file version: {}".format(version))
+
+        if type not in {"Rx", "Tx"}:
+            continue
+
+        if data[:1] == ["RTR"]:
+            # remote request frames carry no data
+            data = []
+
+        length = int(length)
+
+        yield Message(
+            time=float(milliseconds) / 1000,
+            type=MessageType[type],
+            # standard ids are written with four digits
+            id=Id(value=int(id, 16), extended=len(id) > 4),
+            data=bytearray.fromhex("".join(data[:length])),
+        )
+
+
+def from_candump(f):
+    """Yield messages from a `candump -L` log file."""
+
+    for line in f:
+        columns = line.split()
+        if len(columns) == 0:
+            continue
+
+        time, _, frame = columns[:3]
+        id, _, data = frame.partition("#")
+
+        if data.startswith("R"):
+            # remote request frames carry no data
+            data = ""
+
+        yield Message(
+            time=float(time.strip("()")),
+            type=MessageType.Rx,
+            id=Id(value=int(id, 16), extended=len(id) > 3),
+            data=bytearray.fromhex(data),
+        )
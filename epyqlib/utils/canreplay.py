@@ -0,0 +1,284 @@
+import pathlib
+import threading
+import time
+
+import attr
+import can
+import canmatrix.formats
+import click
+import PyQt5.QtCore
+
+import epyqlib.busproxy
+import epyqlib.canneo
+import epyqlib.utils.canlog
+import epyqlib.utils.qt
+
+
+readers = {
+    ".trc": epyqlib.utils.canlog.from_trc,
+    ".log": epyqlib.utils.canlog.from_candump,
+    ".candump": epyqlib.utils.canlog.from_candump,
+}
+
+
+def read(path):
+    """Yield the messages recorded in a TRC or `candump -L` file."""
+
+    path = pathlib.Path(path)
+    reader = readers[path.suffix.casefold()]
+
+    with open(path) as f:
+        yield from reader(f)
+
+
+@attr.s(frozen=True)
+class Throughput:
+    """`messages` fed to the target and, if counted, the `frames` that were
+    passed on for decoding.  Neo's `frame_rx_interval` can drop messages so
+    the two need not match.
+    """
+
+    messages = attr.ib()
+    seconds = attr.ib()
+    frames = attr.ib(default=None)
+
+    def per_second(self, count):
+        if self.seconds == 0:
+            return float("inf")
+
+        return count / self.seconds
+
+    @property
+    def rate(self):
+        return self.per_second(self.messages)
+
+    @property
+    def frame_rate(self):
+        if self.frames is None:
+            return None
+
+        return self.per_second(self.frames)
+
+    def __str__(self):
+        text = "{} messages fed in {:.3f} s, {:.0f} messages/s".format(
+            self.messages,
+            self.seconds,
+            self.rate,
+        )
+
+        if self.frames is not None:
+            text += "\n{} frames decoded, {:.0f} frames/s".format(
+                self.frames,
+                self.frame_rate,
+            )
+
+        return text
+
+
+@attr.s
+class FrameCounter:
+    """Count the messages that a :class:`epyqlib.canneo.Neo` passes on to
+    its frames for decoding.
+    """
+
+    count = attr.ib(default=0)
+
+    @classmethod
+    def connect(cls, neo):
+        counter = cls()
+
+        for frame in neo.frames:
+            frame.message_received_signal.connect(counter.received)
+
+        return counter
+
+    def received(self, message):
+        self.count += 1
+
+
+@attr.s
+class Replay:
+    """Feed recorded :class:`epyqlib.utils.canlog.Message` objects to a
+    target as python-can messages.  A `speed` of 1 reproduces the recorded
+    timing, 10 plays ten times faster and `None` sends as fast as possible.
+
+    `run()` paces by sleeping in the calling thread.  Use `start()` or
+    `to_virtual_bus()` to keep the Qt event loop running while replaying.
+    """
+
+    messages = attr.ib()
+    speed = attr.ib(default=1)
+    clock = attr.ib(default=time.monotonic)
+    sleep = attr.ib(default=time.sleep)
+    thread = attr.ib(default=None, init=False)
+
+    finished = epyqlib.utils.qt.Signal(object)
+    failed = epyqlib.utils.qt.Signal(object)
+
+    def run(self, target):
+        count = 0
+        first_time = None
+        start = self.clock()
+
+        for message in self.messages:
+            if self.speed is not None and message.time is not None:
+                if first_time is None:
+                    first_time = message.time
+
+                delay = start + (message.time - first_time) / self.speed - self.clock()
+                if delay > 0:
+                    self.sleep(delay)
+
+            target(message.to_pythoncan())
+            count += 1
+
+        return Throughput(messages=count, seconds=self.clock() - start)
+
+    def to_bus_proxy(self, bus_proxy):
+        """Dispatch directly to the listeners of `bus_proxy` in this thread,
+        bypassing any real or virtual bus.
+        """
+
+        return self.run(target=bus_proxy.notifier.message_received)
+
+    def to_bus(self, bus):
+        """Send on a python-can bus such as a virtual bus that a
+        :class:`epyqlib.busproxy.BusProxy` is connected to.
+        """
+
+        return self.run(target=bus.send)
+
+    def start(self, target):
+        """Run in a worker thread and emit `finished` with the `Throughput`,
+        or `failed` with the exception, on this thread.  `target` is called
+        from the worker thread, such as the `send()` of a python-can bus.
+        """
+
+        # create the signal hosts in this thread so that the emissions from
+        # the worker thread are queued back to here
+        self.finished
+        self.failed
+
+        def run():
+            try:
+                throughput = self.run(target=target)
+            except Exception as e:
+                self.failed.emit(e)
+            else:
+                self.finished.emit(throughput)
+
+        self.thread = threading.Thread(
+            target=run,
+            name="{} worker".format(type(self).__name__),
+            daemon=True,
+        )
+        self.thread.start()
+
+    def to_virtual_bus(self, listeners, channel="epyqlib replay"):
+        """Send from a worker thread on a virtual bus that a
+        :class:`epyqlib.busproxy.BusProxy` receives from.  The messages reach
+        `listeners` through the python-can notifier and queued Qt signals
+        just like live traffic.  The event loop runs until they have all
+        been received, and the returned `Throughput` covers that time.
+        """
+
+        sender = can.interface.Bus(bustype="virtual", channel=channel)
+        receiver = can.interface.Bus(bustype="virtual", channel=channel)
+        bus_proxy = epyqlib.busproxy.BusProxy(bus=receiver)
+
+        loop = PyQt5.QtCore.QEventLoop()
+        results = []
+        errors = []
+        received = 0
+
+        def check():
+            if len(results) > 0 and received >= results[0].messages:
+                loop.quit()
+
+        def finished(throughput):
+            results.append(throughput)
+            check()
+
+        def failed(exception):
+            errors.append(exception)
+            loop.quit()
+
+        def message_received(message):
+            nonlocal received
+            received += 1
+            check()
+
+        counter = epyqlib.canneo.QtCanListener(receiver=message_received)
+        for listener in (*listeners, counter):
+            bus_proxy.notifier.add(listener)
+
+        self.finished.connect(finished)
+        self.failed.connect(failed)
+
+        try:
+            start = self.clock()
+            self.start(target=sender.send)
+            loop.exec()
+            end = self.clock()
+        finally:
+            self.finished.disconnect(finished)
+            self.failed.disconnect(failed)
+            # also shuts down the receiving bus
+            bus_proxy.terminate()
+            sender.shutdown()
+
+        if len(errors) > 0:
+            raise errors[0]
+
+        return attr.evolve(results[0], seconds=end - start)
+
+
+@click.command()
+@click.option(
+    "--can",
+    "can_path",
+    type=click.Path(dir_okay=False, exists=True),
+    required=True,
+    help="CAN symbol file used to decode the log",
+)
+@click.option(
+    "--log",
+    "log_path",
+    type=click.Path(dir_okay=False, exists=True),
+    required=True,
+    help="TRC or candump -L file to replay",
+)
+@click.option(
+    "--speed",
+    type=float,
+    default=None,
+    help=(
+        "Time scaling, 1 for real time.  Paced replays are sent on a virtual"
+        " bus and received as live traffic is.  As fast as possible, directly"
+        " to Neo, when omitted."
+    ),
+)
+def cli(can_path, log_path, speed):
+    """Replay a recorded log through Neo and report the decode throughput."""
+
+    application = PyQt5.QtCore.QCoreApplication.instance()
+    if application is None:
+        application = PyQt5.QtCore.QCoreApplication([])
+
+    (matrix,) = canmatrix.formats.loadp(can_path).values()
+    neo = epyqlib.canneo.Neo(matrix=matrix)
+
+    counter = FrameCounter.connect(neo=neo)
+
+    replay = Replay(messages=read(log_path), speed=speed)
+
+    if speed is None:
+        bus_proxy = epyqlib.busproxy.BusProxy()
+        bus_proxy.notifier.add(neo)
+        throughput = replay.to_bus_proxy(bus_proxy=bus_proxy)
+    else:
+        throughput = replay.to_virtual_bus(listeners=[neo])
+
+    throughput = attr.evolve(throughput, frames=counter.count)
+
+    click.echo(throughput)
@@ -88,6 +88,13 @@ def discard_cancelled(failure):
     return failure
 
 
+def unwrap_first_error(failure):
+    if issubclass(failure.type, twisted.internet.defer.FirstError):
+        return failure.value.subFailure
+
+    return failure
+
+
 def catch_expected(error):
     if issubclass(error.type, epyqlib.utils.general.ExpectedException):
         epyqlib.utils.qt.raw_exception_message_box(
@@ -31,6 +31,8 @@ class VariableSelection(QtWidgets.QWidget):
         self.ui.update_parameters_button.clicked.connect(self.update_parameters)
         self.ui.process_raw_log_button.clicked.connect(self.process_raw_log)
         self.ui.process_raw_log_button.setEnabled(False)
+        self.ui.pull_log_button.clicked.connect(self.pull_log)
+        self.ui.pull_log_button.setEnabled(False)
 
         self.ui.view.ui.tree_view.setContextMenuPolicy(Qt.CustomContextMenu)
         self.ui.view.ui.tree_view.customContextMenuRequested.connect(self.context_menu)
@@ -96,7 +98,7 @@ class VariableSelection(QtWidgets.QWidget):
             self.progress.show()
 
             d = twisted.internet.threads.deferToThread(
-                epyqlib.cmemoryparser.process_file, filename=filename
+                epyqlib.cmemoryparser.process_file_cached, filename=filename
             )
             d.addCallback(model.update_from_loaded_binary)
             d.addCallback(
@@ -104,6 +106,11 @@ class VariableSelection(QtWidgets.QWidget):
                 self.ui.process_raw_log_button.setEnabled,
                 True,
             )
+            d.addCallback(
+                epyqlib.utils.twisted.detour_result,
+                self.ui.pull_log_button.setEnabled,
+                True,
+            )
             d.addBoth(epyqlib.utils.twisted.detour_result, self.progress_cleanup)
             d.addErrback(epyqlib.utils.twisted.errbackhook)
 
@@ -121,15 +128,15 @@ class VariableSelection(QtWidgets.QWidget):
         raw_filename = epyqlib.utils.qt.file_dialog(filters, parent=self)
 
         if raw_filename is not None:
-            filters = [("CSV", ["csv"]), ("All Files", ["*"])]
-            csv_guess = str(
+            filters = epyqlib.datalogger.output_filters()
+            output_guess = str(
                 pathlib.Path(raw_filename).with_suffix("." + filters[0][1][0])
             )
-            csv_filename = epyqlib.utils.qt.file_dialog(
-                filters, save=True, parent=self, dir=csv_guess
+            output_filename = epyqlib.utils.qt.file_dialog(
+                filters, save=True, parent=self, dir=output_guess
             )
 
-            if csv_filename is not None:
+            if output_filename is not None:
                 with open(raw_filename, "rb") as f:
                     data = f.read()
 
@@ -140,10 +147,38 @@ class VariableSelection(QtWidgets.QWidget):
 
                 self.progress.show()
 
-                d = model.parse_log(data=data, csv_path=csv_filename)
+                d = model.parse_log(data=data, path=output_filename)
                 d.addBoth(epyqlib.utils.twisted.detour_result, self.progress_cleanup)
                 d.addErrback(epyqlib.utils.twisted.errbackhook)
 
+    def pull_log(self):
+        filters = [("Raw", ["raw"]), ("All Files", ["*"])]
+        raw_filename = epyqlib.utils.qt.file_dialog(filters, save=True, parent=self)
+
+        if raw_filename is None:
+            return
+
+        filters = epyqlib.datalogger.output_filters()
+        output_guess = str(
+            pathlib.Path(raw_filename).with_suffix("." + filters[0][1][0])
+        )
+        output_filename = epyqlib.utils.qt.file_dialog(
+            filters, save=True, parent=self, dir=output_guess
+        )
+
+        if output_filename is None:
+            return
+
+        model = self.nonproxy_model()
+
+        progress = epyqlib.utils.qt.Progress()
+        progress.connect(
+            progress=epyqlib.utils.qt.progress_dialog(parent=self),
+            label_text=("Pulling log...\n\n" + progress.default_progress_label),
+        )
+
+        model.pull_log(raw_path=raw_filename, path=output_filename, progress=progress)
+
     def context_menu(self, position):
         index = self.ui.view.ui.tree_view.indexAt(position)
         index = self.ui.view.ui.tree_view.model().mapToSource(index)
@@ -6,6 +6,7 @@ import attr
 import epyqlib.abstractcolumns
 import epyqlib.chunkedmemorycache as cmc
 import epyqlib.cmemoryparser
+import epyqlib.datalogger
 import epyqlib.pyqabstractitemmodel
 import epyqlib.treenode
 import epyqlib.twisted.cancalibrationprotocol as ccp
@@ -373,6 +374,15 @@ class CacheAndRawChunks:
     raw_chunks = attr.ib()
 
 
+@attr.s
+class LogFormat:
+    cache = attr.ib()
+    chunks = attr.ib()
+    variables_and_chunks = attr.ib()
+    sample_period_us = attr.ib()
+    raw_chunks = attr.ib()
+
+
 class VariableModel(epyqlib.pyqabstractitemmodel.PyQAbstractItemModel):
     binary_loaded = pyqtSignal()
 
@@ -407,6 +417,8 @@ class VariableModel(epyqlib.pyqabstractitemmodel.PyQAbstractItemModel):
         self.nvs = nvs
         self.nv_model = nv_model
         self.bus = bus
+        self.tx_id = tx_id
+        self.rx_id = rx_id
 
         self.git_hash = None
 
@@ -416,6 +428,12 @@ class VariableModel(epyqlib.pyqabstractitemmodel.PyQAbstractItemModel):
 
         self.pull_log_progress = epyqlib.utils.qt.Progress()
 
+        self.log_preview = None
+        self.log_preview_timer = QTimer(self)
+        self.log_preview_timer.setSingleShot(True)
+        self.log_preview_timer.setInterval(250)
+        self.log_preview_timer.timeout.connect(self.update_log_preview)
+
         if self.nvs is not None:
             signal = self.nvs.neo.signal_by_path("CCP", "Connect", "CommandCounter")
             self.protocol = ccp.Handler(
@@ -495,12 +513,17 @@ class VariableModel(epyqlib.pyqabstractitemmodel.PyQAbstractItemModel):
 
         logger.debug("Creating cache")
         cache = yield twisted.internet.threads.deferToThread(
-            self.create_cache, only_checked=False, subscribe=True, root=root
+            self.create_cache,
+            only_checked=False,
+            subscribe=True,
+            root=root,
+            shared=True,
         )
         logger.debug("Done creating cache")
 
         self.beginResetModel()
         self.root = root
+        self.index_root()
         self.endResetModel()
 
         self.cache = cache
@@ -526,17 +549,21 @@ class VariableModel(epyqlib.pyqabstractitemmodel.PyQAbstractItemModel):
         )
 
         logger.debug("Creating cache")
-        cache = self.create_cache(only_checked=False, subscribe=True, root=root)
+        cache = self.create_cache(
+            only_checked=False, subscribe=True, root=root, shared=True
+        )
         logger.debug("Done creating cache")
 
         self.beginResetModel()
         self.root = root
+        self.index_root()
         self.endResetModel()
 
         self.cache = cache
 
     def assign_root(self, root):
         self.root = root
+        self.index_root()
 
     def save_selection(self, filename):
         selected = []
@@ -575,6 +602,7 @@ class VariableModel(epyqlib.pyqabstractitemmodel.PyQAbstractItemModel):
         include_partially_checked=False,
         test=None,
         root=None,
+        shared=False,
     ):
         def default_test(node):
             acceptable_states = {Qt.Unchecked, Qt.PartiallyChecked, Qt.Checked}
@@ -593,7 +621,7 @@ class VariableModel(epyqlib.pyqabstractitemmodel.PyQAbstractItemModel):
         if root is None:
             root = self.root
 
-        cache = cmc.Cache(bits_per_byte=self.bits_per_byte)
+        cache = cmc.Cache(bits_per_byte=self.bits_per_byte, shared=shared)
 
         def update_parameter(node, cache):
             if node is root:
@@ -744,10 +772,7 @@ class VariableModel(epyqlib.pyqabstractitemmodel.PyQAbstractItemModel):
 
         return block_header_bytes * (self.bits_per_byte // 8)
 
-    def parse_log(self, data, csv_path):
-        data_stream = io.BytesIO(data)
-        raw_header = data_stream.read(self.block_header_length())
-
+    def log_format(self, raw_header):
         [x] = self.names["DataLogger_BlockHeader"]
         block_header_node = self.parse_block_header_into_node(
             raw_header=raw_header, bits_per_byte=self.bits_per_byte, block_header_type=x
@@ -796,15 +821,11 @@ class VariableModel(epyqlib.pyqabstractitemmodel.PyQAbstractItemModel):
                 log_hash = str(hash_node.fields.value)
 
             if not hashes_match(self.git_hash, log_hash):
-                d = twisted.internet.defer.Deferred()
-                d.errback(
-                    Exception(
-                        "Git hashes from .out ({}) and the log ({}) do not match".format(
-                            self.git_hash, log_hash
-                        )
+                raise Exception(
+                    "Git hashes from .out ({}) and the log ({}) do not match".format(
+                        self.git_hash, log_hash
                     )
                 )
-                return d
 
         [sample_period_node] = [
             n for n in block_header_node.children if n.fields.name == "samplePeriod_us"
@@ -818,17 +839,132 @@ class VariableModel(epyqlib.pyqabstractitemmodel.PyQAbstractItemModel):
 
         variables_and_chunks = {chunk.reference: chunk for chunk in cache._chunks}
 
-        d = twisted.internet.threads.deferToThread(
-            epyqlib.datalogger.parse_log,
+        return LogFormat(
             cache=cache,
             chunks=chunks,
-            csv_path=csv_path,
-            data_stream=data_stream,
             variables_and_chunks=variables_and_chunks,
             sample_period_us=sample_period_us,
             raw_chunks=raw_chunks,
         )
 
+    def parse_log(self, data, path):
+        data_stream = io.BytesIO(data)
+        raw_header = data_stream.read(self.block_header_length())
+
+        try:
+            log_format = self.log_format(raw_header=raw_header)
+        except Exception as e:
+            return twisted.internet.defer.fail(e)
+
+        d = twisted.internet.threads.deferToThread(
+            epyqlib.datalogger.parse_log,
+            path=path,
+            data_stream=data_stream,
+            **attr.asdict(log_format, recurse=False),
+        )
+
+        return d
+
+    def log_stream(self, path=None):
+        """Create a `epyqlib.datalogger.LogStream` which writes the decoded
+        log to `path`, if passed, and previews the latest values of the
+        logged variables in the value column.
+        """
+
+        preview_nodes = []
+
+        def configure(raw_header):
+            log_format = self.log_format(raw_header=raw_header)
+
+            preview_nodes.extend(
+                node
+                for node in self.root.leaves()
+                if node in log_format.variables_and_chunks
+            )
+
+            return epyqlib.datalogger.LogStreamFormat(
+                layout=epyqlib.datalogger.RecordLayout.build(
+                    raw_chunks=log_format.raw_chunks,
+                    variables_and_chunks=log_format.variables_and_chunks,
+                ),
+                sample_period_us=log_format.sample_period_us,
+            )
+
+        writer = None
+        if path is not None:
+            writer = epyqlib.datalogger.log_writer(path=path)
+
+        stream = epyqlib.datalogger.LogStream(
+            header_length=self.block_header_length(),
+            configure=configure,
+            writer=writer,
+        )
+        stream.records_decoded.connect(
+            functools.partial(self.preview_log_records, nodes=preview_nodes)
+        )
+
+        return stream
+
+    def preview_log_records(self, columns, nodes):
+        # blocks arrive far faster than anyone can read so only show the
+        # latest values a few times per second
+        self.log_preview = (columns, nodes)
+
+        if not self.log_preview_timer.isActive():
+            self.log_preview_timer.start()
+
+    def update_log_preview(self):
+        columns, nodes = self.log_preview
+        self.log_preview = None
+
+        for node in nodes:
+            values = columns[".".join(node.path())]
+            if len(values) == 0:
+                continue
+
+            node.fields.value = values[-1].item()
+            self.changed(
+                node,
+                Columns.indexes.value,
+                node,
+                Columns.indexes.value,
+                roles=[Qt.DisplayRole],
+            )
+
+    def pull_log(self, raw_path, path=None, progress=None):
+        """Pull the log from the device into `raw_path` while decoding it
+        into `path` as the blocks arrive.
+        """
+
+        logger = epyqlib.datalogger.DataLogger(
+            nvs=self.nvs,
+            bus=self.bus,
+            device=None,
+            progress=self.pull_log_progress if progress is None else progress,
+            tx_id=self.tx_id,
+            rx_id=self.rx_id,
+        )
+        stream = self.log_stream(path=path)
+
+        def close(result):
+            closed = twisted.internet.defer.maybeDeferred(stream.close)
+            # such as a decoding error or a partial record, pull_raw_log()
+            # has already reported its own failures
+            closed.addErrback(epyqlib.utils.twisted.errbackhook)
+            closed.addCallback(lambda _: result)
+
+            return closed
+
+        d = logger.pull_raw_log(path=raw_path, sinks=[stream.feed])
+        # only one of these runs so a failure to close, such as for a
+        # partial record, is not followed by a second close
+        d.addCallbacks(
+            close,
+            epyqlib.utils.twisted.detour_result,
+            errbackArgs=(stream.close,),
+            errbackKeywords={"complete": False},
+        )
+
         return d
 
     def create_log_cache(self, block_header_node):